@@ -1,6 +1,9 @@
 import streamlit as st
+from qsuite import metrics, warmup
 
 st.set_page_config(page_title="Quantum Harmonic Oscillator Suite", layout="centered")
+metrics.start_page(__file__)
+warmup.start()
 
 st.title("🔷 Quantum Harmonic Oscillator Interactive Suite")
 st.markdown("""
@@ -19,3 +22,6 @@ st.markdown("""
 st.info("왼쪽 사이드바를 이용해 원하는 페이지로 이동하세요 👈")
 
 st.caption("Developed by YongSang | Powered by Streamlit")
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+st.fragment 부분 재실행 벤치마크 — 위젯 하나를 바꿀 때 전체 재실행 vs 그 구역(fragment)만 재실행
+────────────────────────────────────────────
+• Streamlit AppTest 로 페이지를 서버 쪽에서 그대로 실행한다 (브라우저 없음)
+    전체: 위젯 값을 바꾸고 스크립트 전체 재실행 (fragment 도입 전과 같은 동작)
+    부분: 같은 변경을 그 위젯이 속한 fragment 만 다시 실행 (브라우저에서 fragment 안 위젯을 움직일 때의 동작)
+• 서버 시간: 재실행 한 번의 벽시계 시간 (repeats 번의 중앙값)
+• 전송량: 그 재실행이 브라우저로 보내는 ForwardMsg 의 직렬화 크기 합 (Plotly 그림 JSON 이 대부분)
+• 위젯 ↔ fragment 대응은 전체 실행 때 보낸 delta 의 fragment_id 에서 읽는다
+• 계산 캐시(qsuite.memo) 는 측정 전에 두 값 모두 한 번씩 실행해 채워 두므로 순수한 재실행 비용만 비교된다
+  (서버 시작 예열은 측정을 흐트리지 않도록 끈다: QSUITE_WARMUP=0)
+명령행:
+    python benchmarks/fragments.py                    # 모든 케이스
+    python benchmarks/fragments.py --filter 05 --repeats 7
+"""
+
+import argparse
+import dataclasses
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QSUITE_WARMUP", "0")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue  # noqa: E402
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner  # noqa: E402
+
+# 케이스: (페이지 번호, 위젯 종류, 라벨, 값 A, 값 B) — A ↔ B 를 번갈아 바꾼다
+CASES = [
+    ("04", "slider", "nₓ (0~4)", 1, 3),
+    ("05", "slider", "n₁ (X축 양자수)", 1, 3),
+    ("05", "slider", "상태 수", 8, 6),
+    ("05", "select_slider", "좌표 수 N", 10000, 1000),
+    ("06", "slider", "세밀 조정 (1~100)", 10, 50),
+    ("06", "slider", "초기 변위 x₀", 6.0, 4.0),
+    ("99", "slider", "J1 (자기 경질도)", 5.0, 6.0),
+    ("100", "slider", "활성화 에너지 E_a (kJ/mol)", 50.0, 80.0),
+]
+
+
+# ─────────────────────────────────────────────
+# 계측 훅: 전송 바이트, 위젯 → fragment, 부분 재실행 요청
+# ─────────────────────────────────────────────
+_sent = [0]
+_widget_fragment = {}
+_run_fragment = [None]
+
+_enqueue = ForwardMsgQueue.enqueue
+_request_rerun = LocalScriptRunner.request_rerun
+
+
+def _counting_enqueue(self, msg):
+    _sent[0] += msg.ByteSize()
+    if msg.HasField("delta") and msg.delta.fragment_id and msg.delta.HasField("new_element"):
+        element = msg.delta.new_element
+        kind = element.WhichOneof("type")
+        widget_id = getattr(getattr(element, kind), "id", None) if kind else None
+        if widget_id:
+            _widget_fragment[widget_id] = msg.delta.fragment_id
+    return _enqueue(self, msg)
+
+
+def _fragment_rerun(self, rerun_data):
+    if _run_fragment[0] is not None:
+        # AppTest 의 실행기는 생성할 때 전체 재실행 요청을 하나 넣어 두고, 거기에 합쳐진 요청은 전체 재실행이 된다
+        # → 빈 요청 큐에서 fragment 만 요청 (브라우저가 fragment 안 위젯 변경을 보낼 때와 같은 RerunData)
+        self._requests = ScriptRequests()
+        rerun_data = dataclasses.replace(rerun_data, fragment_id_queue=[_run_fragment[0]])
+    return _request_rerun(self, rerun_data)
+
+
+ForwardMsgQueue.enqueue = _counting_enqueue
+LocalScriptRunner.request_rerun = _fragment_rerun
+
+
+# ─────────────────────────────────────────────
+# 측정
+# ─────────────────────────────────────────────
+def _page(number):
+    return next((ROOT / "pages").glob(f"{number}_*.py"))
+
+
+def _widget(at, kind, label):
+    found = [w for w in getattr(at, kind) if w.label == label]
+    if not found:
+        raise ValueError(f"unknown widget: {kind} {label!r}")
+    return found[0]
+
+
+def _rerun(at, kind, label, value, fragment=False):
+    """위젯 값을 바꾸고 한 번 재실행 → (초, 전송 바이트)."""
+    widget = _widget(at, kind, label)
+    widget.set_value(value)
+    _run_fragment[0] = _widget_fragment.get(widget.id) if fragment else None
+    if fragment and _run_fragment[0] is None:
+        raise ValueError(f"widget is not inside a fragment: {label!r}")
+    _sent[0] = 0
+    t0 = time.perf_counter()
+    try:
+        at.run()
+    finally:
+        _run_fragment[0] = None
+    elapsed, sent = time.perf_counter() - t0, _sent[0]
+    if at.exception:
+        raise RuntimeError(f"{label!r}: {at.exception[0].value}")
+    return elapsed, sent
+
+
+def measure(number, kind, label, a, b, repeats=5, timeout=300):
+    at = AppTest.from_file(str(_page(number)), default_timeout=timeout).run()
+    for value in (b, a):                                   # 캐시 채우기 (두 값 모두)
+        _rerun(at, kind, label, value)
+    full, part = [], []
+    for _ in range(repeats):
+        full.append(_rerun(at, kind, label, b))
+        part.append(_rerun(at, kind, label, a, fragment=True))
+        _rerun(at, kind, label, a)                         # 부분 실행 뒤 요소 트리를 전체로 되돌림 (측정 제외)
+    median = lambda rows, i: statistics.median(r[i] for r in rows)
+    return dict(full_s=median(full, 0), fragment_s=median(part, 0),
+                full_bytes=median(full, 1), fragment_bytes=median(part, 1))
+
+
+def report(rows):
+    width = max(len(name) for name, _ in rows)
+    lines = [f"{'case':<{width}}  {'full':>9}  {'fragment':>9}  {'speedup':>7}  "
+             f"{'full KB':>8}  {'frag KB':>8}  {'payload':>7}", "-" * (width + 62)]
+    for name, r in rows:
+        lines.append(f"{name:<{width}}  {r['full_s'] * 1e3:7.1f}ms  {r['fragment_s'] * 1e3:7.1f}ms  "
+                     f"{r['full_s'] / r['fragment_s']:6.1f}×  {r['full_bytes'] / 1024:8.1f}  "
+                     f"{r['fragment_bytes'] / 1024:8.1f}  {1 - r['fragment_bytes'] / r['full_bytes']:6.0%}↓")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="st.fragment 부분 재실행 vs 전체 재실행")
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 들어간 케이스만")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    for number, kind, label, a, b in CASES:
+        name = f"{number}/{label}: {a}→{b}"
+        if args.filter not in name:
+            continue
+        rows.append((name, measure(number, kind, label, a, b, args.repeats)))
+        print(f"  {name}  done", flush=True)
+    print(report(rows))
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+수치 핫패스 마이크로 벤치마크 — 기준선(baseline.json) 대비 회귀 보고
+────────────────────────────────────────────
+• 케이스: ψₙ 평가 (n × 격자 크기, 페이지 03/06), 2D 확률밀도 격자 (페이지 04/05), 2D 중첩 프레임 (페이지 04),
+  compute_probabilities 의 n 버튼 (페이지 06), solve_qeq (N, 페이지 99), 맥스웰–볼츠만 곡선 (페이지 100),
+  비조화 (λx⁴) Fock 기저 Krylov 전개 한 주기 (페이지 01 — 비용이 dim 과 무관해야 한다)
+• 케이스마다 한 번 반복이 min_time 이상 걸리도록 호출 횟수를 정하고, repeats 번 잰 호출당 시간의 최솟값을 쓴다
+  (다른 프로세스의 간섭은 시간을 늘리기만 하므로 최솟값이 가장 재현성 있다)
+  → 지연시간(s/호출) 과 처리량(원소/s = size / 지연시간)
+• BLAS 스레드는 1 개로 고정 — 코어 수가 다른 일반 CPU 머신끼리도 비교 가능하도록
+• 보정(calibration): 케이스마다 바로 앞뒤에서 고정된 NumPy 원소별 연산 + BLAS 행렬곱 작업을 재서 (빠른 값)
+  결과에 calibration_s 로 함께 저장하고, 비교는 보정 시간으로 나눈 상대 지연끼리 한다
+  → 기준선을 기록할 때나 지금 머신이 바쁘거나 클럭이 달라도 같은 순간에 함께 느려진 만큼은 상쇄된다 (--raw 로 끔)
+• 기준선보다 threshold(기본 25 %) 넘게 느려진 케이스는 RETRIES 번까지 다시 재서 (가장 빠른 값) 그래도 느리면
+  REGRESSION 으로 표시하고 종료 코드 1 — 일시적인 부하로 인한 오탐을 줄인다
+명령행:
+    python benchmarks/run.py                          # 측정 후 baseline.json 과 비교
+    python benchmarks/run.py --save-baseline          # 현재 측정값을 기준선으로 저장
+    python benchmarks/run.py --save-baseline --runs 3 # 전체를 3 번 돌려 케이스마다 (보정 후) 가장 빠른 값을 저장
+    python benchmarks/run.py --filter qeq --threshold 0.4 --json out.json
+    python benchmarks/run.py --raw                    # 보정 없이 절대 지연시간끼리 비교
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import numpy as np  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qsuite import correspondence, fock, hermite, maxwell, oscillator2d, qeq, wavepacket  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+RETRIES = 2                       # 회귀 의심 케이스 재측정 횟수 (기준선 --runs 3 과 같은 "3 번 중 최선")
+
+
+# ─────────────────────────────────────────────
+# 케이스 정의: 이름 → (준비 함수 → 호출 대상, 원소 수)
+# ─────────────────────────────────────────────
+def _hermite(n, points):
+    x = np.linspace(-1.2, 1.2, points) * np.sqrt(2 * n + 1)
+    return lambda: hermite.hermite_function(n, x), points
+
+
+def _density_2d(n1, n2, size, gamma=None):
+    w1, w2 = (1.0, 1.0) if gamma is None else oscillator2d.effective_frequencies(gamma)
+    ax = np.linspace(-3, 3, size)
+    X, Y = np.meshgrid(ax, ax)
+    return lambda: oscillator2d.density(n1, n2, X, Y, w1, w2), size * size
+
+
+def _superposition(n_frames, size):
+    v = np.linspace(-4, 4, size)
+    basis = oscillator2d.axis_basis(4, v)
+    times = np.linspace(0, 2 * np.pi, n_frames, endpoint=False)
+    c = np.array([1.0, 1.0, 1j]) / np.sqrt(3)
+    return (lambda: wavepacket.quantize_frames(
+        oscillator2d.superposition_frames([(0, 0), (1, 0), (0, 1)], c, basis, basis, times))), n_frames * size * size
+
+
+def _probabilities(n):
+    return lambda: correspondence.densities(n), 1
+
+
+def _qeq(N):
+    rng = np.random.default_rng(0)
+    chi = rng.uniform(-1, 1, N)
+    J = rng.uniform(4, 6, N)
+    R = qeq.chain_distances(N)
+    return lambda: qeq.solve_qeq(chi, J, R, 0.0), N
+
+
+def _fock_quartic(dim, quartic=0.01, alpha=3.0):
+    H = fock.hamiltonian(dim, quartic=quartic)
+    psi = fock.coherent_state(dim, alpha)
+    return lambda: fock.propagate(H, psi, 2 * np.pi), dim
+
+
+def _maxwell(points):
+    v = np.linspace(0, 4000, points)
+    return lambda: (maxwell.speed_pdf(v, 300.0, 4.65e-26), maxwell.characteristic_speeds(300.0, 4.65e-26)), points
+
+
+def _arrhenius(points):
+    T = np.linspace(200, 1500, points)
+    Ea = 50e3 / maxwell.N_A
+    return lambda: maxwell.arrhenius_plot_data(T, Ea, 4.65e-26, 30e-20), points
+
+
+CASES = {}
+for n in (10, 100, 1000):
+    for points in (1000, 100000):
+        CASES[f"psi_n/n={n}/points={points}"] = lambda n=n, p=points: _hermite(n, p)
+CASES["psi_n/asymptotic/n=100000/points=100000"] = lambda: (
+    (lambda x: (lambda: hermite.hermite_density(100000, x), x.size))(np.linspace(-500, 500, 100000)))
+for size in (120, 180, 512):
+    CASES[f"density_2d/isotropic/n=(1,1)/grid={size}"] = lambda s=size: _density_2d(1, 1, s)
+    CASES[f"density_2d/anisotropic/n=(4,3)/grid={size}"] = lambda s=size: _density_2d(4, 3, s, gamma=1.0)
+CASES["superposition_2d/modes=3/frames=240/grid=80"] = lambda: _superposition(240, 80)
+for n in (10, 1000, 10000, 100000):
+    CASES[f"compute_probabilities/n={n}"] = lambda n=n: _probabilities(n)
+for N in (4, 100, 1000):
+    CASES[f"solve_qeq/N={N}"] = lambda N=N: _qeq(N)
+for points in (600, 1000000):
+    CASES[f"maxwell/speed_pdf/points={points}"] = lambda p=points: _maxwell(p)
+CASES["maxwell/arrhenius/points=200"] = lambda: _arrhenius(200)
+for dim in (1000, 10000):
+    CASES[f"fock_propagate/quartic=0.01/alpha=3/dim={dim}"] = lambda d=dim: _fock_quartic(d)
+
+
+def _calibration(points=100000, size=300):
+    """기계 속도의 기준 — 코드가 바뀌어도 변하지 않는 고정 작업 (원소별 초월함수 + 행렬곱)."""
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(points)
+    A = rng.standard_normal((size, size))
+    return lambda: (np.exp(-x * x) * np.cos(3 * x)).sum() + (A @ A).trace()
+
+
+# ─────────────────────────────────────────────
+# 측정
+# ─────────────────────────────────────────────
+def measure(fn, min_time=0.2, repeats=7):
+    """호출당 시간(s)의 최솟값. 첫 호출은 준비(워밍업) 겸 호출 횟수 추정에 쓴다."""
+    t0 = time.perf_counter()
+    fn()
+    first = time.perf_counter() - t0
+    number = max(1, int(min_time / max(first, 1e-7)))
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return min(samples), number
+
+
+def calibrate(min_time=0.05, repeats=5):
+    """보정 작업의 호출당 시간 (s) — 케이스 하나를 재기 직전의 기계 속도."""
+    return measure(_calibration(), min_time, repeats)[0]
+
+
+def run(names, min_time=0.2, repeats=7, progress=None):
+    results = {}
+    for name in names:
+        fn, size = CASES[name]()
+        before = calibrate()
+        latency, number = measure(fn, min_time, repeats)
+        cal = min(before, calibrate())
+        results[name] = {"latency_s": latency, "throughput": size / latency, "size": size, "number": number,
+                         "calibration_s": cal}
+        if progress is not None:
+            progress(name, results[name])
+    return results
+
+
+def machine():
+    return {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+            "processor": platform.processor() or platform.machine(), "system": platform.system()}
+
+
+def compare(results, baseline, threshold=0.25, normalize=True):
+    """
+    케이스별 (이름, 기준 지연, 현재 지연, 비율, 상태) — 상태: ok / REGRESSION / faster / new.
+    normalize=True 이고 양쪽에 calibration_s 가 있으면 비율은 보정 시간으로 나눈 지연끼리의 비.
+    """
+    rows = []
+    for name, cur in results.items():
+        ref = baseline.get("results", {}).get(name)
+        if ref is None:
+            rows.append((name, None, cur["latency_s"], None, "new"))
+            continue
+        ratio = cur["latency_s"] / ref["latency_s"]
+        if normalize and cur.get("calibration_s") and ref.get("calibration_s"):
+            ratio *= ref["calibration_s"] / cur["calibration_s"]
+        status = "REGRESSION" if ratio > 1 + threshold else "faster" if ratio < 1 / (1 + threshold) else "ok"
+        rows.append((name, ref["latency_s"], cur["latency_s"], ratio, status))
+    return rows
+
+
+def _fmt_time(s):
+    if s is None:
+        return "—"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if s >= scale:
+            return f"{s / scale:.3g} {unit}"
+    return f"{s * 1e9:.3g} ns"
+
+
+def report(rows, threshold):
+    width = max(len(r[0]) for r in rows)
+    lines = [f"{'case':<{width}}  {'baseline':>10}  {'current':>10}  {'ratio':>6}  status",
+             "-" * (width + 44)]
+    for name, ref, cur, ratio, status in rows:
+        r = f"{ratio:.2f}" if ratio is not None else "—"
+        lines.append(f"{name:<{width}}  {_fmt_time(ref):>10}  {_fmt_time(cur):>10}  {r:>6}  {status}")
+    n_bad = sum(r[4] == "REGRESSION" for r in rows)
+    lines.append(f"\n{n_bad} regression(s) beyond +{threshold:.0%} latency (= −{1 - 1 / (1 + threshold):.0%} throughput)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="qsuite 핫패스 벤치마크")
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 들어간 케이스만")
+    parser.add_argument("--threshold", type=float, default=0.25, help="허용 지연 증가율 (0.25 = 25 %%)")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--runs", type=int, default=1, help="전체 측정 반복 횟수 (케이스마다 가장 빠른 값)")
+    parser.add_argument("--raw", action="store_true", help="보정 시간으로 나누지 않고 절대 지연시간끼리 비교")
+    parser.add_argument("--json", type=Path, help="측정 결과를 JSON 으로도 저장")
+    args = parser.parse_args()
+
+    names = [n for n in CASES if args.filter in n]
+    show = lambda name, r: print(f"  {name:<48} {_fmt_time(r['latency_s']):>10}  {r['throughput']:.3g}/s"
+                                 f"  (calibration {_fmt_time(r['calibration_s'])})", flush=True)
+    cost = (lambda r: r["latency_s"]) if args.raw else (lambda r: r["latency_s"] / r["calibration_s"])
+    results = run(names, args.min_time, args.repeats, progress=show)
+    for _ in range(args.runs - 1):
+        for name, r in run(names, args.min_time, args.repeats, progress=show).items():
+            if cost(r) < cost(results[name]):
+                results[name] = r
+    payload = {"machine": machine(), "results": results}
+    if args.json:
+        args.json.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    if args.save_baseline:
+        if args.baseline.exists() and args.filter:
+            old = json.loads(args.baseline.read_text(encoding="utf-8"))
+            payload["results"] = {**old.get("results", {}), **results}
+        args.baseline.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        print(f"saved baseline → {args.baseline}")
+        raise SystemExit(0)
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --save-baseline first")
+        raise SystemExit(0)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("machine", {}).get("processor") != machine()["processor"]:
+        print("note: baseline was recorded on a different CPU — compare ratios with care")
+    ref_cal = [r["calibration_s"] for r in baseline.get("results", {}).values() if r.get("calibration_s")]
+    if args.raw or not ref_cal:
+        print("comparing raw latencies" + ("" if args.raw else " (baseline has no calibration)"))
+    else:
+        cur_cal = np.median([r["calibration_s"] for r in results.values()])
+        print(f"calibration median {_fmt_time(cur_cal)} vs baseline {_fmt_time(np.median(ref_cal))} "
+              f"— ratios below are of calibration-normalized latencies")
+    rows = compare(results, baseline, args.threshold, not args.raw)
+    for _ in range(RETRIES):
+        suspects = [r[0] for r in rows if r[4] == "REGRESSION"]
+        if not suspects:
+            break
+        print(f"re-measuring {len(suspects)} suspect case(s)", flush=True)
+        for name, r in run(suspects, args.min_time, args.repeats, progress=show).items():
+            if cost(r) < cost(results[name]):
+                results[name] = r
+        rows = compare(results, baseline, args.threshold, not args.raw)
+    print()
+    print(report(rows, args.threshold))
+    raise SystemExit(1 if any(r[4] == "REGRESSION" for r in rows) else 0)
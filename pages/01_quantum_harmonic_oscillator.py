@@ -3,6 +3,9 @@ import streamlit as st
 import logging
 from tqdm import tqdm
 import time
+import numpy as np
+import plotly.graph_objects as go
+from qsuite import fock, memo, metrics, warmup
 
 # ─────────────────────────────────────────────
 # Logging 설정
@@ -15,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="Quantum Harmonic Oscillator", layout="centered")
+metrics.start_page(__file__)
+warmup.start()
 
 st.title("🧩 Quantum Harmonic Oscillator (QHO)")
 st.caption("1단계: 슈뢰딩거 방정식의 미분방정식 형태 전개")
@@ -28,6 +33,7 @@ sections = [
     "3️⃣ 큰 y에서의 해 근사",
     "4️⃣ Hermite 방정식 도출",
     "5️⃣ 에너지 고유값과 고유함수",
+    "6️⃣ 사다리 연산자로 검증",
     "📘 전체 요약",
 ]
 
@@ -91,6 +97,59 @@ with st.expander("5️⃣ 에너지 고유값과 고유함수"):
     st.markdown("Hermite 다항식의 정의:")
     st.latex(r"H_n(y) = (-1)^n e^{y^2}\frac{d^n}{dy^n}(e^{-y^2})")
 
+# ─────────────────────────────────────────────
+@memo.shared(max_entries=8)
+def fock_spectrum(dim, k):
+    t0 = time.perf_counter()
+    E, exact, err = fock.check_spectrum(dim, k)
+    return E, exact, err, time.perf_counter() - t0
+
+
+@memo.shared(max_entries=32)
+def driven_response(F0, Omega, quartic, t_max=40.0, steps=200):
+    # 기저 크기: 고전 진폭 x_m 의 결맞음 상태 (⟨n⟩ ≈ x_m²/2) 를 담을 만큼.
+    # λ > 0 이면 진동수 이동이 공명을 막아 진폭이 더 작으므로 같은 기저로 충분하다
+    x_m = np.abs(fock.driven_classical(np.linspace(0, t_max, 2000), F0, Omega)).max()
+    dim = int(0.5 * x_m**2 + 6 * x_m + 40)
+    X = fock.position(dim)
+    H0 = fock.hamiltonian(dim, quartic=quartic)
+    t0 = time.perf_counter()
+    ts, xs = [], []
+    for t, psi in fock.evolve_driven(H0, -X, fock.fock_state(dim, 0), lambda t_: F0 * np.cos(Omega * t_), t_max, steps):
+        ts.append(t)
+        xs.append(fock.expect(X, psi))
+    return np.array(ts), np.array(xs), dim, time.perf_counter() - t0
+
+
+with st.expander("6️⃣ 사다리 연산자로 검증"):
+    st.markdown("Hermite 급수 대신 사다리 연산자로도 같은 결과를 얻을 수 있습니다:")
+    st.latex(r"a|n\rangle = \sqrt{n}\,|n-1\rangle,\quad "
+             r"x = \sqrt{\frac{\hbar}{2m\omega}}(a + a^\dagger),\quad "
+             r"p = i\sqrt{\frac{\hbar m\omega}{2}}(a^\dagger - a)")
+    st.markdown("수 기저 |0⟩ … |N−1⟩ 에서 x, p 는 3중대각 희소 행렬이므로, "
+                "H = p²/2m + ½mω²x² 를 행렬로 조립해 가장 낮은 준위를 구하면 (ħ = m = ω = 1):")
+    dim = st.select_slider("기저 크기 N", options=[100, 1000, 10000, 100000], value=1000)
+    E_f, E_exact, err_f, t_f = fock_spectrum(dim, 10)
+    st.table({"n": np.arange(len(E_f)), "행렬 고유값": E_f, "(n+½)ħω": E_exact})
+    st.caption(f"최대 상대오차 {err_f:.1e} — N = {dim:,} 에서 {t_f * 1e3:.0f} ms")
+
+    st.markdown("구동력 −F₀cos(Ωt)·x 를 더해 |0⟩ 에서 시간 전개하면, 조화진동자에서는 ⟨x⟩ 가 "
+                "고전 운동방정식의 해와 정확히 같습니다 (에렌페스트 정리). λx⁴ 항을 켜면 어긋납니다.")
+    c1, c2, c3 = st.columns(3)
+    F0 = c1.slider("F₀", 0.1, 1.0, 0.3)
+    Omega = c2.slider("Ω / ω", 0.5, 1.5, 0.9)
+    quartic = c3.slider("비조화 λ", 0.0, 0.02, 0.0, step=0.005, format="%.3f")
+    ts, xs, dim_d, t_d = driven_response(F0, Omega, quartic)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=ts, y=xs, mode="lines", name="⟨x⟩ 양자 (Krylov 전개)"))
+    fig.add_trace(go.Scatter(x=ts, y=fock.driven_classical(ts, F0, Omega), mode="lines",
+                             line=dict(dash="dot"), name="고전 해 (λ = 0)"))
+    fig.update_layout(xaxis_title="t (1/ω)", yaxis_title="⟨x⟩", template="plotly_white",
+                      margin=dict(l=10, r=10, b=10, t=40), legend=dict(x=0.02, y=0.98))
+    with metrics.timed("render:driven"):
+        st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"기저 {dim_d} 상태, 200 단계 — {t_d:.2f} s")
+
 # ─────────────────────────────────────────────
 with st.expander("📘 전체 요약"):
     st.table(
@@ -112,3 +171,5 @@ with st.expander("📘 전체 요약"):
         }
     )
 
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -4,6 +4,8 @@ import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
+import time
+from qsuite import memo, metrics, series, shooting, warmup
 
 # ─────────────────────────────────────────────
 # 기본 설정
@@ -11,6 +13,8 @@ plt.rcParams["font.family"] = "Malgun Gothic"
 plt.rcParams["axes.unicode_minus"] = False
 matplotlib.rcParams["figure.dpi"] = 150
 st.set_page_config(page_title="Hermite Series Expansion", layout="centered")
+metrics.start_page(__file__)
+warmup.start()
 
 # ─────────────────────────────────────────────
 st.title("🎓 Hermite 미분방정식의 급수해 전개 (6차까지 상세 계산 및 시각화)")
@@ -120,9 +124,7 @@ st.info("이 조건은 다항식이 특정 차수(n)에서 멈추게 하는 '양
 st.header("3️⃣ 실제 계수 계산 및 급수 구조 확인")
 
 lam_val = 6  # λ = 6 ⇒ n = 3
-a_vals = {0: 1}
-for m in range(0, 6, 2):
-    a_vals[m+2] = (2*m - lam_val)/((m+1)*(m+2)) * a_vals[m]
+a_vals = series.coefficients(lam_val, order=6, parity=0)
 
 st.markdown("짝수항 계산 결과 (λ=6):")
 st.table([[f"a_{k}", round(float(v), 6)] for k, v in a_vals.items()])
@@ -157,9 +159,15 @@ $$
 """)
 
 # ─────────────────────────────────────────────
-y = sp.Symbol("y", real=True)
-H = [sp.hermite(n, y) for n in range(7)]
+@memo.shared(max_entries=2)
+def hermite_curves(n_count, ys):
+    # sympy 다항식 → lambdify 는 모든 세션이 한 번만
+    y = sp.Symbol("y", real=True)
+    return np.array([np.vectorize(sp.lambdify(y, sp.hermite(n, y), modules=["numpy"]))(ys) for n in range(n_count)])
+
+
 ys = np.linspace(-2, 3, 400)
+H_curves = hermite_curves(7, ys)
 
 fig, ax = plt.subplots(figsize=(8, 5), facecolor="#fafafa")
 colors = plt.cm.tab10(np.linspace(0, 1, 7))
@@ -169,9 +177,7 @@ ax.axhline(0, color="black", linewidth=1.8, linestyle="-", alpha=0.9)
 ax.axvline(0, color="black", linewidth=1.8, linestyle="-", alpha=0.9)
 
 for n, c in zip(range(7), colors):
-    f_raw = sp.lambdify(y, H[n], modules=["numpy"])
-    yv = np.vectorize(f_raw)(ys)
-    ax.plot(ys, yv, color=c, lw=2, label=fr"$H_{n}(y)$")
+    ax.plot(ys, H_curves[n], color=c, lw=2, label=fr"$H_{n}(y)$")
 
 # 시각화 세부 설정
 ax.set_ylim(-55, 55)
@@ -202,7 +208,8 @@ leg = ax.legend(
 leg.get_frame().set_alpha(0.85)
 leg.get_frame().set_linewidth(0.8)
 
-st.pyplot(fig)
+with metrics.timed("render:hermite"):
+    st.pyplot(fig)
 
 # ─────────────────────────────────────────────
 st.header("5️⃣ Hermite 급수의 물리적 의미 — 양자화와 에너지 준위의 등장")
@@ -228,3 +235,172 @@ E = \left(n + \frac{1}{2}\right)\hbar\omega
 바로 물리적 양자화로 연결되는 것이다.
 """)
 
+
+# ─────────────────────────────────────────────
+st.header("6️⃣ 임의의 λ 에서의 급수 — 절단과 발산을 직접 확인하기")
+
+st.markdown(r"""
+위에서는 \(\lambda = 2n\) 일 때만 급수가 끝난다고 말로 설명했다.  
+여기서는 재귀식을 **차수 10⁴ 까지** 실제로 전개해 (계수는 로그 스케일로 보관해 overflow를 피함)  
+임의의 λ 에 대한 부분합 \(H_M(y) = \sum_{m \le M} a_m y^m\) 과 \(\psi_M(y) = H_M(y)e^{-y^2/2}\) 를 그린다.
+
+- λ = 2n (짝/홀 일치) → 계수가 \(a_{n+2}=0\) 에서 끊겨 \(\psi\) 가 큰 y 에서 0으로 감쇠  
+- 그 외의 λ → \(a_{m+2}/a_m \to 2/m\) 이므로 급수는 \(e^{y^2}\) 처럼 자라고, \(\psi \sim e^{+y^2/2}\) 로 발산
+""")
+
+
+@memo.shared(max_entries=32)
+def series_curves(lams, parity, orders, y_max):
+    ys = np.linspace(0, y_max, 1200)
+    curves = {M: series.log_wavefunction(np.array(lams), ys, M, parity)[0] for M in orders}
+    return ys, curves
+
+
+col_l, col_p, col_y = st.columns(3)
+lam_user = col_l.number_input("λ 값", min_value=0.0, max_value=60.0, value=6.5, step=0.1)
+parity = col_p.radio("급수", [0, 1], horizontal=True, format_func=lambda p: "짝수항" if p == 0 else "홀수항")
+y_max = col_y.slider("y 범위", 3.0, 40.0, 12.0, 1.0)
+order_max = st.select_slider("최고 차수 M", options=[20, 50, 100, 200, 500, 1000, 2000, 5000, 10000], value=2000)
+
+n_near = 2 * int(round((lam_user / 2 - parity) / 2)) + parity
+lam_q = float(2 * max(n_near, parity))
+term = series.terminating_order(lam_user, parity)
+st.caption(f"가장 가까운 양자화 값: λ = {lam_q:g} (n = {int(lam_q // 2)})  ·  "
+           + (f"입력한 λ 는 {term}차에서 종료되는 다항식" if term is not None else "입력한 λ 는 종료되지 않는 무한급수"))
+
+orders = tuple(sorted({M for M in (10, 50, 200, 1000) if M < order_max} | {order_max}))
+ys_ser, curves = series_curves((lam_user, lam_q), parity, orders, y_max)
+
+fig3, (ax3a, ax3b) = plt.subplots(1, 2, figsize=(12, 4.5), facecolor="#fafafa")
+cmap_ser = plt.cm.viridis(np.linspace(0, 0.9, len(orders)))
+for M, c in zip(orders, cmap_ser):
+    ax3a.plot(ys_ser, curves[M][0], color=c, lw=1.8, label=f"M = {M}")
+ax3a.plot(ys_ser, 0.5 * ys_ser**2, color="red", ls="--", lw=1.2, label=r"$+y^2/2$ ($e^{y^2/2}$ 발산)")
+ax3a.set_title(fr"절단 차수에 따른 $\ln|\psi_M(y)|$ (λ = {lam_user:g})", fontsize=12)
+ax3a.set_xlabel("y")
+ax3a.set_ylabel(r"$\ln|\psi_M(y)|$")
+ax3a.legend(fontsize=8)
+ax3a.grid(True, linestyle="--", alpha=0.4)
+
+ax3b.plot(ys_ser, curves[order_max][0], color="crimson", lw=2, label=fr"λ = {lam_user:g}")
+ax3b.plot(ys_ser, curves[order_max][1], color="navy", lw=2, label=fr"λ = {lam_q:g} (양자화)")
+ax3b.plot(ys_ser, 0.5 * ys_ser**2, color="gray", ls="--", lw=1.2, label=r"$+y^2/2$")
+ax3b.set_title(fr"비양자화 λ vs 양자화 λ (M = {order_max})", fontsize=12)
+ax3b.set_xlabel("y")
+ax3b.legend(fontsize=8)
+ax3b.grid(True, linestyle="--", alpha=0.4)
+with metrics.timed("render:series"):
+    st.pyplot(fig3)
+
+st.info("λ 를 2n 에서 조금만 벗어나게 해도, 충분히 큰 y 에서는 결국 e^{y²/2} 직선을 따라 발산한다. "
+        "차수 M 을 키울수록 발산이 시작되는 y 가 뒤로 밀리는 것이 절단의 효과다.")
+
+
+# ─────────────────────────────────────────────
+st.header("7️⃣ 수치적 양자화 — Numerov 슈팅법")
+
+st.markdown(r"""
+급수 대신 미분방정식 \(\psi'' + (\alpha - y^2)\psi = 0\) 을 **수치 적분**해도 같은 결론에 도달한다.  
+왼쪽 금지영역의 감쇠해에서 출발해 오른쪽 끝까지 Numerov 법으로 적분하면, 꼬리 \(\psi(y_{max})\) 는
+대부분의 α 에서 \(\pm\infty\) 로 발산하고, **α 가 고유값을 지날 때마다 부호가 뒤집힌다.**
+
+- 시험 α 수백 개를 한 번의 적분 루프로 동시에 계산 (열 하나 = α 하나)
+- 마디 수 \(N(\alpha) \le k\) 판정으로 모든 준위를 동시에 고립 → 꼬리 부호로 구간을 좁혀 수렴
+- 조화진동자에서는 \(\alpha_n = 2n + 1\) (즉 λ = α − 1 = 2n) 이 수치적으로 재현된다
+- 같은 솔버가 임의의 퍼텐셜 W(y) 에도 그대로 동작
+""")
+
+POTENTIAL_LABELS = {
+    "harmonic": "조화진동자  W = y²",
+    "anharmonic": "비조화  W = y² + 0.1 y⁴",
+    "quartic": "사차  W = y⁴",
+    "double_well": "이중우물  W = (y² − 9)² / 9",
+    "morse": "Morse  W = 50(1 − e^{−0.3y})²",
+}
+
+
+@memo.shared(max_entries=16)
+def shooting_levels(name, n_levels):
+    t0 = time.perf_counter()
+    alphas, ys = shooting.find_levels(n_levels, W=shooting.POTENTIALS[name])
+    return alphas, ys, time.perf_counter() - t0
+
+
+@memo.shared(max_entries=64)
+def shooting_tails(name, alpha_k, ys, delta):
+    W = shooting.POTENTIALS[name]
+    trial = np.array([alpha_k - delta, alpha_k, alpha_k + delta])
+    psi = shooting.numerov(trial, ys, W, keep=True)[3]
+    return psi / np.abs(psi[: np.searchsorted(ys, 0.0)]).max(axis=0)
+
+
+col_pot, col_n = st.columns(2)
+pot_name = col_pot.selectbox("퍼텐셜", list(POTENTIAL_LABELS), format_func=POTENTIAL_LABELS.get)
+n_bound = shooting.bound_count(pot_name)
+if n_bound is None:
+    n_levels = col_n.slider("찾을 준위 수", 5, 200, 100, 5)
+else:
+    # Morse 의 속박 상태는 유한 개 — 더 구하면 유한 격자에 갇힌 (해리 한계 위의) 가짜 준위가 나온다
+    n_levels = col_n.slider("찾을 준위 수 (속박 상태 전부)", 5, n_bound, n_bound)
+
+with st.spinner("Numerov 적분 중..."):
+    alphas, ys_sh, elapsed = shooting_levels(pot_name, n_levels)
+st.caption(f"{n_levels}개 준위 · 격자 {len(ys_sh):,}점 · {elapsed:.2f} s (첫 계산 기준, 이후 캐시)")
+
+ns = np.arange(n_levels)
+fig4, (ax4a, ax4b) = plt.subplots(1, 2, figsize=(12, 4.5), facecolor="#fafafa")
+ax4a.plot(ns, alphas, "o", ms=3.5, color="navy", label=r"Numerov $\alpha_n$")
+if pot_name == "harmonic":
+    ax4a.plot(ns, 2 * ns + 1, color="red", lw=1.2, ls="--", label=r"$2n+1$")
+    ax4b.semilogy(ns, np.abs(alphas - (2 * ns + 1)) + 1e-16, "o-", ms=3, color="crimson")
+    ax4b.set_title(r"$|\alpha_n - (2n+1)|$", fontsize=12)
+    ax4b.set_ylabel("절대 오차")
+elif pot_name == "morse":
+    W_inf = shooting.DISSOCIATION[pot_name]
+    above = alphas >= W_inf
+    ax4a.plot(ns, shooting.morse_levels(ns), color="red", lw=1.2, ls="--", label="해석해")
+    ax4a.axhline(W_inf, color="gray", lw=1, ls=":", label=r"해리 한계 $W(\infty)$")
+    ax4a.plot(ns[above], alphas[above], "x", ms=8, color="crimson", label=r"$\alpha \geq W(\infty)$ (격자 효과)")
+    ax4b.semilogy(ns, np.abs(alphas - shooting.morse_levels(ns)) + 1e-16, "o-", ms=3, color="crimson")
+    ax4b.set_title(r"$|\alpha_n - \alpha_n^{\mathrm{Morse}}|$", fontsize=12)
+    ax4b.set_ylabel("절대 오차")
+else:
+    ax4b.plot(ns[1:], np.diff(alphas), "o-", ms=3, color="darkgreen")
+    ax4b.set_title(r"준위 간격 $\alpha_{n+1} - \alpha_n$", fontsize=12)
+ax4a.set_title(f"고유값 — {POTENTIAL_LABELS[pot_name]}", fontsize=12)
+ax4a.set_xlabel("n")
+ax4a.set_ylabel(r"$\alpha_n$")
+ax4a.legend(fontsize=9)
+ax4b.set_xlabel("n")
+for ax in (ax4a, ax4b):
+    ax.grid(True, linestyle="--", alpha=0.4)
+with metrics.timed("render:numerov"):
+    st.pyplot(fig4)
+if pot_name == "morse":
+    st.caption(f"Morse 퍼텐셜의 속박 상태는 n ≤ ⌊√D/a − ½⌋ = {n_bound - 1} 까지 {n_bound}개뿐이다. "
+               f"마지막 준위는 해리 한계 W(∞) = {W_inf:g} 바로 아래라 파동함수가 격자 끝까지 퍼지므로 "
+               f"오차가 크다" + (f" (× 표시: 수치값이 W(∞) 이상 — {int(above.sum())}개)." if above.any() else "."))
+
+st.subheader("꼬리 부호 뒤집힘 — α 를 고유값 근처에서 흔들어 보기")
+col_k, col_d = st.columns(2)
+k_sel = col_k.slider("준위 k", 0, min(n_levels, 20) - 1, 3)
+delta = col_d.select_slider("Δα", options=[1e-6, 1e-4, 1e-2, 1e-1, 0.5], value=1e-2)
+
+psi_t = shooting_tails(pot_name, float(alphas[k_sel]), ys_sh, delta)
+fig5, ax5 = plt.subplots(figsize=(10, 4.2), facecolor="#fafafa")
+for j, (lab, c) in enumerate(((f"α_k − {delta:g}", "crimson"), ("α_k", "black"), (f"α_k + {delta:g}", "royalblue"))):
+    ax5.plot(ys_sh, psi_t[:, j], color=c, lw=1.8 if j == 1 else 1.3, label=lab)
+ax5.set_ylim(-3, 3)
+ax5.set_title(fr"k = {k_sel},  α_k = {alphas[k_sel]:.8f}", fontsize=12)
+ax5.set_xlabel("y")
+ax5.set_ylabel(r"$\psi(y)$ (왼쪽 최댓값으로 정규화)")
+ax5.legend(fontsize=9)
+ax5.grid(True, linestyle="--", alpha=0.4)
+with metrics.timed("render:tail_flip"):
+    st.pyplot(fig5)
+
+st.info("고유값보다 조금 작은 α 와 조금 큰 α 는 오른쪽 끝에서 서로 반대 방향으로 발산한다. "
+        "슈팅법은 바로 이 부호 변화를 이분해 가며 고유값을 찾는다 — 급수의 절단 조건 λ = 2n 과 같은 양자화다.")
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -2,11 +2,11 @@
 # ─────────────────────────────────────────────
 import streamlit as st
 import numpy as np
-import sympy as sp
 import matplotlib.pyplot as plt
 import matplotlib
 from matplotlib.cm import get_cmap
 from matplotlib import font_manager
+from qsuite import hermite, memo, metrics, observables, precompute, schrodinger, warmup
 
 # ─────────────────────────────────────────────
 def set_font():
@@ -35,6 +35,8 @@ set_font()
 
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="Hermite Wavefunction Normalization", layout="centered")
+metrics.start_page(__file__)
+warmup.start()
 st.title("🎓 Hermite 다항식으로부터 조화진동자 파동함수 도출 및 정규화")
 st.caption("Hermite 미분방정식 → 양자화 조건 → ψₙ(y) 정규화 및 에너지 준위 시각화")
 
@@ -90,16 +92,34 @@ st.info("Hermite 다항식은 정규화되어 있지 않으며, "
         "이 상수를 곱해야 실제 확률 조건(∫|ψ|²=1)을 만족한다.")
 
 # ─────────────────────────────────────────────
-st.header("3️⃣ 정규화 검증 — 기본상태 ψ₀(y)")
+st.header("3️⃣ 정규화 검증 — Gauss–Hermite 구적으로 ∫ψₙψₘ dy = δₙₘ")
 
-y = sp.Symbol("y", real=True)
-psi0 = (1/sp.sqrt(sp.sqrt(sp.pi))) * sp.exp(-y**2/2)
-integral_check = sp.integrate(psi0**2, (y, -sp.oo, sp.oo))
+st.markdown(r"""
+ψₙψₘ 는 (다항식) × $e^{-y^2}$ 이므로, 노드 $N = n_{\max}+1$ 개의 Gauss–Hermite 구적
+$\int e^{-y^2} p(y)\,dy = \sum_i w_i\,p(y_i)$ (차수 $2N-1$ 까지 정확)으로 **모든 쌍** $n, m \le n_{\max}$ 의
+적분을 반올림 오차 수준에서 정확히 계산할 수 있다. 노드는 작은 N 에서 Golub–Welsch(3중대각 고유값),
+큰 N 에서 Airy 점근식 + Newton 보정으로 만든다.
+""")
 
-st.latex(
-    r"\int_{-\infty}^{\infty} |\psi_0(y)|^2\,dy = " + sp.latex(sp.simplify(integral_check))
-)
-st.caption("결과적으로 1이 되어, ψ₀(y)는 완벽히 정규화되어 있음을 확인할 수 있다.")
+qn_max = st.select_slider("검증할 최대 n", options=precompute.GRAM_OPTIONS, value=100)
+g00, diag_err, off_err, dev, elapsed = precompute.orthonormality_check(qn_max)
+
+st.latex(r"\int_{-\infty}^{\infty} |\psi_0(y)|^2\,dy = " + f"{g00:.15f}")
+c1, c2, c3 = st.columns(3)
+c1.metric("max |∫ψₙ² − 1|", f"{diag_err:.1e}")
+c2.metric("max |∫ψₙψₘ| (n≠m)", f"{off_err:.1e}")
+c3.metric("계산 시간", f"{elapsed * 1e3:.0f} ms", help=f"노드 {qn_max + 1}개, 쌍 {(qn_max + 1) ** 2:,}개")
+
+fig, ax = plt.subplots(figsize=(5, 4))
+im = ax.imshow(np.log10(dev + 1e-17), origin="lower", cmap="magma", vmin=-17, vmax=-12)
+ax.set_title(r"$\log_{10}|\int\psi_n\psi_m\,dy - \delta_{nm}|$", fontsize=12)
+ax.set_xlabel("m")
+ax.set_ylabel("n")
+fig.colorbar(im, ax=ax)
+with metrics.timed("render:gram"):
+    st.pyplot(fig)
+st.caption("모든 쌍에서 오차가 10⁻¹³ 이하 → ψₙ(y)는 정규화되어 있고 서로 직교한다. "
+           "명령행 회귀 검사: `python -m qsuite.quadrature`")
 
 # ─── 시각화: |ψ₀|² 확률밀도
 ys = np.linspace(-4, 4, 400)
@@ -114,22 +134,14 @@ ax.set_xlabel("y (무차원 좌표)")
 ax.set_ylabel("확률밀도")
 ax.legend()
 ax.grid(True, linestyle="--", alpha=0.5)
-st.pyplot(fig)
+with metrics.timed("render:ground_density"):
+    st.pyplot(fig)
 
 # ─────────────────────────────────────────────
 st.header("4️⃣ 정규화된 파동함수 ψₙ(y) 자동 계산 (n=0~9)")
 
-psi_exprs = []
-for n in range(10):
-    Hn = sp.hermite(n, y)
-    Nn = 1/sp.sqrt(2**n * sp.factorial(n) * sp.sqrt(sp.pi))
-    psi_n = sp.simplify(Nn * Hn * sp.exp(-y**2/2))
-    psi_exprs.append(psi_n)
-
-rows = []
-for n, psi in enumerate(psi_exprs):
-    latex_expr = sp.latex(psi).replace(r"\mathrm{e}", "e").replace(r"\left", "").replace(r"\right", "")
-    rows.append(f"| {n} | $\\psi_{{{n}}}(y)={latex_expr}$ |")
+# sympy 전개·단순화·LaTeX 변환은 모든 세션이 공유 (서버 프로세스당 한 번, 시작 시 qsuite.warmup 이 미리 계산)
+rows, psi_curves = precompute.normalized_psi_table(precompute.PSI_TABLE_COUNT)
 
 table_md = "| n | 정규화된 파동함수 ψₙ(y) |\n|:-:|:--|\n" + "\n".join(rows)
 with st.expander("정규화된 파동함수 ψₙ(y) 보기 (n=0~9)"):
@@ -164,8 +176,7 @@ cmap = get_cmap("viridis")
 scale_factor = 1.2
 
 for n in range(10):
-    f = sp.lambdify(y, psi_exprs[n], "numpy")
-    psi_y = f(ys)
+    psi_y = psi_curves[n]
     E_n = (n + 0.5) * ħ * ω
     color = cmap(n / 10)
     ax1.plot(ys, psi_y * scale_factor + E_n, color=color, lw=1.8, alpha=0.85, label=f"n={n}")
@@ -179,15 +190,15 @@ ax1.set_title("정규화된 파동함수 ψₙ(y) — 조화진동자 퍼텐셜
 ax1.grid(True, linestyle="--", alpha=0.4)
 ax1.axvline(0, color="black", lw=1)
 ax1.legend(loc="upper right", ncol=2, fontsize=8)
-st.pyplot(fig1)
+with metrics.timed("render:wavefunctions"):
+    st.pyplot(fig1)
 
 # ──────────────── [Figure 2: |ψₙ(y)|²] ────────────────
 fig2, ax2 = plt.subplots(figsize=(9, 6), facecolor="#fafafa")
 ax2.plot(ys, V, color="red", lw=2.5, label="퍼텐셜 V(y)=½y²")
 
 for n in range(10):
-    f = sp.lambdify(y, psi_exprs[n], "numpy")
-    psi_y = f(ys)
+    psi_y = psi_curves[n]
     prob = psi_y**2
     E_n = (n + 0.5) * ħ * ω
     color = cmap(n / 10)
@@ -201,7 +212,8 @@ ax2.set_ylabel("에너지 Eₙ = (n+½)ħω")
 ax2.set_title("|ψ_n(y)|² — 에너지 준위별 공간 확률 분포", fontsize=14, fontweight="bold", pad=10)
 ax2.grid(True, linestyle="--", alpha=0.4)
 ax2.axvline(0, color="black", lw=1)
-st.pyplot(fig2)
+with metrics.timed("render:densities"):
+    st.pyplot(fig2)
 
 # ─────────────────────────────────────────────
 st.markdown(r"""
@@ -218,3 +230,132 @@ st.markdown(r"""
 에너지 준위별로 파동의 공간 확률 분포를 시각적으로 보여준다.
 """)
 
+
+# ─────────────────────────────────────────────
+st.header("6️⃣ 수치 풀이 — 임의의 1차원 퍼텐셜 (희소 행렬 고유값)")
+
+st.markdown(r"""
+해석해가 있는 것은 조화진동자뿐이다. 여기서는 해밀토니안을 격자 위의 행렬로 직접 만들어 푼다 (\(\hbar = m = 1\)):
+
+$$
+H = -\frac{1}{2}\frac{d^2}{dx^2} + V(x)
+\;\longrightarrow\;
+H_{ij} = T_{ij} + V(x_i)\,\delta_{ij}
+$$
+
+- **8차 중심차분**: 띠 폭 9 의 희소 행렬 → 격자 10⁵ 점도 1초 이내
+- **sine-DVR**: 지수적으로 수렴하지만 밀집 행렬 → 수천 점까지
+- 가장 낮은 k 개 상태만 shift-invert Lanczos (`scipy.sparse.linalg.eigsh`, σ = min V) 로 구한다
+- 조화진동자 \(V = \tfrac12 x^2\) 에서는 위의 \(\psi_n\), \(E_n = (n+\tfrac12)\hbar\omega\) 와 직접 비교
+""")
+
+NUM_POTENTIALS = {
+    "harmonic": "조화진동자  V = ½x²",
+    "anharmonic": "비조화  V = ½x² + 0.1x⁴",
+    "double_well": "이중우물  V = 0.05(x² − 9)²",
+    "morse": "Morse  V = 10(1 − e^{−0.5x})²",
+}
+
+
+@memo.shared(max_entries=32)
+def numerical_states(name, method, n_points, k):
+    lo, hi = schrodinger.DOMAINS[name]
+    return schrodinger.solve(schrodinger.POTENTIALS[name], lo, hi, n_points, k=k, method=method)
+
+
+col_v, col_m = st.columns(2)
+pot_key = col_v.selectbox("퍼텐셜", list(NUM_POTENTIALS), format_func=NUM_POTENTIALS.get)
+method = col_m.radio("이산화", ["fd", "dvr"], horizontal=True,
+                     format_func=lambda m_: "8차 중심차분 (희소)" if m_ == "fd" else "sine-DVR (밀집)")
+point_options = [1000, 2000, 5000, 10000, 30000, 100000] if method == "fd" else [200, 400, 800, 1600, 3000]
+col_g, col_k = st.columns(2)
+n_points = col_g.select_slider("격자점 수", options=point_options, value=point_options[-1 if method == "fd" else 2])
+k_states = col_k.slider("상태 수 k", 4, 20, 10)
+
+with st.spinner("고유값 계산 중..."):
+    E_num, x_num, psi_num = numerical_states(pot_key, method, n_points, k_states)
+
+stride = max(1, len(x_num) // 2000)
+V_num = schrodinger.POTENTIALS[pot_key](x_num)
+fig3, ax3 = plt.subplots(figsize=(9, 6), facecolor="#fafafa")
+ax3.plot(x_num[::stride], V_num[::stride], color="red", lw=2.5, label="퍼텐셜 V(x)")
+spacing = np.diff(E_num).mean()
+for n, (E_n, psi_n) in enumerate(zip(E_num, psi_num)):
+    ax3.plot(x_num[::stride], psi_n[::stride] * spacing * 0.6 + E_n, color=cmap(n / k_states), lw=1.5)
+    ax3.axhline(E_n, color="gray", linestyle="--", lw=0.6, alpha=0.4)
+inside = V_num <= E_num[-1] + spacing
+ax3.set_xlim(x_num[inside].min() - 1, x_num[inside].max() + 1)
+ax3.set_ylim(V_num.min() - 0.5 * spacing, E_num[-1] + 1.5 * spacing)
+ax3.set_xlabel("x")
+ax3.set_ylabel("에너지")
+ax3.set_title(f"수치 고유상태 — {NUM_POTENTIALS[pot_key]}", fontsize=14, fontweight="bold", pad=10)
+ax3.grid(True, linestyle="--", alpha=0.4)
+ax3.legend(loc="upper right", fontsize=8)
+with metrics.timed("render:numeric_spectrum"):
+    st.pyplot(fig3)
+
+if pot_key == "harmonic":
+    ns = np.arange(k_states)
+    E_exact = schrodinger.harmonic_levels(ns)
+    psi_err = [np.abs(psi_num[n] - hermite.hermite_function(n, x_num)).max() for n in ns]
+    st.table({"n": ns, "E 수치": E_num, "(n+½)ħω": E_exact,
+              "|ΔE|": np.abs(E_num - E_exact), "max|ψ − ψₙ|": psi_err})
+elif pot_key == "morse":
+    ns = np.arange(k_states)
+    E_exact = schrodinger.morse_levels(ns)
+    bound = ns <= schrodinger.morse_n_max()
+    st.table({"n": ns[bound], "E 수치": E_num[bound], "해석해": E_exact[bound],
+              "|ΔE|": np.abs(E_num - E_exact)[bound]})
+    st.caption("Morse 퍼텐셜의 속박 상태는 유한 개(n ≤ ⌊2D/ħω − ½⌋) — 그 위는 상자에 갇힌 연속 상태다.")
+else:
+    st.table({"n": np.arange(k_states), "E 수치": E_num})
+
+# ─────────────────────────────────────────────
+st.header("7️⃣ 기댓값과 행렬요소 — 사다리 연산자와 구적")
+
+st.markdown(r"""
+\(y = (a + a^\dagger)/\sqrt2\), \(p_y = i(a^\dagger - a)/\sqrt2\) 이고 \(a|n\rangle = \sqrt n\,|n-1\rangle\) 이므로
+\(y^k\) 의 행렬은 대각선에서 k 칸 이내만 0 이 아닌 **희소 행렬**이다. 한 번의 희소 행렬곱으로
+모든 n 의 \(\langle y^k\rangle\), \(\langle p^k\rangle\) 가 나온다.
+다항식이 아닌 \(f(y)\) 의 \(\langle m|f(y)|n\rangle\) 는 3️⃣ 의 Gauss–Hermite 구적으로 전체 행렬을 한 번에 계산한다.
+""")
+
+
+OBSERVABLES = {
+    "y": ("y", lambda y_: y_),
+    "y2": ("y²", lambda y_: y_**2),
+    "y4": ("y⁴", lambda y_: y_**4),
+    "gauss": ("e^{−y²}", lambda y_: np.exp(-y_**2)),
+    "abs": ("|y|", np.abs),
+}
+
+
+@memo.shared(max_entries=16)
+def element_matrix(f_key, n_max):
+    return observables.matrix_elements(OBSERVABLES[f_key][1], n_max)
+
+
+col_n, col_f = st.columns(2)
+n_sel = col_n.number_input("상태 n", 0, precompute.UNCERTAINTY_N_MAX, 10)
+ns_u, y4, dy, dp, prod = precompute.uncertainty_table(precompute.UNCERTAINTY_N_MAX)
+u1, u2, u3, u4 = st.columns(4)
+u1.metric("Δy", f"{dy[n_sel]:.4f}")
+u2.metric("Δp", f"{dp[n_sel]:.4f}")
+u3.metric("Δy·Δp", f"{prod[n_sel]:.4f}", f"n+½ = {n_sel + 0.5}", delta_color="off")
+u4.metric("⟨y⁴⟩", f"{y4[n_sel]:.4g}", "¾(2n²+2n+1)", delta_color="off")
+
+f_key = col_f.selectbox("행렬요소 ⟨m|f(y)|n⟩", list(OBSERVABLES), format_func=lambda k_: OBSERVABLES[k_][0])
+elem = element_matrix(f_key, 40)
+fig4, ax4 = plt.subplots(figsize=(5, 4))
+im4 = ax4.imshow(np.log10(np.abs(elem) + 1e-16), origin="lower", cmap="viridis", vmin=-6)
+ax4.set_title(f"log₁₀|⟨m|{OBSERVABLES[f_key][0]}|n⟩|  (n, m ≤ 40)", fontsize=12)
+ax4.set_xlabel("n")
+ax4.set_ylabel("m")
+fig4.colorbar(im4, ax=ax4)
+with metrics.timed("render:matrix_elements"):
+    st.pyplot(fig4)
+st.caption("yᵏ 는 |m − n| ≤ k 이고 m − n 이 k 와 같은 홀짝인 띠에만 값이 있다 (선택 규칙). "
+           "e^{−y²}, |y| 처럼 다항식이 아닌 함수는 패리티만 보존하는 조밀한 행렬이 된다.")
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -6,14 +6,15 @@
 1~6 : 수학적 유도
 7   : 정규화
 8   : 파동함수 확률밀도(|ψ|²) 3D 시각화 (Plotly)
+9   : 고유상태 중첩의 시간 전개 |Ψ(x,y,t)|² 애니메이션 (양자화 프레임)
 """
 
 import streamlit as st
 import numpy as np
-import sympy as sp
 import plotly.graph_objects as go
 import matplotlib.font_manager as fm
 import matplotlib.pyplot as plt
+from qsuite import export, metrics, precompute, warmup, wavepacket
 
 # ─────────────────────────────────────────────
 # ✅ 한글 + LaTeX 폰트 설정
@@ -33,6 +34,8 @@ set_font()
 
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="2D 조화진동자 시각화", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
 st.title("🎓 2차원 양자 조화진동자 (2D Quantum Harmonic Oscillator)")
 st.caption("Hermite 다항식 기반 파동함수 해석 및 확률밀도 시각화")
 
@@ -92,56 +95,54 @@ st.header("8️⃣ 시각화 — |ψₙₓₙᵧ(x,y)|² 3D 확률밀도")
 m = 1.0
 ω = 1.0
 
-nx = st.slider("nₓ (0~4)", 0, 4, 1)
-ny = st.slider("nᵧ (0~4)", 0, 4, 1)
 
-# 변수 및 파동함수 계산
-x = sp.Symbol("x", real=True)
-y = sp.Symbol("y", real=True)
-
-ξx = sp.sqrt(m*ω/ħ)*x
-ξy = sp.sqrt(m*ω/ħ)*y
-
-Hx = sp.hermite(nx, ξx)
-Hy = sp.hermite(ny, ξy)
-N = sp.sqrt((m*ω/ħ)/(2**(nx+ny)*sp.factorial(nx)*sp.factorial(ny)*sp.pi))
-
-Ψ_expr = N * sp.exp(-m*ω*(x**2+y**2)/(2*ħ)) * Hx * Hy
-Ψ_func = sp.lambdify((x,y), Ψ_expr, "numpy")
-
-# Grid 생성
-X = np.linspace(-3, 3, 120)
-Y = np.linspace(-3, 3, 120)
-X, Y = np.meshgrid(X, Y)
-Z = np.abs(Ψ_func(X, Y))**2
-
-# ─────────────────────────────────────────────
-# Plotly 3D Surface
-fig = go.Figure()
-
-fig.add_trace(go.Surface(
-    x=X, y=Y, z=Z,
-    colorscale="Viridis",
-    contours={"z": {"show": True, "usecolormap": True, "highlightcolor": "limegreen"}},
-    lighting=dict(ambient=0.7, diffuse=0.7, roughness=0.3, specular=0.4),
-    opacity=0.95
-))
-
-fig.update_layout(
-    title=f"2D 조화진동자 확률밀도 |Ψₙₓₙᵧ(x,y)|² (nₓ={nx}, nᵧ={ny})",
-    scene=dict(
-        xaxis_title="x (무차원)",
-        yaxis_title="y (무차원)",
-        zaxis_title="|ψ|²",
-        xaxis=dict(showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
-        yaxis=dict(showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
-        zaxis=dict(showbackground=True, backgroundcolor="rgba(250,250,250,0.5)"),
-    ),
-    template="plotly_white",
-    margin=dict(l=10, r=10, b=10, t=40)
-)
-
-st.plotly_chart(fig, use_container_width=True)
+# 슬라이더를 움직이면 이 부분만 다시 실행 (st.fragment) — 위 수식 markdown 은 다시 그리지 않는다
+@metrics.fragment
+def density_view():
+    nx = st.slider("nₓ (0~4)", 0, precompute.QUANTUM_MAX_2D, 1)
+    ny = st.slider("nᵧ (0~4)", 0, precompute.QUANTUM_MAX_2D, 1)
+
+    # Grid 생성 — 파동함수는 qsuite.oscillator2d (정규화된 Hermite 함수의 곱), 모든 (nₓ, nᵧ) 는 서버 시작 시 예열
+    X = np.linspace(-3, 3, 120)
+    Y = np.linspace(-3, 3, 120)
+    X, Y = np.meshgrid(X, Y)
+    Z = precompute.density_grid(nx, ny, ω, ω, 3.0, 120, ħ, m)
+
+    # ─────────────────────────────────────────────
+    # Plotly 3D Surface
+    fig = go.Figure()
+
+    fig.add_trace(go.Surface(
+        x=X, y=Y, z=Z,
+        colorscale="Viridis",
+        contours={"z": {"show": True, "usecolormap": True, "highlightcolor": "limegreen"}},
+        lighting=dict(ambient=0.7, diffuse=0.7, roughness=0.3, specular=0.4),
+        opacity=0.95
+    ))
+
+    fig.update_layout(
+        title=f"2D 조화진동자 확률밀도 |Ψₙₓₙᵧ(x,y)|² (nₓ={nx}, nᵧ={ny})",
+        scene=dict(
+            xaxis_title="x (무차원)",
+            yaxis_title="y (무차원)",
+            zaxis_title="|ψ|²",
+            xaxis=dict(showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
+            yaxis=dict(showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
+            zaxis=dict(showbackground=True, backgroundcolor="rgba(250,250,250,0.5)"),
+        ),
+        template="plotly_white",
+        margin=dict(l=10, r=10, b=10, t=40)
+    )
+
+    with metrics.timed("render:density3d"):
+        st.plotly_chart(fig, use_container_width=True)
+
+    # 같은 |Ψ|² 를 더 촘촘한 격자로 — 조각 단위로 파일에 쓰고 (qsuite.export) 버튼을 누를 때 만든다
+    export.download_panel(f"04_density_n{nx}{ny}", lambda g: export.density_2d(nx, ny, ω, ω, 3.0, g, ħ, m),
+                          sizes=export.GRID_SIZES, key="export04")
+
+
+density_view()
 
 # ─────────────────────────────────────────────
 st.markdown(r"""
@@ -154,3 +155,81 @@ st.markdown(r"""
 💡 슬라이더로 \(nₓ, nᵧ\) 값을 바꿔서 모드별 파동함수 형태를 직접 관찰하세요!
 """)
 
+# ─────────────────────────────────────────────
+st.header("9️⃣ 시간 전개 — 고유상태 중첩 |Ψ(x,y,t)|²")
+
+st.markdown(r"""
+정상상태 하나의 \(|\Psi_{n_x,n_y}|^2\) 는 시간에 따라 변하지 않는다. 에너지가 다른 상태를 **중첩**하면
+$$
+\Psi(x,y,t)=\sum_k c_k\, e^{-iE_k t/\hbar}\,\psi_{n_{x,k}}(x)\,\psi_{n_{y,k}}(y)
+$$
+의 간섭 항이 \(e^{-i(E_k-E_l)t/\hbar}\) 로 진동해 확률밀도가 움직인다.
+- 축별 기저 \(\psi_0 … \psi_4\) 는 격자 위에서 **한 번만** 계산해 캐시하고, 각 프레임은 계수의 위상 회전과 행렬곱뿐
+- 프레임은 **uint8** (공통 최댓값 = 255, 1 바이트/픽셀) 또는 **float16** 으로 저장 → 수백 프레임 애니메이션도 가볍다
+- 예: \((1,0)\) 과 \((0,1)\) 을 위상차 \(\pi/2\) 로 섞으면 \((0,0)\) 과의 간섭으로 밀도가 원을 그리며 돈다
+""")
+
+MODE_OPTIONS = [(a, b) for a in range(precompute.QUANTUM_MAX_2D + 1) for b in range(precompute.QUANTUM_MAX_2D + 1)]
+
+
+@metrics.fragment
+def dynamics_view():
+    default_phase = {(n1, n2): phase for n1, n2, phase in precompute.SUPERPOSITION_DEFAULT}
+    modes = st.multiselect("중첩할 상태 (nₓ, nᵧ) — 같은 크기 계수", MODE_OPTIONS, default=list(default_phase),
+                           format_func=lambda mode: f"({mode[0]}, {mode[1]})")
+    if not modes:
+        st.info("상태를 하나 이상 고르세요.")
+        return
+    phase_cols = st.columns(min(len(modes), 6))
+    terms = tuple((n1, n2, phase_cols[i % len(phase_cols)].slider(
+                      f"위상 φ({n1},{n2}) / π", 0.0, 2.0, default_phase.get((n1, n2), 0.0), 0.25,
+                      key=f"phase_{n1}_{n2}"))
+                  for i, (n1, n2) in enumerate(modes))
+    col_f, col_g, col_d = st.columns(3)
+    n_frames = col_f.slider("프레임 수 (한 주기 2π/ω)", 60, 360, 240, 30)
+    n_grid = col_g.select_slider("격자 (N×N)", options=[64, 80, 96, 128], value=80)
+    dtype = col_d.radio("프레임 저장 형식", wavepacket.FRAME_DTYPES, horizontal=True,
+                        help="uint8: 캐시·전송 모두 1 바이트/픽셀 · float16: 캐시는 2 바이트/픽셀이지만 전송은 float32")
+
+    v, times, q, scale = precompute.superposition_frames(terms, n_frames, 1.0, 4.0, n_grid, dtype)
+    energies = [n1 + n2 + 1 for n1, n2, _ in terms]
+    st.caption(f"⟨E⟩ = {np.mean(energies):.3f} ħω · 프레임 {len(times)}개 × {n_grid}², {dtype} "
+               f"{q.nbytes / 1024:.0f} KB (float32 였다면 {q.size * 4 / 1024:.0f} KB)"
+               + (" · 모든 상태의 에너지가 같아 밀도가 변하지 않는다" if len(set(energies)) == 1 else ""))
+
+    if dtype == "uint8":                    # 1 바이트/픽셀 그대로 전송, 색 막대 눈금만 실제 밀도로
+        z = q
+        color = dict(zmin=0, zmax=255, colorbar=dict(title="|Ψ|²", tickvals=np.linspace(0, 255, 5),
+                                                     ticktext=[f"{t * scale:.3f}" for t in np.linspace(0, 255, 5)]))
+    else:                                   # 브라우저에 float16 배열이 없으므로 전송은 float32
+        z = q.astype(np.float32)
+        color = dict(zmin=0, zmax=float(z.max()), colorbar=dict(title="|Ψ|²"))
+    anim = go.Figure(
+        data=[go.Heatmap(x=v, y=v, z=z[0], colorscale="Viridis", **color)],
+        frames=[go.Frame(data=[go.Heatmap(z=z[k])], name=f"{k}") for k in range(len(times))],
+    )
+    anim.update_layout(
+        title="중첩 상태의 확률밀도 |Ψ(x,y,t)|²",
+        xaxis_title="x (무차원)", yaxis_title="y (무차원)",
+        template="plotly_white", height=620, margin=dict(l=10, r=10, t=90, b=10),
+        updatemenus=[dict(type="buttons", showactive=False, x=0.02, y=1.12, direction="left", buttons=[
+            dict(label="▶ 재생", method="animate",
+                 args=[None, dict(frame=dict(duration=40, redraw=True), transition=dict(duration=0),
+                                  fromcurrent=True, mode="immediate")]),
+            dict(label="⏸ 정지", method="animate",
+                 args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+        ])],
+        sliders=[dict(steps=[dict(method="animate", label=f"{times[k]:.2f}",
+                                  args=[[f"{k}"], dict(mode="immediate", frame=dict(duration=0, redraw=True))])
+                             for k in range(len(times))],
+                      currentvalue=dict(prefix="ωt = "), pad=dict(t=40))],
+    )
+    anim.update_yaxes(scaleanchor="x", scaleratio=1)
+    with metrics.timed("render:superposition"):
+        st.plotly_chart(anim, use_container_width=True)
+
+
+dynamics_view()
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -6,13 +6,17 @@
 • 결합항 xy → 유효 스프링상수 k₁, k₂ 생성
 • Hermite 해를 통한 정규화된 파동함수
 • Plotly 3D로 |Ψ|² 인터랙티브 시각화
+• 희소 Kronecker 합 해밀토니안으로 ω₁, ω₂ 및 비분리 퍼텐셜을 수치 검증
+• 임의의 힘상수 행렬(사슬 · 격자, 최대 10⁵ 좌표)의 정규 모드와 회전 좌표계 곱상태
 """
 
 import streamlit as st
 import numpy as np
-import sympy as sp
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from matplotlib import font_manager
+import time
+from qsuite import export, memo, metrics, normalmodes, oscillator2d, precompute, schrodinger, warmup
 
 # ─────────────────────────────────────────────
 # ✅ 한글 + LaTeX 호환 폰트 설정
@@ -32,6 +36,8 @@ set_font()
 
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="유효 스프링상수 기반 비등방 2D 조화진동자", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
 st.title("🎓 유효 스프링상수로 본 비정상 2D 양자 조화진동자 (Anisotropic 2D QHO)")
 st.caption("결합항 xy로부터 유도된 유효 스프링상수(k₁,k₂) 기반 정규화 및 |Ψ|² Plotly 시각화")
 
@@ -98,12 +104,9 @@ $$
 
 # ─────────────────────────────────────────────
 ħ, m, ω = 1.0, 1.0, 1.0
-γ = st.slider("결합강도 γ (0~2)", 0.1, 2.0, 1.0, 0.1)
+γ = st.slider("결합강도 γ (0~2)", precompute.GAMMAS[0], precompute.GAMMAS[-1], 1.0, 0.1)
 
-C1, C2 = 3/4, 1/4
-k1 = 2 * γ * m * ω**2 * C1
-k2 = 2 * γ * m * ω**2 * C2
-ω1, ω2 = np.sqrt(k1/m), np.sqrt(k2/m)
+ω1, ω2 = oscillator2d.effective_frequencies(γ, m, ω)
 
 st.latex(fr"\omega_1 = {ω1:.3f},\quad \omega_2 = {ω2:.3f}")
 st.caption("γ를 조정하면 유효 스프링상수(k₁,k₂)가 바뀌며, 진동수 비율이 달라짐")
@@ -133,59 +136,60 @@ $$
 """)
 
 # ─────────────────────────────────────────────
-col1, col2 = st.columns(2)
-with col1:
-    n1 = st.slider("n₁ (X축 양자수)", 0, 4, 1)
-with col2:
-    n2 = st.slider("n₂ (Y축 양자수)", 0, 4, 1)
-
-# ─────────────────────────────────────────────
-# Sympy로 파동함수 정의
-X, Y = sp.symbols("X Y", real=True)
-H1 = sp.hermite(n1, sp.sqrt(m*ω1/ħ)*X)
-H2 = sp.hermite(n2, sp.sqrt(m*ω2/ħ)*Y)
-N1 = (m*ω1/(np.pi*ħ))**0.25 / sp.sqrt(2**n1 * sp.factorial(n1))
-N2 = (m*ω2/(np.pi*ħ))**0.25 / sp.sqrt(2**n2 * sp.factorial(n2))
-ψ_expr = N1 * N2 * sp.exp(-m*(ω1*X**2 + ω2*Y**2)/(2*ħ)) * H1 * H2
-ψ_func = sp.lambdify((X, Y), ψ_expr, "numpy")
-
-# ─────────────────────────────────────────────
-# 격자 생성 및 확률밀도 계산
-Xv = np.linspace(-3, 3, 180)
-Yv = np.linspace(-3, 3, 180)
-Xg, Yg = np.meshgrid(Xv, Yv)
-Z = np.abs(ψ_func(Xg, Yg))**2
-
-E = (n1 + 0.5)*ħ*ω1 + (n2 + 0.5)*ħ*ω2
-
-# ─────────────────────────────────────────────
-st.header("4️⃣ Plotly 3D 확률밀도 시각화")
-
-fig = go.Figure()
-
-fig.add_trace(go.Surface(
-    x=Xg, y=Yg, z=Z,
-    colorscale="Viridis",
-    opacity=0.95,
-    lighting=dict(ambient=0.7, diffuse=0.8, specular=0.4, roughness=0.3),
-    contours={"z": {"show": True, "usecolormap": True, "highlightcolor": "limegreen"}},
-))
-
-fig.update_layout(
-    title=f"|Ψₙ₁ₙ₂(X,Y)|² : γ={γ:.2f},  E={(E):.3f} ħω,  ω₁={ω1:.3f}, ω₂={ω2:.3f}",
-    scene=dict(
-        xaxis_title="X (무차원)",
-        yaxis_title="Y (무차원)",
-        zaxis_title="|Ψ|²",
-        xaxis=dict(backgroundcolor="rgba(235,235,235,0.4)"),
-        yaxis=dict(backgroundcolor="rgba(235,235,235,0.4)"),
-        zaxis=dict(backgroundcolor="rgba(250,250,250,0.6)")
-    ),
-    template="plotly_white",
-    margin=dict(l=10, r=10, t=60, b=10),
-)
-
-st.plotly_chart(fig, use_container_width=True)
+# γ 는 2️⃣·5️⃣·6️⃣ 이 함께 쓰므로 페이지 전체를 다시 실행하고, 아래 구역들의 위젯은 자기 구역만 다시 실행한다 (st.fragment)
+@metrics.fragment
+def density_view(γ, ω1, ω2):
+    col1, col2 = st.columns(2)
+    with col1:
+        n1 = st.slider("n₁ (X축 양자수)", 0, precompute.QUANTUM_MAX_2D, 1)
+    with col2:
+        n2 = st.slider("n₂ (Y축 양자수)", 0, precompute.QUANTUM_MAX_2D, 1)
+
+    # ─────────────────────────────────────────────
+    # 격자 생성 및 확률밀도 계산 (qsuite.oscillator2d, 모든 γ·n₁·n₂ 조합은 서버 시작 시 예열)
+    Xv = np.linspace(-3, 3, 180)
+    Yv = np.linspace(-3, 3, 180)
+    Xg, Yg = np.meshgrid(Xv, Yv)
+    Z = precompute.density_grid(n1, n2, ω1, ω2, 3.0, 180, ħ, m)
+
+    E = oscillator2d.energy(n1, n2, ω1, ω2, ħ)
+
+    # ─────────────────────────────────────────────
+    st.header("4️⃣ Plotly 3D 확률밀도 시각화")
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Surface(
+        x=Xg, y=Yg, z=Z,
+        colorscale="Viridis",
+        opacity=0.95,
+        lighting=dict(ambient=0.7, diffuse=0.8, specular=0.4, roughness=0.3),
+        contours={"z": {"show": True, "usecolormap": True, "highlightcolor": "limegreen"}},
+    ))
+
+    fig.update_layout(
+        title=f"|Ψₙ₁ₙ₂(X,Y)|² : γ={γ:.2f},  E={(E):.3f} ħω,  ω₁={ω1:.3f}, ω₂={ω2:.3f}",
+        scene=dict(
+            xaxis_title="X (무차원)",
+            yaxis_title="Y (무차원)",
+            zaxis_title="|Ψ|²",
+            xaxis=dict(backgroundcolor="rgba(235,235,235,0.4)"),
+            yaxis=dict(backgroundcolor="rgba(235,235,235,0.4)"),
+            zaxis=dict(backgroundcolor="rgba(250,250,250,0.6)")
+        ),
+        template="plotly_white",
+        margin=dict(l=10, r=10, t=60, b=10),
+    )
+
+    with metrics.timed("render:density3d"):
+        st.plotly_chart(fig, use_container_width=True)
+
+    export.download_panel(f"05_density_g{γ:.2f}_n{n1}{n2}",
+                          lambda g: export.density_2d(n1, n2, ω1, ω2, 3.0, g, ħ, m),
+                          sizes=export.GRID_SIZES, key="export05")
+
+
+density_view(γ, ω1, ω2)
 
 # ─────────────────────────────────────────────
 st.markdown(r"""
@@ -199,3 +203,194 @@ st.markdown(r"""
 💡 슬라이더로 γ, n₁, n₂를 조절하며 비등방 조화진동자의 에너지 준위와 확률분포 변화를 시각적으로 탐구해보세요.
 """)
 
+
+# ─────────────────────────────────────────────
+st.header("5️⃣ 수치 검증 — Kronecker 합 2D 해밀토니안")
+
+st.markdown(r"""
+좌표변환 없이 해밀토니안을 격자 위에서 **그대로** 대각화한다:
+
+$$
+H = T_x \otimes I + I \otimes T_y + \mathrm{diag}\,V(x_i, y_j)
+$$
+
+- \(T_x, T_y\): 1차원 운동에너지 차분 행렬 → Kronecker 합은 5점 라플라시안과 같은 희소 행렬
+- 가장 낮은 상태들은 shift-invert Lanczos 로 → 512×512 격자(26만 미지수)까지
+- 교차항을 해석적으로 없앨 수 없는 \(x^2y^2\), 3차 결합 퍼텐셜도 같은 방법으로 풀린다
+
+**이차 퍼텐셜의 정확한 정규 진동수**는 힘상수 행렬 \(K = \gamma m\omega^2\begin{pmatrix}2&1\\1&2\end{pmatrix}\) 의
+고유값에서 \(\Omega = \omega\sqrt{3\gamma},\ \omega\sqrt{\gamma}\) 이다.
+위 2️⃣ 의 \(X = x+y,\ Y = x-y\) 는 길이를 보존하지 않는 변환이라 운동에너지 항이
+\(-\frac{\hbar^2}{m}(\partial_X^2 + \partial_Y^2)\) 로 2배가 되므로, 유효 질량 m/2 를 쓰면 \(\Omega_i = \sqrt{2}\,\omega_i\) 가 된다.
+아래 수치 결과로 이 차이를 직접 확인할 수 있다.
+""")
+
+COUPLED_POTENTIALS = {
+    "quadratic": "이차 결합  γ(x² + y² + xy)  (위 γ 사용)",
+    "x2y2": "비분리  ½(x² + y²) + λx²y²",
+    "cubic": "3차 결합  ½(x² + y²) + λ(x²y − y³/3)",
+}
+
+
+def coupled_potential(name, gamma_, lam):
+    if name == "quadratic":
+        return lambda X, Y: gamma_ * m * ω**2 * (X**2 + Y**2 + X * Y)
+    if name == "x2y2":
+        return lambda X, Y: 0.5 * (X**2 + Y**2) + lam * X**2 * Y**2
+    return lambda X, Y: 0.5 * (X**2 + Y**2) + lam * (X**2 * Y - Y**3 / 3)
+
+
+@memo.shared(max_entries=16)
+def coupled_states(name, gamma_, lam, n_grid, k):
+    L = 7.0
+    if name == "cubic" and lam > 0:
+        # 3차 결합은 원점에서 1/λ 거리의 안장점 너머로 아래로 무한히 내려간다 → 상자 모서리까지
+        # 탈출 에너지 1/(6λ²) 의 삼각형 등고선 안에 들도록 줄인다 (정사각형이 내접원 1/λ 의 삼각형 안: L ≤ 0.73/λ)
+        L = min(L, 0.73 / lam)
+    E_num, xs, ys, psi = schrodinger.solve_2d(coupled_potential(name, gamma_, lam), (-L, L), (-L, L),
+                                              (n_grid, n_grid), k=k)
+    stride = max(1, n_grid // 128)                      # 브라우저로는 128² 이하만 전송
+    return E_num, xs[::stride], ys[::stride], (psi[:, ::stride, ::stride] ** 2).astype(np.float32)
+
+
+@metrics.fragment
+def kronecker_view(γ, ω1, ω2):
+    col_p, col_l = st.columns(2)
+    pot2 = col_p.selectbox("퍼텐셜", list(COUPLED_POTENTIALS), format_func=COUPLED_POTENTIALS.get)
+    # 3차 결합은 λ > 0.2 이면 탈출 에너지 아래 준위가 한두 개뿐이라 λ 를 0.2 까지만
+    lam2 = col_l.slider("결합 λ", 0.0, 0.2 if pot2 == "cubic" else 0.3, 0.1, 0.01, disabled=(pot2 == "quadratic"))
+    col_g, col_k = st.columns(2)
+    n_grid = col_g.select_slider("격자 (N×N)", options=[128, 256, 384, 512], value=256)
+    k2 = col_k.slider("상태 수", 4, 12, 8)
+
+    with st.spinner(f"{n_grid}×{n_grid} 격자 고유값 계산 중..."):
+        E_num2, xs2, ys2, dens2 = coupled_states(pot2, float(γ), float(lam2), n_grid, k2)
+
+    if pot2 == "quadratic":
+        Ω = schrodinger.normal_frequencies(γ * m * ω**2 * np.array([[2.0, 1.0], [1.0, 2.0]]), m)
+        E_exact2, ns2 = schrodinger.quadratic_levels(Ω, k2, ħ)
+        E_page2, _ = schrodinger.quadratic_levels([ω2, ω1], k2, ħ)
+        ω_small = E_num2[1] - E_num2[0]                   # 첫 들뜸 = 작은 진동수
+        ω_large = 2 * E_num2[0] - ω_small                 # E₀ = (Ω₁ + Ω₂)/2
+        c1, c2, c3 = st.columns(3)
+        c1.metric("수치 Ω₂ / Ω₁", f"{ω_small:.4f} / {ω_large:.4f}")
+        c2.metric("√eig(K/m)", f"{Ω[0]:.4f} / {Ω[1]:.4f}")
+        c3.metric("2️⃣ 의 ω₂ / ω₁", f"{ω2:.4f} / {ω1:.4f}", delta=f"× {ω_small / ω2:.4f}", delta_color="off")
+        st.table({"(n₂, n₁)": [f"({a}, {b})" for a, b in ns2], "E 수치": E_num2,
+                  "Σ(n+½)ħΩ": E_exact2, "|ΔE|": np.abs(E_num2 - E_exact2), "2️⃣ 의 ω 로 계산": E_page2})
+    elif pot2 == "cubic" and lam2 > 0:
+        E_escape = 1 / (6 * lam2**2)
+        bound2 = E_num2 < E_escape
+        st.table({"상태": np.arange(k2), "E 수치": E_num2,
+                  "준위": np.where(bound2, "준속박", "탈출 에너지 위 (상자 효과)")})
+        st.caption(f"탈출 에너지 (안장점) 1/(6λ²) = {E_escape:.3f} — 그 위의 고유값은 진짜 준위가 아니라 "
+                   f"상자 벽에 갇힌 상태라 ⚠ 로 표시한다. 상자 ±{min(7.0, 0.73 / lam2):.2f} (λ 가 클수록 작아짐).")
+    else:
+        st.table({"상태": np.arange(k2), "E 수치": E_num2})
+
+    n_show = min(k2, 6)
+    flag = (E_num2 >= 1 / (6 * lam2**2)) if pot2 == "cubic" and lam2 > 0 else np.zeros(k2, bool)
+    fig2 = make_subplots(rows=2, cols=3,
+                         subplot_titles=[f"E{i} = {E_num2[i]:.4f}" + (" ⚠" if flag[i] else "") for i in range(n_show)],
+                         horizontal_spacing=0.04, vertical_spacing=0.1)
+    for i in range(n_show):
+        fig2.add_trace(go.Heatmap(x=xs2, y=ys2, z=dens2[i].T, colorscale="Viridis", showscale=False),
+                       row=i // 3 + 1, col=i % 3 + 1)
+    fig2.update_layout(height=620, template="plotly_white", margin=dict(l=10, r=10, t=40, b=10),
+                       title=f"|Ψ|² — {COUPLED_POTENTIALS[pot2]}  ({n_grid}×{n_grid})")
+    fig2.update_yaxes(scaleanchor="x", scaleratio=1)
+    with metrics.timed("render:kronecker"):
+        st.plotly_chart(fig2, use_container_width=True)
+
+
+kronecker_view(γ, ω1, ω2)
+
+# ─────────────────────────────────────────────
+st.header("6️⃣ 일반화 — 임의의 힘상수 행렬과 정규 모드")
+
+st.markdown(r"""
+2️⃣ 의 좌표변환은 \(xy\) 결합 하나에만 맞춘 것이다. 일반적으로 \(V = \tfrac12 \mathbf{x}^T K \mathbf{x}\) 이면
+
+$$
+\tilde K = M^{-1/2} K M^{-1/2} = Q\,\mathrm{diag}(\omega_i^2)\,Q^T,\qquad
+\mathbf q = Q^T M^{1/2}\mathbf x,\qquad
+\Psi_{\{n_i\}} = \prod_i \psi_{n_i}\!\left(\sqrt{\omega_i/\hbar}\; q_i\right)
+$$
+
+즉 **힘상수 행렬의 고유벡터가 회전된 좌표축**, 고유값의 제곱근이 유효 진동수다.
+사슬처럼 이웃끼리만 결합하면 \(K\) 는 삼중대각 → 가장 낮은 k 개 모드를 **O(N)** 으로 구한다.
+""")
+
+
+@metrics.fragment
+def normal_mode_view(γ):
+    K2 = γ * m * ω**2 * np.array([[2.0, 1.0], [1.0, 2.0]])
+    Ω2, Q2 = normalmodes.normal_modes(K2, m)
+    col_m1, col_m2 = st.columns(2)
+    n1 = col_m1.slider("n₁ (큰 진동수 모드)", 0, precompute.QUANTUM_MAX_2D, 1, key="n1_mode")
+    n2 = col_m2.slider("n₂ (작은 진동수 모드)", 0, precompute.QUANTUM_MAX_2D, 1, key="n2_mode")
+    xs6 = np.linspace(-4, 4, 161)
+    X6, Y6 = np.meshgrid(xs6, xs6, indexing="ij")
+    dens6 = normalmodes.product_density(np.stack([X6, Y6], -1), Ω2, Q2, [n2, n1], m, hbar=ħ)
+
+    col_a, col_b = st.columns([1, 1.4])
+    with col_a:
+        st.markdown(f"""
+    - 고유값 → **Ω = {Ω2[0]:.4f}, {Ω2[1]:.4f}** (5️⃣ 의 수치 해와 일치)
+    - 모드 벡터 (열): q₂ ∝ ({Q2[0, 0]:+.3f}, {Q2[1, 0]:+.3f}),  q₁ ∝ ({Q2[0, 1]:+.3f}, {Q2[1, 1]:+.3f})
+    - 이 (n₁, n₂) 곱상태를 원래 (x, y) 좌표에서 그린 것 → 축이 45° 회전되어 있다
+    """)
+    with col_b:
+        fig6 = go.Figure(go.Heatmap(x=xs6, y=xs6, z=dens6.T, colorscale="Viridis", colorbar=dict(title="|Ψ|²")))
+        for j, c in ((0, "white"), (1, "orange")):
+            fig6.add_trace(go.Scatter(x=[-3.5 * Q2[0, j], 3.5 * Q2[0, j]], y=[-3.5 * Q2[1, j], 3.5 * Q2[1, j]],
+                                      mode="lines", line=dict(color=c, dash="dash"), name=f"모드 축 Ω={Ω2[j]:.3f}"))
+        fig6.update_layout(height=420, template="plotly_white", margin=dict(l=10, r=10, t=30, b=10),
+                           xaxis_title="x", yaxis_title="y", legend=dict(orientation="h", y=1.08))
+        fig6.update_yaxes(scaleanchor="x", scaleratio=1)
+        with metrics.timed("render:normal_modes"):
+            st.plotly_chart(fig6, use_container_width=True)
+
+
+normal_mode_view(γ)
+
+st.subheader("용수철 사슬 — N 개 결합 진동자")
+
+
+@memo.shared(max_entries=16)
+def chain_modes(n_chain, k_modes):
+    t0 = time.perf_counter()
+    w, Q = normalmodes.normal_modes(normalmodes.chain_hessian(n_chain), k=k_modes)
+    elapsed = time.perf_counter() - t0
+    stride = max(1, n_chain // 2000)
+    return w, Q[::stride, :4], stride, elapsed
+
+
+@metrics.fragment
+def chain_view():
+    col_n, col_km = st.columns(2)
+    n_chain = col_n.select_slider("좌표 수 N", options=[10, 100, 1000, 10000, 100000], value=10000)
+    k_modes = col_km.slider("구할 모드 수 k", 4, 100, 40)
+    w_chain, Q_chain, stride_c, t_chain = chain_modes(n_chain, min(k_modes, n_chain))
+    w_exact = normalmodes.chain_frequencies(n_chain)[: len(w_chain)]
+    st.caption(f"N = {n_chain:,} · 가장 낮은 {len(w_chain)}개 모드 · {t_chain * 1e3:.0f} ms · "
+               f"해석해 대비 최대 상대오차 {np.max(np.abs(w_chain / w_exact - 1)):.1e}")
+
+    fig7 = make_subplots(rows=1, cols=2, subplot_titles=["분산 관계 ω_j", "가장 낮은 모드 모양"])
+    fig7.add_trace(go.Scatter(x=np.arange(1, len(w_chain) + 1), y=w_chain, mode="markers", name="수치"), row=1, col=1)
+    fig7.add_trace(go.Scatter(x=np.arange(1, len(w_chain) + 1), y=w_exact, mode="lines",
+                              name="2√(k/m) sin(jπ/2(N+1))", line=dict(dash="dash")), row=1, col=1)
+    sites = np.arange(0, n_chain, stride_c)
+    for j in range(Q_chain.shape[1]):
+        fig7.add_trace(go.Scatter(x=sites, y=Q_chain[:, j], mode="lines", name=f"모드 {j + 1}"), row=1, col=2)
+    fig7.update_xaxes(title_text="j", row=1, col=1)
+    fig7.update_xaxes(title_text="사이트", row=1, col=2)
+    fig7.update_layout(height=420, template="plotly_white", margin=dict(l=10, r=10, t=40, b=10))
+    with metrics.timed("render:spring_chain"):
+        st.plotly_chart(fig7, use_container_width=True)
+
+
+chain_view()
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -9,10 +9,9 @@
 
 import streamlit as st
 import numpy as np
-import math
 import plotly.graph_objects as go
-from scipy.special import eval_hermite
 from matplotlib import font_manager
+from qsuite import correspondence, export, memo, metrics, precompute, warmup, wavepacket
 
 # ─────────────────────────────────────────────
 # ✅ 한글 + LaTeX 폰트 설정
@@ -31,6 +30,8 @@ set_font()
 
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="조화진동자 대응원리", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
 st.title("⚛️ 조화진동자 & 대응원리 (Quantum–Classical Correspondence)")
 st.caption("양자 확률밀도 |ψₙ(x)|²가 고전 확률밀도 P(x)로 수렴하는 과정을 시각·이론적으로 해석")
 
@@ -38,28 +39,10 @@ st.caption("양자 확률밀도 |ψₙ(x)|²가 고전 확률밀도 P(x)로 수
 np.seterr(all="ignore")
 
 # ─────────────────────────────────────────────
-# ✅ 파동함수 계산 함수 (고속 캐시)
-@st.cache_data(show_spinner=False)
-def compute_probabilities(n, ħ, m, ω, x0):
-    xv = np.linspace(-1.2*x0, 1.2*x0, 1500)
-
-    # Classical Probability
-    P_classical = np.zeros_like(xv)
-    mask = np.abs(xv) <= x0
-    P_classical[mask] = 1 / (np.pi * np.sqrt(x0**2 - xv[mask]**2))
-    P_classical /= np.trapz(P_classical, xv)
-
-    # Quantum Probability (작은 n)
-    if n <= 500:
-        Nn = (m*ω/(np.pi*ħ))**0.25 / np.sqrt(2.0**n * math.factorial(n))
-        ψ = Nn * eval_hermite(n, np.sqrt(m*ω/ħ) * xv) * np.exp(-m*ω*xv**2 / (2*ħ))
-        ψ2 = np.abs(ψ)**2
-        ψ2 /= np.trapz(ψ2, xv)
-    else:
-        # n이 매우 클 경우 근사적으로 classical 분포로 전환
-        ψ2 = P_classical.copy()
-
-    return xv, ψ2, P_classical
+# ✅ 파동함수 계산 함수 (고속 캐시) — qsuite.precompute.compute_probabilities
+#   - 서버: WKB 국소 파장에 맞춘 비균일 격자에서 전체 해상도로 계산 (모든 노드 분해)
+#   - 브라우저: LTTB / min-max 포락선으로 줄인 수천 점만 전송
+#   - 큰 n 버튼의 결과는 서버 시작 시 qsuite.warmup 이 미리 계산해 둔다
 
 # ─────────────────────────────────────────────
 # 수식 표시
@@ -88,66 +71,221 @@ $$
 """)
 
 # ─────────────────────────────────────────────
-st.markdown("### 🎚️ 양자수 조절")
-col_slider, col_buttons = st.columns([3, 2])
-
-with col_slider:
-    n = st.slider("세밀 조정 (1~100)", 1, 100, 10)
-with col_buttons:
-    st.write("**큰 n 선택 (극한 근사)**")
-    c1, c2, c3 = st.columns(3)
-    if c1.button("n = 1000"):
-        n = 1000
-    if c2.button("n = 10000"):
-        n = 10000
-    if c3.button("n = 100000"):
-        n = 100000
-
-# 고전 진폭 (x₀)
-x0 = np.sqrt(2*(n+0.5)*ħ/(m*ω))
-st.markdown(f"현재 선택된 양자수: **n = {n}**,  고전 진폭: **x₀ = {x0:.3f}**")
-
-# 계산
-xv, ψ2, P_classical = compute_probabilities(n, ħ, m, ω, x0)
+# 위젯이 있는 구역은 st.fragment — 슬라이더·버튼을 바꾸면 그 구역만 다시 실행하고 수식·해설은 그대로 둔다
+@metrics.fragment
+def correspondence_view():
+    st.markdown("### 🎚️ 양자수 조절")
+    col_slider, col_buttons = st.columns([3, 2])
+
+    # 큰 n 버튼은 한 번의 실행에만 True 이므로 선택을 세션 상태에 남긴다 — 그래야 아래 내려받기 위젯을 바꿔
+    # 이 구역이 다시 실행되어도 n 이 슬라이더 값으로 돌아가지 않는다. 슬라이더를 움직이면 선택을 지운다
+    with col_slider:
+        n = st.slider("세밀 조정 (1~100)", 1, 100, 10, on_change=lambda: st.session_state.pop("large_n", None))
+    with col_buttons:
+        st.write("**큰 n 선택 (극한 근사)**")
+        for col, n_big in zip(st.columns(len(precompute.LARGE_N)), precompute.LARGE_N):
+            col.button(f"n = {n_big}", on_click=st.session_state.__setitem__, args=("large_n", n_big))
+    n = st.session_state.get("large_n", n)
+
+    # 고전 진폭 (x₀)
+    x0 = np.sqrt(2*(n+0.5)*ħ/(m*ω))
+    st.markdown(f"현재 선택된 양자수: **n = {n}**,  고전 진폭: **x₀ = {x0:.3f}**")
+
+    # 계산
+    xv, ψ2, P_classical = precompute.compute_probabilities(n, ħ, m, ω)
+
+    # ─────────────────────────────────────────────
+    # Plotly 그래프
+    fig = go.Figure()
+
+    # Classical 영역 강조 (±x₀)
+    fig.add_vrect(
+        x0=-x0, x1=x0,
+        fillcolor="lightgray", opacity=0.2, line_width=0,
+        annotation_text="고전적으로 허용된 영역 (±x₀)",
+        annotation_position="top left"
+    )
+
+    # Quantum
+    fig.add_trace(go.Scatter(
+        x=xv, y=ψ2, mode="lines",
+        line=dict(color="royalblue", width=3),
+        name=f"|ψₙ|² (n={n})"
+    ))
+    # Classical
+    fig.add_trace(go.Scatter(
+        x=xv, y=P_classical, mode="lines",
+        line=dict(color="red", width=3, dash="dot"),
+        name="고전확률 P(x)"
+    ))
+
+    # y축 제한 및 설정
+    fig.update_layout(
+        title=f"조화진동자 대응원리 — Quantum vs Classical (n={n})",
+        xaxis_title="x (무차원)",
+        yaxis_title="확률밀도",
+        yaxis=dict(range=[0, 0.7]),
+        template="plotly_white",
+        font=dict(size=15),
+        legend=dict(x=0.02, y=0.98),
+        margin=dict(t=60, l=20, r=20, b=40),
+    )
+
+    with metrics.timed("render:correspondence"):
+        st.plotly_chart(fig, use_container_width=True)
+
+    # 그래프는 점 수를 줄인 것 — 파일에는 WKB 격자 전체 (n = 10⁵ 이면 약 90만 점, 버튼을 누를 때 계산)
+    export.download_panel(f"06_correspondence_n{n}", lambda: export.correspondence_1d(n, ħ, m, ω), key="export06")
+
+
+    # ─── 기댓값: 양자 (사다리 연산자, 희소) vs 고전 (궤도 시간 평균)
+    avg = precompute.compute_averages(n, ħ, m, ω)
+    st.markdown("#### 📐 기댓값 — 양자 ⟨n|xᵏ|n⟩ vs 고전 시간 평균")
+    a1, a2, a3, a4 = st.columns(4)
+    a1.metric("⟨x²⟩ 양자", f"{avg['x2']:.4g}", f"고전 {avg['x2_cl']:.4g}", delta_color="off")
+    a2.metric("⟨x⁴⟩ 양자", f"{avg['x4']:.4g}",
+              f"{avg['x4'] / avg['x4_cl'] - 1:+.1e} (고전 대비)", delta_color="off")
+    a3.metric("Δx · Δp", f"{avg['prod']:.4g}", f"(n+½)ħ = {(n + 0.5) * ħ:.4g}", delta_color="off")
+    a4.metric("Δx / x₀", f"{avg['dx'] / x0:.4f}", "고전 1/√2 ≈ 0.7071", delta_color="off")
+    st.caption("⟨x²⟩ 는 모든 n 에서 고전값과 같고 (비리얼 정리), ⟨x⁴⟩ 의 상대 차이는 "
+               "1/(2n+1)² 로 줄어든다 — 밀도가 P(x) 로 수렴하는 것을 모멘트로 본 모습.")
+
+
+correspondence_view()
 
 # ─────────────────────────────────────────────
-# Plotly 그래프
-fig = go.Figure()
-
-# Classical 영역 강조 (±x₀)
-fig.add_vrect(
-    x0=-x0, x1=x0,
-    fillcolor="lightgray", opacity=0.2, line_width=0,
-    annotation_text="고전적으로 허용된 영역 (±x₀)",
-    annotation_position="top left"
-)
-
-# Quantum
-fig.add_trace(go.Scatter(
-    x=xv, y=ψ2, mode="lines",
-    line=dict(color="royalblue", width=3),
-    name=f"|ψₙ|² (n={n})"
-))
-# Classical
-fig.add_trace(go.Scatter(
-    x=xv, y=P_classical, mode="lines",
-    line=dict(color="red", width=3, dash="dot"),
-    name="고전확률 P(x)"
-))
-
-# y축 제한 및 설정
-fig.update_layout(
-    title=f"조화진동자 대응원리 — Quantum vs Classical (n={n})",
-    xaxis_title="x (무차원)",
-    yaxis_title="확률밀도",
-    yaxis=dict(range=[0, 0.7]),
-    template="plotly_white",
-    font=dict(size=15),
-    legend=dict(x=0.02, y=0.98),
-    margin=dict(t=60, l=20, r=20, b=40),
-)
-
-st.plotly_chart(fig, use_container_width=True)
+# 🎬 시간 전개 모드 — 결맞음 상태 / 가우시안 파속
+@memo.shared(max_entries=16, ttl=7200)
+def compute_wavepacket_frames(kind, x_start, width, n_frames, periods, tol):
+    L = max(1.3 * x_start, 6.0) + 4 * max(width, 1.0)
+    xv = np.linspace(-L, L, 700)
+    if kind == "coherent":
+        n_idx, c = wavepacket.coherent_coefficients(x_start / np.sqrt(2), tol)
+    else:
+        # 기저 크기는 폭에 따라 달라지는 에너지 분포에서 정한다 (넓거나 좁은 파속은 |cₙ|² 꼬리가 길다)
+        n_idx, c = wavepacket.expand_gaussian(x_start, width, tol=tol)
+    dropped = max(0.0, 1.0 - float(np.sum(np.abs(c) ** 2)))
+    times = np.linspace(0, 2 * np.pi * periods, n_frames, endpoint=False)
+    frames = wavepacket.evolve_frames(n_idx, c, xv, times)
+    x_mean = wavepacket.expectation_x(n_idx, c, times).astype(np.float32)
+    return (xv.astype(np.float32), times.astype(np.float32), frames, x_mean, (int(n_idx[0]), int(n_idx[-1])),
+            dropped)
+
+
+st.divider()
+st.header("🎬 시간 전개 모드 — 결맞음 상태의 고전적 진동")
+st.markdown(r"""
+정상상태 \(|\psi_n|^2\) 는 시간에 따라 변하지 않으므로, 진짜 고전 극한은 **여러 고유상태의 중첩**에서 나타난다.
+결맞음 상태 \(|\alpha\rangle = e^{-|\alpha|^2/2}\sum_n \frac{\alpha^n}{\sqrt{n!}}|n\rangle\) 는 모양을 유지한 채
+고전 입자처럼 \(\pm x_0\) 사이를 왕복한다. 초기 파속을 고유기저로 **한 번만** 전개하고,
+각 프레임은 계수에 위상 \(e^{-i(n+\frac12)\omega t}\) 를 곱하는 것만으로 얻는다.
+""")
+
+
+@metrics.fragment
+def wavepacket_view():
+    col_kind, col_x0, col_w = st.columns(3)
+    packet_kind = col_kind.radio("초기 상태", ["coherent", "gaussian"], horizontal=True,
+                                 format_func={"coherent": "결맞음 상태", "gaussian": "가우시안 (폭 조절)"}.get)
+    x_start = col_x0.slider("초기 변위 x₀", 0.0, 12.0, 6.0, 0.5)
+    width = col_w.slider("파속 폭 (바닥상태=1)", 0.3, 3.0, 1.0, 0.1, disabled=packet_kind == "coherent")
+
+    xv_t, times, frames, x_mean, (n_lo, n_hi), dropped = compute_wavepacket_frames(
+        packet_kind, x_start, width, n_frames=240, periods=2, tol=1e-10)
+    st.caption(f"유효 기저: n = {n_lo} … {n_hi} ({n_hi - n_lo + 1}개, 버린 확률 1 − Σ|cₙ|² = {dropped:.1e}) · "
+               f"프레임 {len(times)}개 × {len(xv_t)}점, float32 {frames.nbytes / 1024:.0f} KB")
+
+    y_max = float(frames.max()) * 1.1
+    anim = go.Figure(
+        data=[go.Scatter(x=xv_t, y=frames[0], mode="lines", line=dict(color="royalblue", width=3),
+                         name="|Ψ(x,t)|²"),
+              go.Scatter(x=[x_mean[0]], y=[0], mode="markers", marker=dict(color="red", size=14),
+                         name="⟨x⟩(t) (고전 입자)")],
+        frames=[go.Frame(data=[go.Scatter(x=xv_t, y=frames[k]), go.Scatter(x=[x_mean[k]], y=[0])],
+                         name=f"{k}") for k in range(len(times))],
+    )
+    anim.update_layout(
+        title="결맞음 상태 시간 전개 — Quantum wavepacket vs Classical particle",
+        xaxis_title="x (무차원)", yaxis_title="확률밀도",
+        xaxis=dict(range=[float(xv_t[0]), float(xv_t[-1])], fixedrange=True),
+        yaxis=dict(range=[0, y_max], fixedrange=True),
+        template="plotly_white", font=dict(size=15),
+        updatemenus=[dict(type="buttons", showactive=False, x=0.02, y=1.15, direction="left", buttons=[
+            dict(label="▶ 재생", method="animate",
+                 args=[None, dict(frame=dict(duration=40, redraw=False), transition=dict(duration=0),
+                                  fromcurrent=True, mode="immediate")]),
+            dict(label="⏸ 정지", method="animate",
+                 args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+        ])],
+        sliders=[dict(steps=[dict(method="animate", label=f"{times[k]:.2f}",
+                                  args=[[f"{k}"], dict(mode="immediate", frame=dict(duration=0, redraw=False))])
+                             for k in range(len(times))],
+                      currentvalue=dict(prefix="ωt = "), pad=dict(t=40))],
+    )
+    anim.add_vrect(x0=-x_start, x1=x_start, fillcolor="lightgray", opacity=0.2, line_width=0)
+    with metrics.timed("render:animation"):
+        st.plotly_chart(anim, use_container_width=True)
+
+
+wavepacket_view()
+
+# ─────────────────────────────────────────────
+# 📉 스윕 모드 — 모든 n 에 대한 수렴 속도 (미리 계산된 표만 읽음)
+@memo.shared(max_entries=2)
+def load_sweep_table(path, mtime):
+    return correspondence.load_table(path)
+
+
+st.divider()
+st.header("📉 스윕 모드 — n 에 따른 수렴 속도")
+st.markdown(r"""
+각 \(n\) 에 대해 \(u = x/x_0\) 좌표를 같은 폭의 구간으로 나누어 \(|\psi_n|^2\) 를 **국소평균**하고,
+고전 확률 \(P(x)\) 의 구간 확률 \(q_b\) 와의 거리를 계산한다:
+$$
+L_1(n) = \sum_b |p_b(n) - q_b|,\qquad
+\mathrm{KL}(q\,\|\,p) = \sum_b q_b \ln\frac{q_b}{p_b(n)}
+$$
+log–log 그래프의 기울기가 대응원리의 **수렴 속도** \(n^{-\beta}\) 를 준다.
+""")
+
+
+@metrics.fragment
+def sweep_view():
+    tables = correspondence.find_tables()
+    if not tables:
+        st.info("저장된 스윕 표가 없습니다. 서버에서 다음 명령으로 미리 계산하세요 (프로세스 풀 사용):\n\n"
+                "`python -m qsuite.correspondence --n-max 100000`")
+        if st.button("작은 스윕(n ≤ 2000) 지금 계산"):
+            with st.spinner("스윕 계산 중…"):
+                correspondence.build_table(2000, workers=1)   # 서버 안에서는 풀 없이
+            st.rerun()
+    else:
+        table_file = st.selectbox("스윕 표", tables, format_func=lambda f: f.name)
+        sweep_tbl = load_sweep_table(str(table_file), table_file.stat().st_mtime)
+        n_all = sweep_tbl["n"][1:]
+        beta_l1, c_l1 = correspondence.powerlaw_fit(n_all, sweep_tbl["l1"][1:], n_min=100)
+        beta_kl, c_kl = correspondence.powerlaw_fit(n_all, sweep_tbl["kl"][1:], n_min=100)
+
+        # 화면에는 로그 간격으로 골라낸 점만 전송 (표 자체는 모든 n 보유)
+        pick = np.unique(np.geomspace(1, n_all[-1], 2000).astype(int)) - 1
+        fig_sw = go.Figure()
+        fig_sw.add_trace(go.Scatter(x=n_all[pick], y=sweep_tbl["l1"][1:][pick], mode="lines",
+                                    line=dict(color="royalblue", width=2), name="L1 거리"))
+        fig_sw.add_trace(go.Scatter(x=n_all[pick], y=sweep_tbl["kl"][1:][pick], mode="lines",
+                                    line=dict(color="darkorange", width=2), name="KL(q‖p)"))
+        fig_sw.add_trace(go.Scatter(x=n_all[pick], y=c_l1 * n_all[pick] ** -beta_l1, mode="lines",
+                                    line=dict(color="gray", dash="dash"), name=f"∝ n^(-{beta_l1:.2f})"))
+        fig_sw.update_layout(
+            title=f"국소평균 |ψₙ|² 와 P(x) 의 거리 (구간 {len(sweep_tbl['q'])}개, n ≤ {n_all[-1]:,})",
+            xaxis=dict(type="log", title="n"), yaxis=dict(type="log", title="거리"),
+            template="plotly_white", font=dict(size=15),
+        )
+        with metrics.timed("render:sweep"):
+            st.plotly_chart(fig_sw, use_container_width=True)
+        st.caption(f"n ≥ 100 피팅: L1 ∝ n^(-{beta_l1:.3f}),  KL ∝ n^(-{beta_kl:.3f})")
+
+
+sweep_view()
 
 # ─────────────────────────────────────────────
 st.divider()
@@ -233,3 +371,5 @@ with st.expander("5️⃣ 물리적 해석 요약"):
 양자확률이 고전확률로 부드럽게 이어지는 것이 바로 **대응원리**이다.
 """)
 
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+구면조화함수 Y_lm(θ, φ) 시각화
+──────────────────────────────────────────────
+• 정규화 연관 Legendre 점화식 (qsuite.spherical) — l = 1000 까지 안정
+• θ 격자별 Legendre 열 캐시 → l, m 을 바꿔도 즉시 갱신
+• Plotly 3D Surface 로 |Y_lm|² 곡면, 구면 위 색 지도, 평면 (θ, φ) 지도
+• Gauss–Legendre 격자 구면 조화 변환 (qsuite.sht) 으로 스펙트럼 절단 탐구 (L ≤ 512)
+"""
+
+import time
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from numpy.polynomial.legendre import leggauss
+from qsuite import memo, metrics, sht, spherical, warmup
+
+# ─────────────────────────────────────────────
+st.set_page_config(page_title="구면조화함수 Y_lm", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
+st.title("🌐 구면조화함수 Y_lm(θ, φ) (Spherical Harmonics)")
+st.caption("정규화 연관 Legendre 점화식으로 l = 1000 까지 계산하고 Plotly 3D 로 시각화")
+
+st.divider()
+
+# ─────────────────────────────────────────────
+st.header("1️⃣ 정의와 정규화")
+
+st.markdown(r"""
+각운동량 연산자 \(\hat L^2,\ \hat L_z\) 의 공통 고유함수:
+
+$$
+Y_l^m(\theta,\phi) = (-1)^m\sqrt{\frac{2l+1}{4\pi}\frac{(l-m)!}{(l+m)!}}\;P_l^m(\cos\theta)\,e^{im\phi},
+\qquad
+\oint |Y_l^m|^2\, d\Omega = 1
+$$
+
+계승 \((l+m)!\) 을 직접 계산하면 \(l \gtrsim 85\) 에서 overflow 가 나므로,
+정규화 인자를 포함한 \(\tilde P_l^m\) 을 **점화식으로 바로** 만든다:
+
+$$
+\tilde P_m^m = (-1)^m\sqrt{\tfrac{1}{4\pi}}\prod_{k=1}^{m}\sqrt{\tfrac{2k+1}{2k}}\;\sin^m\theta,\qquad
+\tilde P_{l}^m = a_{lm}\left(\cos\theta\,\tilde P_{l-1}^m - \frac{\tilde P_{l-2}^m}{a_{l-1,m}}\right),\quad
+a_{lm} = \sqrt{\frac{4l^2-1}{l^2-m^2}}
+$$
+
+- 극 근처에서 \(\sin^m\theta\) 는 \(10^{-300}\) 보다 작아지므로 지수부를 로그로 분리해 전개
+- 노드: θ 방향 \(l-|m|\) 개, φ 방향 (실수형) \(2|m|\) 개
+""")
+
+# ─────────────────────────────────────────────
+st.header("2️⃣ 3D 시각화")
+
+col_l, col_m, col_v = st.columns([1, 1, 1.2])
+l_sel = col_l.number_input("l (0 ~ 1000)", min_value=0, max_value=1000, value=3, step=1)
+m_sel = col_m.slider("m", -int(l_sel), int(l_sel), min(2, int(l_sel))) if l_sel > 0 else 0
+view = col_v.radio("표시 방식", ["radius", "sphere"], horizontal=True,
+                   format_func=lambda v: "반지름 = |Y|²" if v == "radius" else "구면 위 색 (실수 Y)")
+real_form = st.checkbox("실수 구면조화함수 사용 (화학 오비탈 형태)", value=True)
+
+
+@memo.shared(max_entries=64)
+def surface_data(l, m, real, n_theta):
+    T, P = spherical.sphere_mesh(n_theta)
+    t0 = time.perf_counter()
+    Y = spherical.sph_harm(l, m, T, P, real=real)
+    elapsed = time.perf_counter() - t0
+    dens = np.abs(Y) ** 2
+    val = Y.real if real else np.angle(Y)
+    sx, sy, sz = np.sin(T) * np.cos(P), np.sin(T) * np.sin(P), np.cos(T)
+    return (sx.astype(np.float32), sy.astype(np.float32), sz.astype(np.float32),
+            dens.astype(np.float32), val.astype(np.float32), elapsed)
+
+
+n_theta = spherical.mesh_size(int(l_sel))
+sx, sy, sz, dens, val, t_eval = surface_data(int(l_sel), int(m_sel), real_form, n_theta)
+
+if view == "radius":
+    r = dens / dens.max()
+    surf = go.Surface(x=r * sx, y=r * sy, z=r * sz, surfacecolor=val,
+                      colorscale="RdBu" if real_form else "Twilight", cmid=0 if real_form else None,
+                      colorbar=dict(title="Y" if real_form else "arg Y"),
+                      lighting=dict(ambient=0.7, diffuse=0.8, specular=0.4, roughness=0.3),
+                      opacity=0.95)
+else:
+    surf = go.Surface(x=sx, y=sy, z=sz, surfacecolor=val if real_form else dens,
+                      colorscale="RdBu" if real_form else "Viridis", cmid=0 if real_form else None,
+                      colorbar=dict(title="Y" if real_form else "|Y|²"),
+                      lighting=dict(ambient=0.8, diffuse=0.6, specular=0.2, roughness=0.5))
+
+fig = go.Figure(surf)
+fig.update_layout(
+    title=f"Y_{l_sel}^{m_sel}  ({'실수형' if real_form else '복소형'}, 메쉬 {n_theta}×{2 * n_theta})",
+    scene=dict(
+        xaxis=dict(showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
+        yaxis=dict(showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
+        zaxis=dict(showbackground=True, backgroundcolor="rgba(250,250,250,0.5)"),
+        aspectmode="data",
+    ),
+    template="plotly_white",
+    height=620,
+    margin=dict(l=10, r=10, b=10, t=40),
+)
+with metrics.timed("render:surface"):
+    st.plotly_chart(fig, use_container_width=True)
+st.caption(f"Y_lm 계산 {t_eval * 1e3:.1f} ms (같은 메쉬의 Legendre 열은 캐시되어 재사용). "
+           "큰 l 에서는 메쉬가 노드보다 성겨지므로 아래 평면 지도를 함께 보라.")
+
+# ─────────────────────────────────────────────
+st.header("3️⃣ 평면 (θ, φ) 지도 — 큰 l 의 노드 구조")
+
+
+@memo.shared(max_entries=64)
+def flat_map(l, m, real):
+    n_t = int(np.clip(8 * (l + 1), 90, 720))
+    theta = np.linspace(0.0, np.pi, n_t)
+    phi = np.linspace(0.0, 2 * np.pi, 2 * n_t)
+    Y = spherical.sph_harm(l, m, theta[:, None], phi[None, :], real=real)
+    return theta, phi, (Y.real if real else np.abs(Y) ** 2).astype(np.float32)
+
+
+theta_f, phi_f, Z_f = flat_map(int(l_sel), int(m_sel), real_form)
+fig2 = go.Figure(go.Heatmap(x=np.degrees(phi_f), y=np.degrees(theta_f), z=Z_f,
+                            colorscale="RdBu" if real_form else "Viridis", zmid=0 if real_form else None))
+fig2.update_layout(xaxis_title="φ (°)", yaxis_title="θ (°)", yaxis_autorange="reversed",
+                   template="plotly_white", height=420, margin=dict(l=10, r=10, b=10, t=30))
+with metrics.timed("render:map"):
+    st.plotly_chart(fig2, use_container_width=True)
+
+# ─────────────────────────────────────────────
+st.header("4️⃣ 정규직교성 수치 확인")
+
+st.markdown(r"""
+Gauss–Legendre 구적 (θ 방향 \(\cos\theta\) 노드) × 등간격 φ 는 차수 \(2l\) 까지의 다항식을 정확히 적분한다.
+선택한 \((l, m)\) 과 이웃 \(l' = l-1, l, l+1\) 의 내적 \(\oint Y_{l'}^{m*} Y_l^m d\Omega\) 를 계산한다.
+""")
+
+n_q = int(l_sel) + 2
+x_q, w_q = leggauss(n_q)
+theta_q = np.arccos(x_q)
+phi_q = np.arange(2 * n_q) * np.pi / n_q
+Y_self = spherical.sph_harm(int(l_sel), int(m_sel), theta_q[:, None], phi_q[None, :])
+rows = []
+for lp in (int(l_sel) - 1, int(l_sel), int(l_sel) + 1):
+    if lp < abs(int(m_sel)):
+        continue
+    Y_other = spherical.sph_harm(lp, int(m_sel), theta_q[:, None], phi_q[None, :])
+    inner = (np.conj(Y_other) * Y_self * w_q[:, None]).sum() * (np.pi / n_q)
+    rows.append({"l'": lp, "Re ⟨Y_l'm | Y_lm⟩": float(inner.real), "|Im|": float(abs(inner.imag))})
+st.table(rows)
+
+# ─────────────────────────────────────────────
+st.header("5️⃣ 구면 조화 변환 — 스펙트럼 절단")
+
+st.markdown(r"""
+구면 위의 함수는 \(f(\theta,\phi) = \sum_{l,m} a_{lm} Y_l^m(\theta,\phi)\) 로 전개된다.
+
+- **정변환**: φ 방향 FFT → 각 m 마다 Gauss–Legendre 구적 \(a_{lm} = \sum_j w_j \tilde P_l^m(\theta_j) F_m(\theta_j)\)
+- **역변환**: 같은 과정을 거꾸로 → 전체 비용 \(O(L^3)\) (모든 격자점에서 \(Y_{lm}\) 을 직접 더하면 \(O(L^4)\))
+- \(l > L_{keep}\) 계수를 버리고 되돌리면 **저역 통과(스펙트럼 절단)** — 불연속 경계에서는 Gibbs 진동이 보인다
+""")
+
+col_src, col_L = st.columns(2)
+source = col_src.selectbox("데이터", ["random", "cap", "upload"],
+                           format_func={"random": "무작위 장  C_l ∝ (l+1)⁻²",
+                                        "cap": "구면 모자 (불연속 경계)",
+                                        "upload": "업로드 (.npy, 위도 × 경도 등간격)"}.get)
+L_band = col_L.select_slider("분석 대역 L", options=[32, 64, 128, 256, 512], value=128)
+uploaded = st.file_uploader("위도(북→남) × 경도(0→360°) 2차원 배열 .npy", type=["npy"]) \
+    if source == "upload" else None
+
+
+@memo.shared(max_entries=16)
+def sht_analyse(source, L, raw=None):
+    theta, phi, _ = sht.grid(L)
+    if source == "random":
+        f = sht.inverse(sht.random_coefficients(L, seed=7), real=True)
+    elif source == "cap":
+        T, P = np.meshgrid(theta, phi, indexing="ij")
+        th0, ph0 = np.radians(60.0), np.radians(120.0)
+        cos_d = np.cos(T) * np.cos(th0) + np.sin(T) * np.sin(th0) * np.cos(P - ph0)
+        f = (cos_d > np.cos(np.radians(30.0))).astype(float)
+    else:
+        f = sht.from_equiangular(raw, L)
+    t0 = time.perf_counter()
+    a = sht.forward(f, L)
+    return f, a, time.perf_counter() - t0
+
+
+@memo.shared(max_entries=32)
+def sht_truncated(source, L, L_keep, raw=None):
+    f, a, _ = sht_analyse(source, L, raw)
+    t0 = time.perf_counter()
+    g = sht.inverse(sht.truncate(a, L_keep), real=True)
+    return g, time.perf_counter() - t0
+
+
+raw = None
+if source == "upload":
+    if uploaded is None:
+        st.info("업로드된 파일이 없어 무작위 장으로 대신 보여준다.")
+        source = "random"
+    else:
+        raw = np.load(uploaded)
+        if raw.ndim != 2:
+            st.error(f"2차원 배열이어야 한다 (받은 모양: {raw.shape}).")
+            st.stop()
+
+with st.spinner(f"L = {L_band} 정변환 중 (처음 한 번은 Legendre 표 생성 포함)..."):
+    f_sht, a_sht, t_fwd = sht_analyse(source, L_band, raw)
+L_keep = st.slider("남길 최대 l (L_keep)", 0, L_band, min(L_band, 24))
+g_sht, t_inv = sht_truncated(source, L_band, L_keep, raw)
+
+rel_err = np.sqrt(np.sum((f_sht - g_sht) ** 2) / np.sum(f_sht**2))
+c1, c2, c3 = st.columns(3)
+c1.metric("정변환", f"{t_fwd * 1e3:.0f} ms")
+c2.metric("역변환", f"{t_inv * 1e3:.0f} ms")
+c3.metric("상대 L2 오차", f"{rel_err:.2e}")
+
+theta_s, phi_s, _ = sht.grid(L_band)
+step = max(1, len(theta_s) // 256)
+fig3 = make_subplots(rows=1, cols=2, subplot_titles=["원본 f", f"l ≤ {L_keep} 절단 후"])
+for j, Z in enumerate((f_sht, g_sht), start=1):
+    fig3.add_trace(go.Heatmap(x=np.degrees(phi_s[::step]), y=np.degrees(theta_s[::step]),
+                              z=Z[::step, ::step].astype(np.float32), colorscale="RdBu_r",
+                              zmin=float(f_sht.min()), zmax=float(f_sht.max()), showscale=(j == 2)),
+                   row=1, col=j)
+fig3.update_yaxes(autorange="reversed", title_text="θ (°)")
+fig3.update_xaxes(title_text="φ (°)")
+fig3.update_layout(template="plotly_white", height=400, margin=dict(l=10, r=10, b=10, t=40))
+with metrics.timed("render:sht_maps"):
+    st.plotly_chart(fig3, use_container_width=True)
+
+C_l = sht.power_spectrum(a_sht)
+fig4 = go.Figure(go.Scatter(x=np.arange(1, L_band + 1), y=C_l[1:], mode="lines", name="C_l"))
+fig4.add_vline(x=max(L_keep, 1), line_dash="dash", line_color="crimson", annotation_text="L_keep")
+fig4.update_layout(xaxis_type="log", yaxis_type="log", xaxis_title="l", yaxis_title="C_l",
+                   template="plotly_white", height=340, margin=dict(l=10, r=10, b=10, t=30))
+with metrics.timed("render:sht_spectrum"):
+    st.plotly_chart(fig4, use_container_width=True)
+
+# ─────────────────────────────────────────────
+metrics.end_page()
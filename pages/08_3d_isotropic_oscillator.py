@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+3차원 등방 조화진동자 |n, l, m⟩ 시각화
+──────────────────────────────────────────────
+• ψ_nlm = R_{n_r l}(r) Y_lm(θ, φ) — 일반화 Laguerre 지름 성분 × 구면조화함수 (qsuite.oscillator3d)
+• 최대 200³ 격자에서 1차원 표 + 보간으로 분리 평가 (float32)
+• |ψ|² 등위면을 marching cubes 로 추출하고, 삼각형 수를 상한 이하로 줄여 Plotly Mesh3d 로 표시
+• 지름 확률밀도 r²R² 와 축퇴도 표
+• |ψ|² 에서 10⁶ 점을 역누적분포로 뽑는 Monte Carlo 점 구름 (진동자 / 수소꼴, qsuite.pointcloud)
+"""
+
+import time
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from qsuite import memo, metrics, oscillator3d, pointcloud, warmup
+
+# ─────────────────────────────────────────────
+st.set_page_config(page_title="3D 등방 조화진동자", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
+st.title("🧊 3차원 등방 조화진동자 |n, l, m⟩ (3D Isotropic Oscillator)")
+st.caption("구면 기저 고유함수의 확률밀도 등위면을 marching cubes 로 추출해 Plotly Mesh3d 로 시각화")
+
+st.divider()
+
+# ─────────────────────────────────────────────
+st.header("1️⃣ 구면 좌표에서의 해")
+
+st.markdown(r"""
+\(V = \tfrac12 m\omega^2 r^2\) 는 구대칭이므로 \(\psi = R(r)\,Y_l^m(\theta,\phi)\) 로 분리된다
+(\(\hbar = m = \omega = 1\)):
+
+$$
+R_{n_r l}(r) = \sqrt{\frac{2\,n_r!}{\Gamma(n_r + l + \tfrac32)}}\; r^l e^{-r^2/2}\, L_{n_r}^{(l+\frac12)}(r^2),
+\qquad
+E = n + \tfrac32,\quad n = 2n_r + l
+$$
+
+- 주양자수 \(n\) 에 대해 \(l = n, n-2, \dots, 0\) 또는 \(1\) — \(n - l\) 은 짝수
+- 축퇴도 \((n+1)(n+2)/2\) 는 직교 좌표 \((n_x, n_y, n_z)\) 로 센 값과 같다
+- 지름 노드 \(n_r\) 개 + 각 노드 \(l\) 개
+""")
+
+deg_rows = [{"n": n, "E": oscillator3d.energy(n), "허용 l": ", ".join(map(str, oscillator3d.allowed_l(n))),
+             "축퇴도": oscillator3d.degeneracy(n)} for n in range(6)]
+st.table(deg_rows)
+
+# ─────────────────────────────────────────────
+st.header("2️⃣ 확률밀도 등위면 (Mesh3d)")
+
+col_n, col_l, col_m = st.columns(3)
+n_sel = col_n.number_input("n (0 ~ 20)", min_value=0, max_value=20, value=4, step=1)
+l_sel = col_l.selectbox("l", oscillator3d.allowed_l(int(n_sel)), index=len(oscillator3d.allowed_l(int(n_sel))) - 1)
+m_sel = col_m.slider("m", -int(l_sel), int(l_sel), min(1, int(l_sel))) if l_sel > 0 else 0
+
+col_g, col_p, col_f = st.columns(3)
+n_grid = col_g.select_slider("격자 크기 (한 변)", [64, 96, 128, 160, 200], value=128)
+p_enc = col_p.slider("등위면 안쪽 확률", 0.3, 0.95, 0.8, 0.05)
+max_faces = col_f.select_slider("최대 삼각형 수", [10000, 20000, 40000, 80000, 150000], value=40000)
+real_form = st.checkbox("실수 구면조화함수 사용 (± 로브를 색으로 구분)", value=True)
+
+
+@memo.shared(max_entries=32)
+def orbital_surface(n, l, m, n_grid, p, max_faces, real):
+    t0 = time.perf_counter()
+    res = oscillator3d.orbital_meshes(n, l, m, n_grid=n_grid, p=p, max_faces=max_faces, real=real)
+    res["elapsed"] = time.perf_counter() - t0
+    res["lobes"] = [(s, v.astype(np.float32), f.astype(np.int32)) for s, v, f in res["lobes"]]
+    return res
+
+
+with st.spinner(f"{n_grid}³ 격자 평가 + marching cubes ..."):
+    mesh = orbital_surface(int(n_sel), int(l_sel), int(m_sel), int(n_grid), float(p_enc), int(max_faces), real_form)
+
+faces_shown = sum(len(f) for _, _, f in mesh["lobes"])
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("E", f"{oscillator3d.energy(int(n_sel)):.1f} ħω")
+c2.metric("계산 시간", f"{mesh['elapsed']:.2f} s")
+c3.metric("marching cubes 삼각형", f"{mesh['faces_raw']:,}")
+c4.metric("표시 삼각형", f"{faces_shown:,}")
+
+fig = go.Figure()
+for sign, v, f in mesh["lobes"]:
+    if not len(f):
+        continue
+    color = "#2b6cb0" if sign > 0 else "#c53030"
+    fig.add_trace(go.Mesh3d(x=v[:, 0], y=v[:, 1], z=v[:, 2], i=f[:, 0], j=f[:, 1], k=f[:, 2],
+                            color=color if real_form else "#6b46c1", opacity=0.9, flatshading=False,
+                            name="ψ > 0" if sign > 0 else "ψ < 0", showlegend=real_form,
+                            lighting=dict(ambient=0.45, diffuse=0.8, specular=0.3, roughness=0.4),
+                            lightposition=dict(x=100, y=200, z=300)))
+extent = float(mesh["axis"][-1])
+fig.update_layout(
+    title=f"|{n_sel}, {l_sel}, {m_sel}⟩  (|ψ|² 등위면 — 안쪽 확률 {p_enc:.0%})",
+    scene=dict(
+        xaxis=dict(range=[-extent, extent], showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
+        yaxis=dict(range=[-extent, extent], showbackground=True, backgroundcolor="rgba(230,230,230,0.5)"),
+        zaxis=dict(range=[-extent, extent], showbackground=True, backgroundcolor="rgba(250,250,250,0.5)"),
+        aspectmode="cube",
+    ),
+    template="plotly_white",
+    height=650,
+    margin=dict(l=10, r=10, b=10, t=40),
+)
+with metrics.timed("render:isosurface"):
+    st.plotly_chart(fig, use_container_width=True)
+st.caption("격자가 촘촘할수록 marching cubes 삼각형이 한 변의 제곱으로 늘어나므로, 브라우저로 보내기 전에 "
+           "정점 군집화로 상한 이하로 줄인다. 등위면 값은 |ψ|² ≥ level 영역이 지정 확률을 담도록 정한다.")
+
+# ─────────────────────────────────────────────
+st.header("3️⃣ 지름 확률밀도 r² R²(r)")
+
+r = np.linspace(0.0, float(oscillator3d.classical_radius(int(n_sel))) + 3.0, 600)
+fig2 = go.Figure()
+for lp in oscillator3d.allowed_l(int(n_sel)):
+    P_r = r**2 * oscillator3d.radial(int(n_sel), lp, r) ** 2
+    fig2.add_trace(go.Scatter(x=r, y=P_r, mode="lines", name=f"l = {lp}",
+                              line=dict(width=3 if lp == l_sel else 1.5)))
+fig2.add_vline(x=float(oscillator3d.classical_radius(int(n_sel))), line_dash="dash", line_color="gray",
+               annotation_text="고전 전환점")
+fig2.update_layout(xaxis_title="r", yaxis_title="r² R²", template="plotly_white", height=360,
+                   margin=dict(l=10, r=10, b=10, t=30))
+with metrics.timed("render:radial"):
+    st.plotly_chart(fig2, use_container_width=True)
+
+norm = float(np.sum(r**2 * oscillator3d.radial(int(n_sel), int(l_sel), r) ** 2) * (r[1] - r[0]))
+st.caption(f"수치 확인: ∫ r² R² dr = {norm:.6f}")
+
+# ─────────────────────────────────────────────
+st.header("4️⃣ Monte Carlo 점 구름 — 역누적분포 표본추출")
+
+st.markdown(r"""
+등위면 하나로는 안쪽 밀도 분포가 보이지 않는다. 대신 \(|\psi|^2\) 에서 점을 직접 뽑아 흩뿌린다.
+부피 요소까지 포함한 밀도는 세 변수의 곱으로 갈라지므로
+
+$$
+|\psi|^2\, r^2\sin\theta\; dr\,d\theta\,d\phi
+= \underbrace{r^2R^2(r)\,dr}_{p_r}\;\underbrace{|\tilde P_l^m(\theta)|^2\sin\theta\,d\theta}_{p_\theta}\;\underbrace{\Phi_m(\phi)\,d\phi}_{p_\phi}
+$$
+
+각 주변분포의 누적분포 \(F\) 를 1차원 표로 만들고 균등난수 \(u\) 를 \(F^{-1}(u)\) 로 바꾸면
+**버리는 점 없이** 정확한 분포의 표본이 된다 (기각 표본추출은 큰 n 에서 수락률이 급격히 떨어진다).
+""")
+
+cs1, cs2, cs3, cs4 = st.columns(4)
+mc_system = cs1.radio("계", pointcloud.SYSTEMS, horizontal=True,
+                      format_func=lambda v: "조화진동자" if v == "oscillator" else "수소꼴 원자")
+if mc_system == "oscillator":
+    mc_n, mc_l, mc_m = int(n_sel), int(l_sel), int(m_sel)
+    cs2.markdown(f"위 2️⃣ 의 상태 **|{mc_n}, {mc_l}, {mc_m}⟩** 사용")
+else:
+    mc_n = cs2.number_input("n (1 ~ 10)", min_value=1, max_value=10, value=3, step=1)
+    mc_l = cs2.number_input("l", min_value=0, max_value=int(mc_n) - 1, value=min(2, int(mc_n) - 1), step=1)
+    mc_m = cs2.number_input("m", min_value=-int(mc_l), max_value=int(mc_l), value=0, step=1)
+mc_Z = 1.0          # 수소꼴: 원자 단위, Z = 1 (반지름은 1/Z 로 축척될 뿐)
+n_mc = cs3.select_slider("표본 수", [10**4, 10**5, 3 * 10**5, 10**6], value=10**6,
+                         format_func=lambda v: f"{v:,}")
+n_show = cs4.select_slider("화면에 그릴 점", [20000, 50000, 100000, 200000], value=50000,
+                           format_func=lambda v: f"{v:,}")
+
+
+@memo.shared(max_entries=4, ttl=7200)
+def point_cloud(system, n, l, m, n_points, real, Z):
+    t0 = time.perf_counter()
+    xyz, value = pointcloud.sample(system, n, l, m, n_points, real=real, Z=Z)
+    return xyz, value, time.perf_counter() - t0
+
+
+with st.spinner(f"{n_mc:,} 점 표본추출 중..."):
+    xyz, value, t_mc = point_cloud(mc_system, int(mc_n), int(mc_l), int(mc_m), int(n_mc), real_form, mc_Z)
+
+r_s = np.linalg.norm(xyz.astype(np.float64), axis=1)
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("표본추출 시간", f"{t_mc:.2f} s")
+c2.metric("처리량", f"{n_mc / t_mc / 1e6:.2f} M점/s")
+c3.metric("⟨r⟩ 표본 / 이론", f"{r_s.mean():.3f} / {pointcloud.mean_r(mc_system, int(mc_n), int(mc_l), mc_Z):.3f}")
+c4.metric("⟨r²⟩ 표본 / 이론", f"{np.mean(r_s**2):.2f} / {pointcloud.mean_r2(mc_system, int(mc_n), int(mc_l), mc_Z):.2f}")
+
+# WebGL Scatter3d — 브라우저에는 무작위 부분집합만, 한 trace 당 최대 BATCH_SHOW 점으로 나눠 보낸다
+BATCH_SHOW = 50000
+xyz_s, val_s = pointcloud.decimate(xyz, value, int(n_show))
+fig3 = go.Figure()
+for b, start in enumerate(range(0, len(xyz_s), BATCH_SHOW)):
+    sl = slice(start, start + BATCH_SHOW)
+    marker = dict(size=1.5, opacity=0.35, color=val_s[sl],
+                  colorscale=[[0, "#c53030"], [1, "#2b6cb0"]] if real_form else "Twilight",
+                  cmin=-1 if real_form else -np.pi, cmax=1 if real_form else np.pi,
+                  showscale=(b == 0 and not real_form), colorbar=dict(title="arg ψ"))
+    fig3.add_trace(go.Scatter3d(x=xyz_s[sl, 0], y=xyz_s[sl, 1], z=xyz_s[sl, 2], mode="markers",
+                                marker=marker, hoverinfo="skip", showlegend=False))
+label = "진동자" if mc_system == "oscillator" else "수소꼴"
+fig3.update_layout(
+    title=f"{label} |{mc_n}, {mc_l}, {mc_m}⟩ — {len(xyz_s):,} / {n_mc:,} 점 표시 "
+          f"({'색: ψ 부호' if real_form else '색: 위상'})",
+    scene=dict(aspectmode="data"),
+    template="plotly_white",
+    height=650,
+    margin=dict(l=10, r=10, b=10, t=40),
+)
+with metrics.timed("render:point_cloud"):
+    st.plotly_chart(fig3, use_container_width=True)
+
+r_edges = np.linspace(0.0, float(np.quantile(r_s, 0.999)), 121)
+hist, _ = np.histogram(r_s, bins=r_edges, density=True)
+r_mid = 0.5 * (r_edges[1:] + r_edges[:-1])
+fig4 = go.Figure()
+fig4.add_trace(go.Bar(x=r_mid, y=hist, name="표본 히스토그램", marker_color="lightsteelblue"))
+fig4.add_trace(go.Scatter(x=r_mid, y=r_mid**2 * pointcloud.radial(mc_system, int(mc_n), int(mc_l), r_mid, mc_Z) ** 2,
+                          mode="lines", name="r² R² (이론)", line=dict(color="crimson")))
+fig4.update_layout(xaxis_title="r", yaxis_title="확률밀도", bargap=0, template="plotly_white", height=320,
+                   margin=dict(l=10, r=10, b=10, t=30))
+with metrics.timed("render:histogram"):
+    st.plotly_chart(fig4, use_container_width=True)
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -10,9 +10,13 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
+from qsuite import maxwell as mb
+from qsuite import metrics, warmup
 
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="Maxwell–Boltzmann Distribution", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
 
 st.title("🌡️ Maxwell–Boltzmann Distribution — A Statistical Window into Molecular Motion")
 
@@ -46,12 +50,9 @@ m = st.slider("Particle mass (kg)", 1e-27, 1e-25, 4.65e-26, format="%.2e")
 kB = 1.380649e-23
 v = np.linspace(0, 4000, 600)
 
-# Maxwell–Boltzmann PDF
-f_v = 4 * np.pi * (m / (2 * np.pi * kB * T)) ** (3 / 2) * v ** 2 * np.exp(-m * v ** 2 / (2 * kB * T))
-
-v_mp = np.sqrt(2 * kB * T / m)
-v_mean = np.sqrt(8 * kB * T / (np.pi * m))
-v_rms = np.sqrt(3 * kB * T / m)
+# Maxwell–Boltzmann PDF (qsuite.maxwell)
+f_v = mb.speed_pdf(v, T, m)
+v_mp, v_mean, v_rms = mb.characteristic_speeds(T, m)
 
 # ─────────────────────────────────────────────
 # Plotly figure (축 범위 고정)
@@ -70,7 +71,8 @@ fig.update_layout(
     # yaxis=dict(range=[0, np.max(f_v)*1.1 if np.max(f_v) < 0.005 else 0.005], fixedrange=True)  # ✅ ylim 상한 고정
     yaxis=dict(range=[0,  0.005], fixedrange=True)  # ✅ ylim 상한 고정
 )
-st.plotly_chart(fig, use_container_width=True)
+with metrics.timed("render:distribution"):
+    st.plotly_chart(fig, use_container_width=True)
 
 # ─────────────────────────────────────────────
 st.markdown(r"""
@@ -106,3 +108,134 @@ st.markdown(r"""
 이 개념을 이해하면, 기체역학, 반응속도론, 열역학, 플라즈마물리 등 수많은 현상을 하나의 언어로 해석할 수 있습니다.
 """)
 
+
+# ─────────────────────────────────────────────
+# 7️⃣ 수치 확인 — E > E_a 꼬리 면적과 아레니우스 플롯
+st.markdown(r"""
+### 🔬 활성화 에너지 이상 분자 비율 — 7️⃣의 수치 확인  
+3차원 기체의 운동에너지 분포 \(f(E) = 2\sqrt{E/\pi}\,(k_BT)^{-3/2} e^{-E/k_BT}\) 에서  
+\(E > E_a\) 면적은 닫힌 형태로 계산됩니다 (\(x = E_a/k_BT\)):  
+
+$$
+P(E > E_a) = \operatorname{erfc}\!\left(\sqrt{x}\right) + 2\sqrt{\frac{x}{\pi}}\,e^{-x}
+$$  
+
+충돌이론에서는 반응 단면적 \(\sigma(E)\) 를 충돌 플럭스로 가중한 상대에너지 분포 \(\varepsilon e^{-\varepsilon}\)
+(\(\varepsilon = E/k_BT\)) 로 적분합니다. 중심선(line-of-centers) 모형 \(\sigma(E) = \sigma(1 - E_a/E)\) 이면  
+
+$$
+k(T) = \sigma \langle v_{rel} \rangle \int_x^\infty (\varepsilon - x)\, e^{-\varepsilon}\, d\varepsilon
+     = \sigma \langle v_{rel} \rangle\, e^{-x}
+$$  
+
+이고, 문턱 위에서 단면적이 일정한 모형 (\(E > E_a\) 에서 \(\sigma(E) = \sigma\)) 이면 \(\sigma \langle v_{rel} \rangle\, e^{-x}(1 + x)\) 입니다.  
+\(\ln k\) 대 \(1/T\) 그래프의 기울기가 겉보기 활성화 에너지를 줍니다 (중심선 모형: \(E_a + \tfrac12 k_BT\)).
+""")
+
+
+# T, m 은 모든 그래프가 쓰므로 페이지 전체를 다시 실행하고, 아래 구역의 위젯은 그 구역만 다시 실행한다 (st.fragment)
+@metrics.fragment
+def activation_view(T, m):
+    col_ea, col_sigma = st.columns(2)
+    Ea_kJ = col_ea.slider("활성화 에너지 E_a (kJ/mol)", 1.0, 150.0, 50.0, 1.0)
+    sigma_A2 = col_sigma.slider("충돌 단면적 σ (Å²)", 10.0, 100.0, 30.0, 1.0)
+    Ea = Ea_kJ * 1e3 / mb.N_A
+    sigma = sigma_A2 * 1e-20
+
+    frac = float(mb.tail_fraction(T, Ea, dof=3))
+    boltz = float(mb.tail_fraction(T, Ea, dof=2))
+    c1, c2, c3 = st.columns(3)
+    c1.metric("P(E > E_a) (3D)", f"{frac:.3e}")
+    c2.metric("e^{-E_a/k_BT}", f"{boltz:.3e}")
+    c3.metric("k(T) 중심선 모형 (L/(mol·s))", f"{float(mb.rate_constant(T, Ea, m, sigma)) * mb.N_A * 1e3:.3e}")
+
+    col_e, col_arr = st.columns(2)
+
+    E_kJ = np.linspace(0, max(3 * Ea_kJ, 30.0), 600)
+    f_E = mb.energy_pdf(E_kJ * 1e3 / mb.N_A, T) * 1e3 / mb.N_A
+    tail = E_kJ >= Ea_kJ
+    fig_e = go.Figure()
+    fig_e.add_trace(go.Scatter(x=E_kJ, y=f_E, mode="lines", name="f(E)", line=dict(width=3)))
+    fig_e.add_trace(go.Scatter(x=E_kJ[tail], y=f_E[tail], mode="lines", fill="tozeroy",
+                               line=dict(width=0, color="orange"), name="E > E_a"))
+    fig_e.add_vline(x=Ea_kJ, line=dict(color="red", dash="dash"), annotation_text="E_a")
+    fig_e.update_layout(title=f"운동에너지 분포와 반응 가능 영역 (T={T} K)",
+                        xaxis_title="E (kJ/mol)", yaxis_title="f(E) (mol/kJ)", template="plotly_white")
+    with metrics.timed("render:energy"):
+        col_e.plotly_chart(fig_e, use_container_width=True)
+
+    T_arr = np.linspace(200, 1500, 200)
+    inv_T, lnk = mb.arrhenius_plot_data(T_arr, Ea, m, sigma)
+    Ea_app, _ = mb.arrhenius_fit(T_arr, lnk)
+    fig_arr = go.Figure()
+    fig_arr.add_trace(go.Scatter(x=1e3 * inv_T, y=lnk / np.log(10), mode="lines", line=dict(width=3),
+                                 name="중심선 모형 σ(1 − E_a/E)"))
+    _, lnk_step = mb.arrhenius_plot_data(T_arr, Ea, m, sigma, model="hard_threshold")
+    fig_arr.add_trace(go.Scatter(x=1e3 * inv_T, y=lnk_step / np.log(10), mode="lines",
+                                 line=dict(width=2, dash="dash"), name="일정 단면적 (문턱)"))
+    fig_arr.add_vline(x=1e3 / T, line=dict(color="gray", dash="dot"), annotation_text=f"T={T} K")
+    fig_arr.update_layout(title=f"아레니우스 플롯 (겉보기 E_a ≈ {Ea_app * mb.N_A / 1e3:.1f} kJ/mol)",
+                          xaxis_title="1000 / T (1/K)", yaxis_title="log₁₀ k (m³/s)", template="plotly_white")
+    with metrics.timed("render:arrhenius"):
+        col_arr.plotly_chart(fig_arr, use_container_width=True)
+
+
+activation_view(T, m)
+
+# ─────────────────────────────────────────────
+# 충돌을 통한 평형화 — 사건 구동 강체구 기체 시뮬레이션
+st.markdown(r"""
+### 🎱 충돌이 만드는 맥스웰–볼츠만 분포 — 사건 구동 분자동역학  
+모든 입자가 **같은 속력**(또는 두 집단, 마주보는 빔)으로 출발해도, 탄성충돌이 에너지를 재분배하면서  
+속력 분포는 곧 맥스웰–볼츠만 형태로 수렴합니다. 아래 시뮬레이션은 고정 시간간격 대신  
+**다음 충돌이 일어나는 순간만** 우선순위 큐로 골라 처리하는 event-driven MD입니다.  
+히스토그램 아래 면적과 MB 곡선 사이의 거리(H-함수)가 0으로 줄어드는 것이 **볼츠만 H-정리**의 모습입니다.  
+사건 처리는 순수 파이썬이라 초당 약 1만 회 충돌을 처리하므로, 화면에서는 몇 초 안에 끝나는 N ≤ 5000 만 고릅니다  
+(입자당 약 6회 충돌이면 분포가 충분히 수렴합니다). 더 큰 N 은 `qsuite.hardsphere.HardSphereGas` 를 직접 돌리면 되며 N 에 비례해 오래 걸립니다.
+""")
+
+from qsuite import hardsphere as hs
+
+
+@metrics.fragment
+def hardsphere_view(T, m):
+    col_n, col_dim, col_init, col_phi = st.columns(4)
+    n_particles = col_n.select_slider("입자 수 N", options=[1000, 2000, 3000, 5000], value=2000)
+    dim = col_dim.radio("차원", [2, 3], horizontal=True, format_func=lambda d: f"{d}D")
+    init_kind = col_init.selectbox("초기 속도분포", ["shell", "bimodal", "uniform", "beam"],
+                                   format_func={"shell": "단일 속력", "bimodal": "두 집단",
+                                                "uniform": "상자형 성분", "beam": "마주보는 빔"}.get)
+    packing = col_phi.slider("점유율 φ", 0.05, 0.3, 0.15, 0.05)
+
+    n_frames = 30
+    coll_per_frame = max(n_particles // 10, 100)
+    v_scale = np.sqrt(kB * T / m)                 # 환산 속도 → m/s
+    v_red = np.linspace(0, 4.0, 200)
+    f_mb_red = hs.mb_speed_pdf(v_red, dim)
+
+    if st.button("▶️ 시뮬레이션 실행"):
+        gas = hs.HardSphereGas(n_particles, dim=dim, packing=packing, init=init_kind, seed=0)
+        plot_slot, info_slot = st.empty(), st.empty()
+        with metrics.timed("simulate:hardsphere"):          # 사건 처리 + 프레임 렌더 전체
+            for t_sim, n_coll, hist, edges in gas.stream(n_frames, coll_per_frame, bins=60):
+                centers = 0.5 * (edges[1:] + edges[:-1])
+                fig_hs = go.Figure()
+                fig_hs.add_trace(go.Bar(x=centers * v_scale, y=hist / v_scale, name="시뮬레이션",
+                                        marker_color="lightskyblue"))
+                fig_hs.add_trace(go.Scatter(x=v_red * v_scale, y=f_mb_red / v_scale, mode="lines",
+                                            line=dict(color="red", width=3), name=f"{dim}D 맥스웰–볼츠만"))
+                fig_hs.update_layout(title=f"충돌 {n_coll:,}회 (충돌/입자 = {2 * n_coll / n_particles:.2f})",
+                                     xaxis_title="속도 v (m/s)", yaxis_title="확률밀도", bargap=0,
+                                     template="plotly_white",
+                                     xaxis=dict(range=[0, 4.0 * v_scale], fixedrange=True),
+                                     yaxis=dict(range=[0, 1.2 * max(hist.max(), f_mb_red.max()) / v_scale],
+                                                fixedrange=True))
+                plot_slot.plotly_chart(fig_hs, use_container_width=True)
+                info_slot.caption(f"H-함수 (MB 분포와의 KL 거리) = {hs.h_function(hist, edges, dim):.4f}  ·  "
+                                  f"처리한 셀 경계 통과 사건 {gas.crossings:,}회")
+
+
+hardsphere_view(T, m)
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -10,9 +10,12 @@ Nose–Hoover Thermostat & Tdamp Visualization (LaTeX-safe)
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
+from qsuite import metrics, thermostat, warmup
 
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="Nose–Hoover Thermostat", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
 
 st.title("🌡️ Nose–Hoover Thermostat & Temperature Damping Time (Tdamp)")
 
@@ -69,12 +72,9 @@ $$ \langle E \rangle = \frac{3}{2}Nk_B T $$.
 st.markdown(r"### 🔬 Tdamp에 따른 온도 안정화 시뮬레이션 예시")
 
 time = np.linspace(0, 10, 300)
-T_target = 300
-
-# 세 가지 Tdamp에 따른 가상의 온도 진동 모델
-def temp_profile(t, Tdamp):
-    return T_target + 40*np.exp(-t/Tdamp)*np.cos(6*np.pi*t/Tdamp)
+T_target = thermostat.T_TARGET
 
+# 세 가지 Tdamp에 따른 가상의 온도 진동 모델 (qsuite.thermostat.temp_profile)
 Tdamp_values = [0.5, 2, 5]
 colors = ['red', 'green', 'blue']
 
@@ -82,7 +82,7 @@ fig = go.Figure()
 for Tdamp, c in zip(Tdamp_values, colors):
     fig.add_trace(go.Scatter(
         x=time,
-        y=temp_profile(time, Tdamp),
+        y=thermostat.temp_profile(time, Tdamp),
         mode='lines',
         line=dict(width=3, color=c),
         name=f"Tdamp={Tdamp}"
@@ -98,7 +98,8 @@ fig.update_layout(
     xaxis=dict(range=[0, 10], fixedrange=True),
     yaxis=dict(range=[200, 360], fixedrange=True)
 )
-st.plotly_chart(fig, use_container_width=True)
+with metrics.timed("render:tdamp"):
+    st.plotly_chart(fig, use_container_width=True)
 
 # ─────────────────────────────────────────────
 st.markdown(r"""
@@ -109,3 +110,6 @@ Nose–Hoover thermostat은 단순한 수학적 도구가 아니라,
 적절히 선택된 Tdamp는 시뮬레이션의 안정성과 물리적 신뢰성을 동시에 보장합니다.  
 즉, Nose–Hoover의 핵심은 “온도를 조절하되 동역학은 왜곡하지 않는다”는 균형의 예술이라 할 수 있습니다.
 """)
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -5,8 +5,11 @@ NVIDIA L4 환경에서 pip 중심으로 딥러닝 라이브러리를 설치하
 """
 
 import streamlit as st
+from qsuite import metrics, warmup
 
 st.set_page_config(page_title="GPU Deep Learning Setup Guide (pip)", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
 
 st.title("GPU Deep Learning 환경 구축 가이드 (pip 기반)")
 st.write(
@@ -122,3 +125,6 @@ pip install mace-torch nglview ipywidgets rdkit x3dase
 st.markdown("---")
 
 st.write("pip 기반으로 설치할 때는 순서대로 진행하는 것이 가장 안정적입니다.")
+
+# ─────────────────────────────────────────────
+metrics.end_page()
@@ -10,11 +10,14 @@ ReaxFF에서 전하는 매 시뮬레이션 스텝마다 주변 환경에 따라
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from qsuite import metrics, qeq, warmup
 
 # ─────────────────────────────────────────────
 # 페이지 설정
 # ─────────────────────────────────────────────
 st.set_page_config(page_title="QEq 전하 평형화 시각화", layout="wide")
+metrics.start_page(__file__)
+warmup.start()
 st.title("⚛️ QEq (Charge Equilibration) — 전하 평형화의 물리적 메커니즘과 시각화")
 
 st.markdown("""
@@ -126,110 +129,96 @@ st.markdown("""
 이것이 바로 QEq의 본질이다.
 """)
 
-# ─────────────────────────────────────────────
-# QEq 계산 함수
-# ─────────────────────────────────────────────
-def solve_qeq(chi, J, R, Q_total=0.0):
-    N = len(chi)
-    A = np.zeros((N + 1, N + 1))
-    b = np.zeros(N + 1)
-
-    for i in range(N):
-        for j in range(N):
-            A[i, j] = J[i] if i == j else 1.0 / R[i, j]
-        A[i, -1] = 1.0
-        A[-1, i] = 1.0
-        b[i] = -chi[i]
-    b[-1] = Q_total
-
-    q_lambda = np.linalg.solve(A, b)
-    return q_lambda[:-1], q_lambda[-1]
-
 # ─────────────────────────────────────────────
 # 사용자 입력
 # ─────────────────────────────────────────────
-st.markdown("---")
-st.subheader("변수 설정 및 계산")
-
-col1, col2 = st.columns(2)
-N = col1.slider("원자 개수", 2, 4, 3)
-
-chi = np.array([col1.slider(f"χ{i+1} (전기음성도)", -5.0, 5.0, val, 0.1)
-                for i, val in enumerate(np.linspace(-1, 1, N))])
-J = np.array([col2.slider(f"J{i+1} (자기 경질도)", 0.1, 10.0, 5.0, 0.1)
-              for i in range(N)])
-
-# 거리 행렬
-R = np.ones((N, N))
-for i in range(N):
-    for j in range(N):
-        if i != j:
-            R[i, j] = np.abs(i - j) + 1.0
-
-Q_total = st.number_input("총 전하 Q_total", value=0.0, step=0.1)
-
-q, lam = solve_qeq(chi, J, R, Q_total)
-
-st.markdown("""
-**계산 결과:**  
-각 원자의 전하는 다음과 같이 평형화된다.  
-λ은 모든 원자가 공유하는 공통 화학 퍼텐셜(전기화학 평형점)을 나타낸다.
-""")
-st.write({f"원자 {i+1}": round(qi, 4) for i, qi in enumerate(q)})
-st.write(f"λ (공통 화학 퍼텐셜): {lam:.4f}")
-
-# ─────────────────────────────────────────────
-# 전하 재분포 시각화
-# ─────────────────────────────────────────────
-st.markdown("---")
-st.subheader("전하 재분포 시각화")
-
-st.markdown("""
-전기음성도가 높은 원자는 전자를 끌어당겨 음전하를,  
-전기음성도가 낮은 원자는 상대적으로 양전하를 띠게 된다.  
-막대의 색상은 전하의 부호를, 높이는 전하의 크기를 나타낸다.
-""")
-
-fig, ax = plt.subplots(figsize=(7, 4))
-normed = (q - min(q)) / (max(q) - min(q) + 1e-6)
-colors = plt.cm.coolwarm(normed)
-ax.bar(range(1, N + 1), q, color=colors, edgecolor='black')
-ax.set_xlabel("원자 번호")
-ax.set_ylabel("전하 (q_i)")
-ax.set_title("전하 평형화 후 원자별 전하 분포")
-st.pyplot(fig)
-
-# ─────────────────────────────────────────────
-# 에너지 곡선 시각화
-# ─────────────────────────────────────────────
-st.markdown("---")
-st.subheader("단일 원자의 전하–에너지 곡선")
+# 입력 위젯부터 두 그래프까지는 st.fragment — 값을 바꾸면 위의 이론 설명은 다시 그리지 않는다
+@metrics.fragment
+def qeq_view():
+    st.markdown("---")
+    st.subheader("변수 설정 및 계산")
+
+    col1, col2 = st.columns(2)
+    N = col1.slider("원자 개수", 2, 4, 3)
+
+    chi = np.array([col1.slider(f"χ{i+1} (전기음성도)", -5.0, 5.0, val, 0.1)
+                    for i, val in enumerate(np.linspace(-1, 1, N))])
+    J = np.array([col2.slider(f"J{i+1} (자기 경질도)", 0.1, 10.0, 5.0, 0.1)
+                  for i in range(N)])
+
+    # 거리 행렬 (일렬 배치, R_ij = |i − j| + 1)
+    R = qeq.chain_distances(N)
+
+    Q_total = st.number_input("총 전하 Q_total", value=0.0, step=0.1)
+
+    with metrics.timed("compute:solve_qeq"):
+        q, lam = qeq.solve_qeq(chi, J, R, Q_total)
+
+    st.markdown("""
+    **계산 결과:**  
+    각 원자의 전하는 다음과 같이 평형화된다.  
+    λ은 모든 원자가 공유하는 공통 화학 퍼텐셜(전기화학 평형점)을 나타낸다.
+    """)
+    st.write({f"원자 {i+1}": round(qi, 4) for i, qi in enumerate(q)})
+    st.write(f"λ (공통 화학 퍼텐셜): {lam:.4f}")
+
+    # ─────────────────────────────────────────────
+    # 전하 재분포 시각화
+    # ─────────────────────────────────────────────
+    st.markdown("---")
+    st.subheader("전하 재분포 시각화")
+
+    st.markdown("""
+    전기음성도가 높은 원자는 전자를 끌어당겨 음전하를,  
+    전기음성도가 낮은 원자는 상대적으로 양전하를 띠게 된다.  
+    막대의 색상은 전하의 부호를, 높이는 전하의 크기를 나타낸다.
+    """)
+
+    fig, ax = plt.subplots(figsize=(7, 4))
+    normed = (q - min(q)) / (max(q) - min(q) + 1e-6)
+    colors = plt.cm.coolwarm(normed)
+    ax.bar(range(1, N + 1), q, color=colors, edgecolor='black')
+    ax.set_xlabel("원자 번호")
+    ax.set_ylabel("전하 (q_i)")
+    ax.set_title("전하 평형화 후 원자별 전하 분포")
+    with metrics.timed("render:charges"):
+        st.pyplot(fig)
+
+    # ─────────────────────────────────────────────
+    # 에너지 곡선 시각화
+    # ─────────────────────────────────────────────
+    st.markdown("---")
+    st.subheader("단일 원자의 전하–에너지 곡선")
+
+    st.markdown("""
+    각 원자의 에너지는 전기음성도와 경질도의 경쟁으로 결정된다.
+    """)
+
+    st.latex(r"""
+    E_i(q_i) = \chi_i q_i + \frac{1}{2} J_i q_i^2
+    """)
+
+    st.markdown("""
+    χ는 에너지의 기울기를, J는 곡률을 결정한다.  
+    χ가 크면 기울기가 커져 전자를 끌어당기며,  
+    J가 크면 곡선이 가팔라져 전하 이동이 어렵다.  
+    따라서 평형 전하는 χ/J 비율의 균형점에서 결정된다.
+    """)
+
+    q_space = np.linspace(-2, 2, 200)
+    fig2, ax2 = plt.subplots(figsize=(7, 4))
+    for i in range(N):
+        E = qeq.site_energy(chi[i], J[i], q_space)
+        ax2.plot(q_space, E, label=f'원자 {i+1}')
+    ax2.set_xlabel("시도 전하 q_i")
+    ax2.set_ylabel("에너지 E_i(q_i)")
+    ax2.set_title("각 원자의 에너지 곡선 (χ–J 상호작용)")
+    ax2.legend()
+    with metrics.timed("render:energy_curve"):
+        st.pyplot(fig2)
 
-st.markdown("""
-각 원자의 에너지는 전기음성도와 경질도의 경쟁으로 결정된다.
-""")
 
-st.latex(r"""
-E_i(q_i) = \chi_i q_i + \frac{1}{2} J_i q_i^2
-""")
-
-st.markdown("""
-χ는 에너지의 기울기를, J는 곡률을 결정한다.  
-χ가 크면 기울기가 커져 전자를 끌어당기며,  
-J가 크면 곡선이 가팔라져 전하 이동이 어렵다.  
-따라서 평형 전하는 χ/J 비율의 균형점에서 결정된다.
-""")
-
-q_space = np.linspace(-2, 2, 200)
-fig2, ax2 = plt.subplots(figsize=(7, 4))
-for i in range(N):
-    E = chi[i] * q_space + 0.5 * J[i] * q_space ** 2
-    ax2.plot(q_space, E, label=f'원자 {i+1}')
-ax2.set_xlabel("시도 전하 q_i")
-ax2.set_ylabel("에너지 E_i(q_i)")
-ax2.set_title("각 원자의 에너지 곡선 (χ–J 상호작용)")
-ax2.legend()
-st.pyplot(fig2)
+qeq_view()
 
 # ─────────────────────────────────────────────
 # 물리적 해석 및 결론
@@ -253,3 +242,6 @@ ReaxFF의 반응성 시뮬레이션을 가능하게 만든 핵심 구성요소
 """)
 
 st.success("🔹 λ는 단순한 상수가 아니라 ‘전하 이동이 멈춘 상태를 규정하는 공통 화학 퍼텐셜’이며, QEq는 바로 그 λ를 찾아가는 알고리즘이다.")
+
+# ─────────────────────────────────────────────
+metrics.end_page()
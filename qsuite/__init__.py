@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+Quantum Harmonic Oscillator Interactive Suite — 수치 계산 라이브러리
+────────────────────────────────────────────
+• Streamlit 페이지(pages/)에서 공통으로 쓰는 계산 코드를 모아 둔 패키지
+• 각 모듈은 Streamlit 없이도 import 가능 (NumPy / SciPy 기반)
+"""
+
+from pathlib import Path
+import os
+
+# 오프라인으로 미리 계산해 두는 표/배열의 저장 위치 (QSUITE_CACHE 환경변수로 변경 가능)
+CACHE_DIR = Path(os.environ.get("QSUITE_CACHE", Path(__file__).resolve().parent.parent / ".qsuite_cache"))
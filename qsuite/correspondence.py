@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+대응원리 수렴 스윕 — 모든 n 에 대해 |ψₙ|² 국소평균과 P_classical 의 거리
+────────────────────────────────────────────
+• u = x/x₀(n) 좌표의 고정 구간(bin)으로 |ψₙ|² 를 국소평균 → 빠른 진동을 평균화
+• 구간별 확률 pᵦ(n) 과 고전 확률 qᵦ = (2/π)[arcsin uᵦ₊₁ − arcsin uᵦ] 로
+  L1 거리 Σ|p−q| 와 KL(q‖p) = Σ q ln(q/p) 를 n = 1 … n_max 전부 계산
+• 고정된 물리 격자 x 를 조각(chunk)으로 나눠 프로세스 풀에 분배하고,
+  각 작업자는 자기 조각 위에서 n 방향 Hermite 점화식을 벡터화해 한 번에 진행
+• 결과는 CACHE_DIR 의 .npz 표로 저장 → 페이지는 표만 읽어 log–log 그래프를 그린다
+
+명령행:  python -m qsuite.correspondence --n-max 100000 --workers 8
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from qsuite import CACHE_DIR
+from qsuite import sampling
+from qsuite.hermite import _RESCALE, classical_amplitude, hermite_density
+
+U_MAX = 1.2            # 페이지 06 과 같은 표시 구간 ±1.2 x₀
+
+
+def bin_edges(bins):
+    return np.linspace(0.0, U_MAX, bins + 1)
+
+
+def classical_density(x, x0):
+    """P(x) = 1/(π√(x₀² − x²)),  |x| < x₀ (바깥은 0)."""
+    x = np.asarray(x, dtype=float)
+    P = np.zeros_like(x)
+    mask = np.abs(x) < x0
+    P[mask] = 1 / (np.pi * np.sqrt(x0**2 - x[mask] ** 2))
+    return P
+
+
+def densities(n, hbar=1.0, m=1.0, omega=1.0, max_points=4000):
+    """
+    페이지 06 의 비교 곡선: (x, |ψₙ(x)|², P_classical(x)).
+    WKB 비균일 격자에서 전체 해상도로 계산한 뒤 max_points 점으로 줄인다.
+    """
+    x0 = float(classical_amplitude(n, hbar, m, omega))
+    xi0 = np.sqrt(m * omega / hbar) * x0                   # 무차원 고전 진폭 = √(2n+1)
+    xi = sampling.wkb_grid(n, U_MAX * xi0)
+    psi2 = hermite_density(n, xi)
+    psi2 /= np.sum(0.5 * (psi2[1:] + psi2[:-1]) * np.diff(xi))
+    x, psi2 = sampling.downsample(xi * x0 / xi0, psi2 * xi0 / x0, max_points)
+    return x, psi2, classical_density(x, x0)
+
+
+def classical_bin_probabilities(bins):
+    """P(x) = 1/(π√(x₀²−x²)) 의 구간 적분 (양쪽 절반 합산, u 좌표에서 n 과 무관)."""
+    u = np.minimum(bin_edges(bins), 1.0)
+    return (2 / np.pi) * np.diff(np.arcsin(u))
+
+
+def _chunk_bin_sums(x, h, n_max, bins):
+    """
+    작업자 함수 — 격자 조각 x 에서 ψ₀ … ψ_{n_max} 를 점화식으로 진행하며
+    각 n 의 구간별 ∫|ψₙ|² dx 부분합 (n_max+1, bins) 을 돌려준다.
+    """
+    edges = bin_edges(bins)
+    x0 = classical_amplitude(np.arange(n_max + 1))
+    out = np.zeros((n_max + 1, bins))
+    sqrt2x = np.sqrt(2.0) * x
+    walls = np.append(x - 0.5 * h, x[-1] + 0.5 * h)
+    with np.errstate(under="ignore", over="ignore"):
+        log = -0.5 * x**2
+        scale = np.exp(log)
+        prev = np.zeros_like(x)
+        cur = np.full_like(x, np.pi**-0.25)
+        for k in range(n_max + 1):
+            if k > 0:
+                nxt = np.sqrt(1.0 / k) * sqrt2x * cur - np.sqrt((k - 1) / k) * prev
+                prev, cur = cur, nxt
+                big = np.abs(cur) > _RESCALE
+                if big.any():
+                    prev[big] /= _RESCALE
+                    cur[big] /= _RESCALE
+                    log[big] += np.log(_RESCALE)
+                    scale = np.exp(log)
+            # 셀 경계에서의 누적적분을 선형보간 → 구간 경계가 셀 중간에 걸려도 정확
+            csum = np.concatenate(([0.0], np.cumsum((cur * scale) ** 2)))
+            out[k] = h * np.diff(np.interp(edges * x0[k], walls, csum))
+    return out
+
+
+def sweep(n_max, bins=64, points_per_wavelength=8, chunk=20000, workers=None, progress=None):
+    """
+    n = 0 … n_max 전체에 대해 구간 확률 p (n_max+1, bins) 를 계산.
+    격자 간격은 가장 큰 n 의 국소 파장(2π/√(2n+1))을 points_per_wavelength 점으로 분해하도록 정한다.
+    progress(완료 조각 수, 전체 조각 수) 콜백으로 진행률을 받을 수 있다.
+    workers=1 이면 풀 없이 현재 스레드에서 순서대로 계산한다 (Streamlit 서버 안에서 쓰는 경로).
+    풀은 spawn 방식으로 만든다 — 스레드가 여럿인 서버 프로세스를 fork 하면 잠긴 락을 물려받아 멈출 수 있다.
+    """
+    k_max = np.sqrt(2 * n_max + 1.0)
+    h = 2 * np.pi / (k_max * points_per_wavelength)
+    L = U_MAX * float(classical_amplitude(n_max))
+    x = (np.arange(int(np.ceil(L / h))) + 0.5) * h            # 중점 격자 (|ψ|² 는 짝함수 → x ≥ 0 만)
+    pieces = [x[i:i + chunk] for i in range(0, len(x), chunk)]
+    total = np.zeros((n_max + 1, bins))
+    if workers == 1:
+        for done, p in enumerate(pieces, 1):
+            total += _chunk_bin_sums(p, h, n_max, bins)
+            if progress is not None:
+                progress(done, len(pieces))
+        return 2 * total
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(_chunk_bin_sums, p, h, n_max, bins) for p in pieces]
+        for done, fut in enumerate(as_completed(futures), 1):
+            total += fut.result()
+            if progress is not None:
+                progress(done, len(futures))
+    return 2 * total                                            # 음의 x 절반 포함
+
+
+def distances(p, bins):
+    """구간 확률 p (…, bins) 로부터 (L1, KL(q‖p)) 계산."""
+    q = classical_bin_probabilities(bins)
+    l1 = np.abs(p - q).sum(axis=-1)
+    mask = q > 0
+    with np.errstate(divide="ignore"):
+        kl = (q[mask] * (np.log(q[mask]) - np.log(p[..., mask]))).sum(axis=-1)
+    return l1, kl
+
+
+def table_path(n_max, bins):
+    return CACHE_DIR / f"correspondence_sweep_n{n_max}_b{bins}.npz"
+
+
+def build_table(n_max, bins=64, workers=None, progress=None, path=None):
+    """스윕을 실행해 n, L1, KL, 구간 확률을 .npz 로 저장하고 경로를 반환."""
+    p = sweep(n_max, bins, workers=workers, progress=progress)
+    l1, kl = distances(p, bins)
+    path = table_path(n_max, bins) if path is None else path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 임시 파일에 쓰고 원자적으로 교체 → find_tables 가 쓰다 만 표를 집어 가지 않는다
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:          # 파일 객체로 넘겨야 savez 가 .npz 를 덧붙이지 않는다
+            np.savez_compressed(f, n=np.arange(n_max + 1), l1=l1, kl=kl,
+                                p=p.astype(np.float32), q=classical_bin_probabilities(bins),
+                                edges=bin_edges(bins))
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return path
+
+
+def find_tables():
+    """저장된 스윕 표 목록 (n_max 가 큰 순)."""
+    found = sorted(CACHE_DIR.glob("correspondence_sweep_n*_b*.npz"),
+                   key=lambda f: int(f.stem.split("_n")[1].split("_")[0]), reverse=True)
+    return found
+
+
+def load_table(path):
+    with np.load(path) as data:
+        return {k: data[k] for k in data.files}
+
+
+def powerlaw_fit(n, y, n_min=10):
+    """log–log 직선 피팅 y ≈ C n^{-β}. 반환: (β, C)."""
+    mask = (n >= n_min) & (y > 0)
+    slope, intercept = np.polyfit(np.log(n[mask]), np.log(y[mask]), 1)
+    return -slope, np.exp(intercept)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="양자–고전 확률밀도 수렴 스윕 표 생성")
+    parser.add_argument("--n-max", type=int, default=100000)
+    parser.add_argument("--bins", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    report = lambda d, t: print(f"\r  chunks {d}/{t}  ({time.perf_counter() - t0:.0f} s)", end="", flush=True)
+    out = build_table(args.n_max, args.bins, args.workers, progress=report)
+    print(f"\nsaved {out}")
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+격자 데이터 내보내기 — 조각(chunk) 단위로 디스크에 쓰고, 다시 열 때는 메모리 매핑
+────────────────────────────────────────────
+• write(path, name, shape, fill, …): fill(start, stop) 이 첫 축의 [start, stop) 조각만 계산해 돌려주면
+  바로 파일에 쓰고 버린다 → 최대 메모리는 격자 전체가 아니라 조각 하나 (CHUNK_BYTES, 1000² · 200³ 격자도)
+    .h5  : HDF5 (h5py, 선택 의존성) — gzip 압축 청크 데이터셋, 압축하지 않으면 연속 배치
+    .npz : NumPy zip — .npy 항목을 스트리밍으로 써서 np.load 로 그대로 읽힌다 (ZIP_DEFLATED / ZIP_STORED)
+  좌표축과 매개변수(JSON 문자열 "params")도 같은 파일에, 임시 파일에 쓴 뒤 rename (반쯤 쓴 파일이 보이지 않게)
+• load(path): 압축하지 않은 파일은 배열마다 np.memmap — 복사 없이 열고 운영체제가 읽는 부분만 디스크에서 가져온다
+    압축 HDF5 는 h5py 데이터셋 그대로 (슬라이스할 때 그 청크만 풀림), 압축 npz 는 전부 풀어 읽을 수밖에 없다
+• 격자 정의: density_2d (페이지 04·05), density_3d (3D 등방 곱상태), correspondence_1d (페이지 06, WKB 전체 해상도)
+• download_panel: 페이지용 내려받기 위젯 — 클릭할 때 파일을 만들고 (st.download_button 의 지연 데이터)
+  파일 내용을 넘긴다 (읽고 바로 닫음). Streamlit 은 전송할 때 파일 내용을 한 번 메모리에 두므로
+  최대 메모리는 격자 두 배가 아니라 (압축된) 파일 + 조각 하나. 같은 매개변수의 파일은 EXPORT_DIR 에서 재사용
+  (기본 형식은 추가 설치가 필요 없는 npz, 파일별 잠금이라 다른 격자를 만드는 세션끼리는 기다리지 않는다)
+명령행:
+    python -m qsuite.export 04 --n-grid 2000 --format h5 --out grid.h5
+    python -m qsuite.export 04 --nz 2 --n-grid 200 --no-compress      # 3D 200³, 메모리 매핑으로 다시 열기 확인
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from qsuite import CACHE_DIR, correspondence, oscillator2d, sampling
+from qsuite.hermite import classical_amplitude, hermite_density
+
+FORMATS = ("npz", "h5")           # 첫 항목이 기본값 — h5 는 h5py 가 있어야 한다
+CHUNK_BYTES = 16 * 2**20          # fill 한 번에 계산할 조각 크기
+H5_CHUNK_BYTES = 2**20            # HDF5 청크 (압축·부분 읽기 단위)
+EXPORT_DIR = CACHE_DIR / "exports"
+GRID_SIZES = (120, 500, 1000, 2000)   # 페이지 04·05 내려받기 격자 (N×N)
+MAX_EXPORT_FILES = 32             # EXPORT_DIR 에 남겨 두는 파일 수 (오래된 것부터 삭제)
+KEEP_RECENT_SECONDS = 600         # 이보다 최근에 만들거나 건넨 파일은 개수가 넘쳐도 지우지 않는다 (전송 중일 수 있음)
+
+_lock = threading.Lock()          # _path_locks 와 _prune 보호 (파일 쓰기 동안에는 잡지 않는다)
+_path_locks = {}
+
+
+# ─────────────────────────────────────────────
+# 쓰기
+# ─────────────────────────────────────────────
+def _rows_per(shape, dtype, budget):
+    row = int(np.prod(shape[1:], dtype=np.int64)) * np.dtype(dtype).itemsize
+    return int(max(1, min(shape[0], budget // max(row, 1))))
+
+
+def _blocks(shape, rows, fill, dtype):
+    for start in range(0, shape[0], rows):
+        stop = min(start + rows, shape[0])
+        block = np.ascontiguousarray(fill(start, stop), dtype=dtype)
+        if block.shape != (stop - start,) + tuple(shape[1:]):
+            raise ValueError(f"fill({start}, {stop}) returned shape {block.shape}")
+        yield start, stop, block
+
+
+def _write_h5(tmp, name, shape, fill, axes, params, dtype, compress, rows):
+    try:
+        import h5py
+    except ImportError as exc:                       # pragma: no cover - 선택 의존성
+        raise ImportError("HDF5 export needs h5py: pip install h5py (or use the npz format)") from exc
+    with h5py.File(tmp, "w") as f:
+        f.attrs["params"] = json.dumps(params)
+        for key, value in axes.items():
+            f.create_dataset(key, data=np.asarray(value))
+        if compress:
+            chunks = (_rows_per(shape, dtype, H5_CHUNK_BYTES),) + tuple(shape[1:])
+            ds = f.create_dataset(name, shape, dtype, chunks=chunks, compression="gzip", compression_opts=4,
+                                  shuffle=True)
+        else:
+            ds = f.create_dataset(name, shape, dtype)                   # 연속 배치 → load 에서 memmap
+        for start, stop, block in _blocks(shape, rows, fill, dtype):
+            ds[start:stop] = block
+
+
+def _write_npz(tmp, name, shape, fill, axes, params, dtype, compress, rows):
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(tmp, "w", compression=method, allowZip64=True) as zf:
+        for key, value in {**axes, "params": np.array(json.dumps(params))}.items():
+            with zf.open(f"{key}.npy", "w") as fh:
+                np.lib.format.write_array(fh, np.asarray(value))
+        with zf.open(f"{name}.npy", "w", force_zip64=True) as fh:
+            header = {"descr": np.lib.format.dtype_to_descr(np.dtype(dtype)), "fortran_order": False,
+                      "shape": tuple(int(s) for s in shape)}
+            np.lib.format.write_array_header_2_0(fh, header)
+            for _, _, block in _blocks(shape, rows, fill, dtype):
+                fh.write(block.tobytes())
+
+
+def write(path, name, shape, fill, axes=None, params=None, dtype=np.float32, compress=True, chunk_bytes=CHUNK_BYTES):
+    """
+    격자 하나 (+ 좌표축, 매개변수) 를 조각 단위로 path (.h5 / .npz) 에 쓴다. 반환: path.
+    fill(start, stop) → 첫 축 [start, stop) 조각 (stop − start, *shape[1:]).
+    """
+    path = Path(path)
+    fmt = path.suffix.lstrip(".")
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format: {fmt!r}")
+    writer = _write_h5 if fmt == "h5" else _write_npz
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        writer(tmp, name, tuple(shape), fill, axes or {}, params or {}, np.dtype(dtype), compress,
+               _rows_per(shape, dtype, chunk_bytes))
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return path
+
+
+# ─────────────────────────────────────────────
+# 다시 열기 (메모리 매핑)
+# ─────────────────────────────────────────────
+def _npz_memmaps(path):
+    """ZIP_STORED 항목의 .npy 는 zip 안에 그대로 놓여 있다 → 로컬 헤더 뒤 데이터 위치에서 memmap."""
+    out = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as fh:
+        for info in zf.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                return None
+            fh.seek(info.header_offset + 26)
+            n_name, n_extra = np.frombuffer(fh.read(4), dtype="<u2")
+            fh.seek(info.header_offset + 30 + int(n_name) + int(n_extra))
+            version = np.lib.format.read_magic(fh)
+            shape, fortran, dtype = (np.lib.format.read_array_header_1_0(fh) if version == (1, 0)
+                                     else np.lib.format.read_array_header_2_0(fh))
+            key = info.filename.removesuffix(".npy")
+            if dtype.hasobject:
+                raise ValueError(f"object array in export file: {key!r}")
+            out[key] = np.memmap(path, dtype=dtype, mode="r", offset=fh.tell(), shape=shape,
+                                 order="F" if fortran else "C")
+    return out
+
+
+def load(path):
+    """
+    {이름: 배열, "params": dict} — 압축하지 않은 파일은 np.memmap (읽기 전용, 복사 없음),
+    압축 HDF5 는 h5py.Dataset (슬라이스할 때 읽음, 파일은 데이터셋이 살아 있는 동안 열려 있다),
+    압축 npz 는 메모리로 읽은 배열.
+    """
+    path = Path(path)
+    if path.suffix == ".h5":
+        import h5py
+
+        f = h5py.File(path, "r")
+        out = {"params": json.loads(f.attrs.get("params", "{}"))}
+        for key, ds in f.items():
+            offset = ds.id.get_offset() if ds.chunks is None and ds.compression is None else None
+            out[key] = (np.memmap(path, dtype=ds.dtype, mode="r", offset=offset, shape=ds.shape)
+                        if offset is not None else ds)
+        return out
+    if path.suffix == ".npz":
+        out = _npz_memmaps(path)
+        if out is None:
+            with np.load(path) as data:
+                out = {k: data[k] for k in data.files}
+        out["params"] = json.loads(str(out["params"][()]))
+        return out
+    raise ValueError(f"unknown export format: {path.suffix!r}")
+
+
+# ─────────────────────────────────────────────
+# 격자 정의 → write(path, **spec)
+# ─────────────────────────────────────────────
+def density_2d(n1, n2, omega1=1.0, omega2=1.0, extent=3.0, n_grid=120, hbar=1.0, m=1.0):
+    """페이지 04·05 의 |Ψₙ₁ₙ₂(X, Y)|² — 행 = Y, 열 = X (precompute.density_grid 와 같은 배치)."""
+    v = np.linspace(-extent, extent, n_grid)
+    fill = lambda a, b: oscillator2d.density(n1, n2, v[None, :], v[a:b, None], omega1, omega2, hbar, m)
+    return dict(name="density", shape=(n_grid, n_grid), fill=fill, axes=dict(x=v, y=v),
+                params=dict(n1=n1, n2=n2, omega1=float(omega1), omega2=float(omega2), hbar=hbar, m=m))
+
+
+def density_3d(nx, ny, nz, extent=4.0, n_grid=200):
+    """3D 등방 곱상태 |ψ_{nx}(x) ψ_{ny}(y) ψ_{nz}(z)|² (무차원) — 배열 축 순서 (z, y, x)."""
+    v = np.linspace(-extent, extent, n_grid)
+    plane = np.outer(oscillator2d.axis_wavefunction(ny, v), oscillator2d.axis_wavefunction(nx, v))
+    psi_z = oscillator2d.axis_wavefunction(nz, v)
+    fill = lambda a, b: (psi_z[a:b, None, None] * plane[None]) ** 2
+    return dict(name="density", shape=(n_grid, n_grid, n_grid), fill=fill, axes=dict(x=v, y=v, z=v),
+                params=dict(nx=nx, ny=ny, nz=nz))
+
+
+def correspondence_1d(n, hbar=1.0, m=1.0, omega=1.0):
+    """페이지 06 의 |ψₙ(x)|² 와 고전 P(x) — 화면용으로 줄이기 전 WKB 비균일 격자 전체 (n = 10⁵ 이면 약 80만 점)."""
+    x0 = float(classical_amplitude(n, hbar, m, omega))
+    xi0 = np.sqrt(m * omega / hbar) * x0
+    xi = sampling.wkb_grid(n, correspondence.U_MAX * xi0)
+    x = xi * x0 / xi0
+    fill = lambda a, b: np.stack([hermite_density(n, xi[a:b]) * xi0 / x0,
+                                  correspondence.classical_density(x[a:b], x0)], axis=1)
+    return dict(name="density", shape=(len(x), 2), fill=fill, axes=dict(x=x),
+                params=dict(n=n, hbar=hbar, m=m, omega=omega, columns=["psi2", "classical"]))
+
+
+# ─────────────────────────────────────────────
+# 페이지 내려받기 (Streamlit)
+# ─────────────────────────────────────────────
+def _prune():
+    """파일 수가 MAX_EXPORT_FILES 를 넘으면 오래된 것부터 지운다 — 최근 KEEP_RECENT_SECONDS 안에 쓴 파일과
+    다른 세션이 만들고 있는 파일은 남긴다. _lock 을 잡고 호출."""
+    stamped = []
+    for f in (f for fmt in FORMATS for f in EXPORT_DIR.glob(f"*.{fmt}")):
+        try:
+            stamped.append((f.stat().st_mtime, f))
+        except FileNotFoundError:
+            continue
+    stamped.sort()
+    cutoff = time.time() - KEEP_RECENT_SECONDS
+    for mtime, f in stamped[: max(0, len(stamped) - MAX_EXPORT_FILES)]:
+        if mtime < cutoff and f not in _path_locks:
+            f.unlink(missing_ok=True)
+
+
+def cached_file(stem, spec, fmt="npz", compress=True):
+    """
+    EXPORT_DIR/<stem>.<fmt> — 없을 때만 조각 단위로 만든다 (같은 매개변수는 세션 간 재사용).
+    같은 파일은 한 세션만 만들고 나머지는 기다렸다가 그 파일을 쓴다. 다른 파일을 만드는 세션은 서로 막지 않는다.
+    """
+    path = EXPORT_DIR / f"{stem}{'' if compress else '_raw'}.{fmt}"
+    with _lock:
+        path_lock = _path_locks.setdefault(path, threading.Lock())
+    try:
+        with path_lock:
+            if path.exists():
+                os.utime(path)                      # 건네는 파일은 최근 것으로 → _prune 이 지우지 않는다
+            else:
+                write(path, compress=compress, **spec)
+    finally:
+        with _lock:
+            _path_locks.pop(path, None)
+            _prune()
+    return path
+
+
+def download_panel(stem, build, sizes=None, key="export"):
+    """
+    페이지 fragment 안의 내려받기 위젯. build(n_grid) → 격자 정의 (sizes 가 None 이면 build()).
+    파일은 버튼을 누를 때 만들어진다.
+    """
+    import streamlit as st
+
+    with st.expander("💾 격자 내려받기 (NPZ / HDF5)", expanded=False):
+        cols = st.columns(3 if sizes else 2)
+        fmt = cols[0].radio("형식", FORMATS, horizontal=True, key=f"{key}_fmt")
+        compress = cols[1].checkbox("압축", value=True, key=f"{key}_compress",
+                                    help="끄면 파일은 커지지만 qsuite.export.load 가 복사 없이 메모리 매핑으로 연다")
+        n_grid = cols[2].select_slider("격자 (N×N)", options=sizes, key=f"{key}_grid") if sizes else None
+        spec = build(n_grid) if sizes else build()
+        stem = f"{stem}_g{n_grid}" if sizes else stem
+        size = int(np.prod(spec["shape"], dtype=np.int64)) * 4
+        st.download_button(f"⬇️ {stem}.{fmt}  (float32 {size / 2**20:.1f} MB{', 압축 전' if compress else ''})",
+                           data=lambda: cached_file(stem, spec, fmt, compress).read_bytes(),
+                           file_name=f"{stem}.{fmt}",
+                           mime="application/x-hdf5" if fmt == "h5" else "application/zip",
+                           on_click="ignore", key=f"{key}_download")
+        st.caption("다시 열기: `from qsuite import export; d = export.load(path)` → d['density'], d['x'], d['params']")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="페이지 격자를 조각 단위로 HDF5 / NPZ 파일에 쓰고 다시 열어 확인")
+    parser.add_argument("page", choices=["04", "05", "06"])
+    parser.add_argument("--n1", "--nx", type=int, default=1)
+    parser.add_argument("--n2", "--ny", type=int, default=1)
+    parser.add_argument("--nz", type=int, help="페이지 04 만: 주면 3D 등방 곱상태 (n_grid³)")
+    parser.add_argument("--gamma", type=float, default=1.0, help="페이지 05 결합강도")
+    parser.add_argument("--n", type=int, default=1000, help="페이지 06 양자수")
+    parser.add_argument("--n-grid", type=int, default=1000)
+    parser.add_argument("--format", choices=FORMATS, default="npz")
+    parser.add_argument("--no-compress", action="store_true")
+    parser.add_argument("--out", type=Path)
+    args = parser.parse_args()
+
+    if args.page == "06":
+        spec = correspondence_1d(args.n)
+    elif args.page == "04" and args.nz is not None:
+        spec = density_3d(args.n1, args.n2, args.nz, n_grid=args.n_grid)
+    else:
+        w1, w2 = oscillator2d.effective_frequencies(args.gamma) if args.page == "05" else (1.0, 1.0)
+        spec = density_2d(args.n1, args.n2, w1, w2, n_grid=args.n_grid)
+    out = args.out or Path(f"qsuite_{args.page}_{'x'.join(map(str, spec['shape']))}.{args.format}")
+    t0 = time.perf_counter()
+    write(out, compress=not args.no_compress, **spec)
+    t1 = time.perf_counter()
+    grid = load(out)["density"]
+    total = float(np.sum(grid, dtype=np.float64))
+    print(f"{out}: {spec['shape']} float32 {np.prod(spec['shape']) * 4 / 2**20:.1f} MB → "
+          f"file {out.stat().st_size / 2**20:.1f} MB in {t1 - t0:.2f} s · reopened as {type(grid).__name__}, "
+          f"sum {total:.6g} ({time.perf_counter() - t1:.2f} s)")
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+절단된 수 기저(Fock) 희소 연산자와 시간 전개
+────────────────────────────────────────────
+• 기저 |0⟩ … |dim−1⟩ (dim ~ 10⁵ 까지),  a = Σ √n |n−1⟩⟨n| (부대각),  a† = aᵀ,  N = a†a (대각)
+• x = √(ħ/2mω) (a + a†),  p = i√(ħmω/2) (a† − a)  — 주대각이 0 인 3중대각
+• H = ħω(N + ½) − F x + λ x⁴  — 구동(3중대각)·비조화(띠 폭 4) 항을 더해도 nnz ∝ dim
+• 절단 효과: x², p² 의 마지막 대각 성분은 잘린 기저 밖의 상태를 빠뜨린다
+  → p²/2m + ½mω²x² 로 만든 H 는 n = 0 … dim−2 에서 정확히 (n+½)ħω 이고,
+    가짜 준위 하나가 스펙트럼 한가운데 (≈ (dim−1)ħω/2) 에 생긴다
+• 시간 전개: 행렬 지수 없이 e^{−iHt/ħ}ψ 만 — Krylov(짧은 반복 Lanczos) 전파, 비용 ∝ nnz × 단계 수
+  (ψ 가 차지한 창의 nnz 만 — dim = 10⁵ 기저에서도 낮은 상태의 전개 비용은 dim 과 무관)
+  (scipy expm_multiply 는 ‖H‖₁ ∝ dim 에 비례해 단계가 늘어 큰 기저에서 dim² — 교차 검증용으로만)
+    evolve        : 시간에 무관한 H, 주어진 시각들에서
+    evolve_driven : H(t) = H₀ + f(t) V 를 구간 중점에서 상수로 근사하며 한 단계씩 (생성기)
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.linalg import eigh_tridiagonal
+from scipy.sparse.linalg import eigsh, expm_multiply
+from scipy.special import gammaln
+
+
+# ─────────────────────────────────────────────
+# 연산자
+# ─────────────────────────────────────────────
+def annihilation(dim):
+    """a (CSR)."""
+    return sparse.diags(np.sqrt(np.arange(1.0, dim)), offsets=1, format="csr")
+
+
+def creation(dim):
+    return annihilation(dim).T.tocsr()
+
+
+def number(dim):
+    return sparse.diags(np.arange(float(dim)), format="csr")
+
+
+def position(dim, hbar=1.0, m=1.0, omega=1.0):
+    a = annihilation(dim)
+    return np.sqrt(hbar / (2 * m * omega)) * (a + a.T)
+
+
+def momentum(dim, hbar=1.0, m=1.0, omega=1.0):
+    a = annihilation(dim)
+    return 1j * np.sqrt(hbar * m * omega / 2) * (a.T - a)
+
+
+def hamiltonian(dim, hbar=1.0, m=1.0, omega=1.0, force=0.0, quartic=0.0):
+    """ħω(N + ½) − F x + λ x⁴ (실수 대칭, CSR)."""
+    H = sparse.diags(hbar * omega * (np.arange(dim) + 0.5), format="csr")
+    if force or quartic:
+        x = position(dim, hbar, m, omega)
+        if force:
+            H = H - force * x
+        if quartic:
+            x2 = x @ x
+            H = H + quartic * (x2 @ x2)
+    return H.tocsr()
+
+
+def hamiltonian_xp(dim, hbar=1.0, m=1.0, omega=1.0):
+    """p²/2m + ½mω²x² 를 x, p 행렬로 직접 조립 (5중대각) — 절단 효과 확인용."""
+    x = position(dim, hbar, m, omega)
+    p = momentum(dim, hbar, m, omega)
+    return ((p @ p).real / (2 * m) + 0.5 * m * omega**2 * (x @ x)).tocsr()
+
+
+# ─────────────────────────────────────────────
+# 스펙트럼
+# ─────────────────────────────────────────────
+def lowest_levels(H, k, sigma=None):
+    """
+    실수 대칭 H 의 가장 낮은 k 개 고유값 — shift-invert Lanczos (띠 행렬의 LU 는 비용 ∝ nnz).
+    σ 는 스펙트럼 바닥 바로 아래여야 한다 (기본: 대각 최솟값 − 1, 조화진동자 계열에서 충분).
+    """
+    H = sparse.csc_matrix(H.real if np.iscomplexobj(H) else H)
+    sigma = float(H.diagonal().min()) - 1.0 if sigma is None else sigma
+    return np.sort(eigsh(H, k=min(k, H.shape[0] - 1), sigma=sigma, which="LM", return_eigenvectors=False))
+
+
+def check_spectrum(dim, k=20, hbar=1.0, m=1.0, omega=1.0):
+    """
+    x, p 로 조립한 H 의 낮은 k 준위와 해석해 Eₙ = (n+½)ħω 비교 (k < dim/2 이면 가짜 준위와 무관).
+    반환: (수치 준위, 해석 준위, 최대 상대오차)
+    """
+    E = lowest_levels(hamiltonian_xp(dim, hbar, m, omega), k, sigma=0.0)
+    exact = hbar * omega * (np.arange(E.size) + 0.5)
+    return E, exact, float(np.max(np.abs(E - exact) / exact))
+
+
+# ─────────────────────────────────────────────
+# 상태와 기댓값
+# ─────────────────────────────────────────────
+def fock_state(dim, n):
+    psi = np.zeros(dim, dtype=complex)
+    psi[n] = 1.0
+    return psi
+
+
+def coherent_state(dim, alpha):
+    """|α⟩ = e^{−|α|²/2} Σ αⁿ/√n! |n⟩ (로그로 계산, dim 에서 절단 후 재정규화)."""
+    n = np.arange(dim)
+    if alpha == 0:
+        return fock_state(dim, 0)
+    log_mag = -0.5 * abs(alpha) ** 2 + n * np.log(abs(alpha)) - 0.5 * gammaln(n + 1)
+    psi = np.exp(log_mag + 1j * n * np.angle(alpha))
+    return psi / np.linalg.norm(psi)
+
+
+def expect(op, psi):
+    """⟨ψ|A|ψ⟩ — psi 가 (dim, T) 이면 열마다."""
+    return np.real(np.sum(np.conj(psi) * (op @ psi), axis=0))
+
+
+# ─────────────────────────────────────────────
+# 시간 전개
+# ─────────────────────────────────────────────
+def _bandwidth(H):
+    rows = np.repeat(np.arange(H.shape[0]), np.diff(H.indptr))
+    return int(np.max(np.abs(rows - H.indices))) if H.nnz else 0
+
+
+def _lanczos(H, psi, krylov_dim):
+    """정규직교 Krylov 기저 V (k, n), 3중대각 (α, β), 다음 잔차 노름, ‖ψ‖ — 완전 재직교화."""
+    norm = np.linalg.norm(psi)
+    V = np.empty((krylov_dim, psi.size), dtype=complex)
+    V[0] = psi / norm
+    alpha, beta = [], []
+    for j in range(krylov_dim):
+        w = H @ V[j]
+        alpha.append(np.vdot(V[j], w).real)
+        w -= V[: j + 1].T @ np.conj(V[: j + 1] @ np.conj(w))
+        b = np.linalg.norm(w)
+        if j == krylov_dim - 1 or b < 1e-12 * max(1.0, abs(alpha[-1])):
+            return V[: j + 1], np.array(alpha), np.array(beta), b, norm
+        beta.append(b)
+        V[j + 1] = w / b
+
+
+def propagate(H, psi, t, hbar=1.0, krylov_dim=30, tol=1e-10):
+    """
+    e^{−iHt/ħ}ψ — 짧은 반복 Lanczos. Krylov 부분공간 안에서 지수를 계산하고, 잔차 추정
+    β_k |c_k| 가 tol 을 넘으면 소단계를 반으로 줄인다.
+    k 차 Krylov 벡터는 ψ 의 지지 구간에서 k × 띠폭 이상 퍼지지 않으므로 그 창의 H 만 잘라 쓴다
+    (정확히 같은 결과) — 비용 ∝ 창 안의 nnz, 소단계 크기는 ‖H‖ 가 아니라 국소 에너지 폭으로 정해진다.
+    지지 구간은 |ψₙ| ≥ tol/√dim 인 성분 — 그 아래 꼬리 (버리는 노름 ≤ tol) 는 매 단계 0 으로 자른다.
+    남겨 두면 반올림 수준의 성분이 단계마다 창 끝으로 번져, λx⁴ 처럼 대각에서 멀어질수록 커지는 H 에서는
+    창이 기저 전체가 되고 소단계가 ‖H‖ ∝ λ·dim² 로 줄어든다.
+    """
+    H = sparse.csr_matrix(H)
+    reach = krylov_dim * max(1, _bandwidth(H))
+    psi = np.array(psi, dtype=complex)
+    floor = tol / np.sqrt(psi.size)
+    done, h = 0.0, t
+    while done < t:
+        h = min(h, t - done)
+        small = np.abs(psi) < floor
+        psi[small] = 0.0
+        support = np.flatnonzero(~small)
+        lo, hi = max(support[0] - reach, 0), min(support[-1] + 1 + reach, psi.size)
+        V, alpha, beta, resid, norm = _lanczos(H[lo:hi, lo:hi], psi[lo:hi], krylov_dim)
+        e, U = eigh_tridiagonal(alpha, beta) if beta.size else (alpha, np.ones((1, 1)))
+        while True:
+            c = U @ (np.exp(-1j * e * h / hbar) * U[0])
+            if resid * abs(c[-1]) <= tol or resid < 1e-12:
+                break
+            h *= 0.5
+        psi = np.zeros_like(psi)
+        psi[lo:hi] = norm * (V.T @ c)
+        done += h
+        h *= 1.5
+    return psi
+
+
+def evolve(H, psi0, times, hbar=1.0, method="lanczos"):
+    """
+    시각 times 에서 e^{−iHt/ħ}ψ₀ → (dim, len(times)).
+    method="lanczos" (기본, 비균일 격자 가능) 또는 "expm_multiply" (scipy, 균일 격자 —
+    Al-Mohy–Higham 급수라 비용이 ‖H‖₁ ∝ dim 에 비례해 작은 기저의 교차 검증용).
+    """
+    times = np.asarray(times, dtype=float)
+    if method == "expm_multiply":
+        if times.size > 2 and not np.allclose(np.diff(times), times[1] - times[0]):
+            raise ValueError("expm_multiply needs uniformly spaced times")
+        out = expm_multiply(-1j / hbar * sparse.csr_matrix(H), psi0, start=times[0], stop=times[-1],
+                            num=times.size, endpoint=True)
+        return np.asarray(out).T
+    if method != "lanczos":
+        raise ValueError(f"unknown method: {method!r}")
+    H = sparse.csr_matrix(H)
+    out = np.empty((len(psi0), times.size), dtype=complex)
+    psi = propagate(H, psi0, times[0], hbar) if times[0] else np.asarray(psi0, dtype=complex)
+    out[:, 0] = psi
+    for i in range(1, times.size):
+        psi = propagate(H, psi, times[i] - times[i - 1], hbar)
+        out[:, i] = psi
+    return out
+
+
+def evolve_driven(H0, V, psi0, f, t_max, steps, hbar=1.0):
+    """
+    H(t) = H₀ + f(t) V 아래 ψ(t) 를 (t, ψ) 로 한 단계씩 내보낸다 (t = 0 포함, steps + 1 개).
+    각 단계 dt 는 중점 f(t + dt/2) 로 고정한 H 로 전개한다 (dt 에 대해 2차 정확).
+    """
+    dt = t_max / steps
+    H0 = sparse.csr_matrix(H0)
+    V = sparse.csr_matrix(V)
+    psi = np.asarray(psi0, dtype=complex)
+    yield 0.0, psi
+    for i in range(steps):
+        psi = propagate(H0 + f((i + 0.5) * dt) * V, psi, dt, hbar)
+        yield (i + 1) * dt, psi
+
+
+def driven_classical(t, F0, Omega, m=1.0, omega=1.0):
+    """
+    정지 상태에서 시작한 mẍ = −mω²x + F₀ cos Ωt 의 해 (⟨x⟩ 의 에렌페스트 기준값).
+    Ω = ω 이면 공명해 F₀ t sin ωt / (2mω).
+    """
+    t = np.asarray(t, dtype=float)
+    if np.isclose(Omega, omega):
+        return F0 * t * np.sin(omega * t) / (2 * m * omega)
+    return F0 / (m * (omega**2 - Omega**2)) * (np.cos(Omega * t) - np.cos(omega * t))
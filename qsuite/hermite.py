@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+정규화된 Hermite 함수 ψₙ(x) — 안정한 3항 점화식
+────────────────────────────────────────────
+• ψₙ(x) = (2ⁿ n! √π)^{-1/2} Hₙ(x) e^{-x²/2}  (ħ = m = ω = 1 무차원 좌표)
+• Hₙ 과 n! 을 따로 계산하면 n ≳ 170 에서 overflow → 정규화된 점화식을 직접 사용
+    ψ₀ = π^{-1/4} e^{-x²/2},   ψ₁ = √2 x ψ₀
+    ψₙ₊₁ = √(2/(n+1)) x ψₙ − √(n/(n+1)) ψₙ₋₁
+• e^{-x²/2} 가 언더플로하는 큰 |x| 에서도 동작하도록 지수부를 로그로 분리해 전개
+"""
+
+import numpy as np
+from scipy.special import airy
+
+_RESCALE = 1e150
+
+
+def _recurrence(n_max, x):
+    """(n, 스케일된 ψₙ, 로그 스케일) 을 n = 0 … n_max 순서로 내보낸다. ψₙ = s·e^{log}."""
+    x = np.asarray(x, dtype=float)
+    log = -0.5 * x**2
+    prev = np.zeros_like(x)
+    cur = np.full_like(x, np.pi**-0.25)
+    yield 0, cur, log
+    sqrt2x = np.sqrt(2.0) * x
+    for k in range(n_max):
+        nxt = np.sqrt(1.0 / (k + 1)) * sqrt2x * cur - np.sqrt(k / (k + 1)) * prev
+        prev, cur = cur, nxt
+        big = np.abs(cur) > _RESCALE
+        if big.any():
+            prev = np.where(big, prev / _RESCALE, prev)
+            cur = np.where(big, cur / _RESCALE, cur)
+            log = log + np.where(big, np.log(_RESCALE), 0.0)
+        yield k + 1, cur, log
+
+
+def hermite_function(n, x):
+    """단일 ψₙ(x). 임의 크기의 n 에서도 overflow 없이 계산된다 (비용 O(n·len(x)))."""
+    for _, s, log in _recurrence(n, x):
+        pass
+    with np.errstate(under="ignore"):
+        return s * np.exp(log)
+
+
+def hermite_functions(n_max, x, dtype=float):
+    """ψ₀ … ψ_{n_max} 를 한 번에 계산한 (n_max+1, len(x)) 표."""
+    x = np.asarray(x, dtype=float)
+    out = np.empty((n_max + 1,) + x.shape, dtype=dtype)
+    with np.errstate(under="ignore"):
+        for k, s, log in _recurrence(n_max, x):
+            out[k] = s * np.exp(log)
+    return out
+
+
+def classical_amplitude(n, hbar=1.0, m=1.0, omega=1.0):
+    """고전 진폭 x₀ = √(2ħ(n+½)/(mω)) — E_n = ½mω²x₀²."""
+    return np.sqrt(2 * (np.asarray(n) + 0.5) * hbar / (m * omega))
+
+
+# ─────────────────────────────────────────────
+# 큰 n — 균일 WKB (Langer/Airy) 점근식
+# ─────────────────────────────────────────────
+def _action(x, x0):
+    """전환점 x₀ 에서 잰 작용적분: 허용영역 ∫_x^{x₀} k dt, 금지영역 ∫_{x₀}^x κ dt (x ≥ 0)."""
+    inside = x < x0
+    u = np.clip(x / x0, 0.0, None)
+    with np.errstate(invalid="ignore"):
+        s_in = 0.5 * x0**2 * (np.arccos(np.minimum(u, 1.0)) - u * np.sqrt(np.maximum(1 - u**2, 0.0)))
+        s_out = 0.5 * x0**2 * (u * np.sqrt(np.maximum(u**2 - 1, 0.0)) - np.arccosh(np.maximum(u, 1.0)))
+    return np.where(inside, s_in, s_out), inside
+
+
+def hermite_function_asymptotic(n, x):
+    """
+    ψₙ(x) ≈ √2 (ζ/(x² − x₀²))^{1/4} Ai(ζ),  x₀² = 2n+1,
+    ζ = ∓(3S/2)^{2/3} (허용/금지 영역). 전환점 부근까지 균일하게 유효하며
+    상대오차는 O(1/n) — 점화식 비용 O(n·len(x)) 없이 O(len(x)) 로 계산된다.
+    """
+    x = np.asarray(x, dtype=float)
+    ax = np.abs(x)
+    x0 = np.sqrt(2.0 * n + 1.0)
+    S, inside = _action(ax, x0)
+    zeta = np.where(inside, -1.0, 1.0) * (1.5 * S) ** (2.0 / 3.0)
+    d = ax**2 - x0**2
+    near = np.abs(d) < 1e-8 * x0**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(near, (2 * x0) ** (-2.0 / 3.0), zeta / np.where(near, 1.0, d))
+    psi = np.sqrt(2.0) * ratio**0.25 * airy(zeta)[0]
+    return np.where(x < 0, (-1) ** n, 1) * psi
+
+
+def hermite_density(n, x, budget=5e7):
+    """
+    |ψₙ(x)|². n·len(x) 가 budget 이하이면 정확한 점화식, 넘으면 균일 WKB 점근식.
+    (점근식은 n ≳ 10³ 에서 그래프상 구별되지 않는다.)
+    """
+    x = np.asarray(x, dtype=float)
+    if n * x.size <= budget or n < 1000:
+        return hermite_function(n, x) ** 2
+    return hermite_function_asymptotic(n, x) ** 2
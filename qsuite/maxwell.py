@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+맥스웰–볼츠만 분포 — 활성화 분율 & 아레니우스 엔진
+────────────────────────────────────────────
+• E > E_a 꼬리 면적(반응 가능한 분자 비율)을 닫힌 형태(erf/erfc, 불완전 감마)로 계산
+• (T, E_a) 격자 전체를 한 번의 호출로 벡터화 처리 (10⁶ 쌍 수준)
+• 충돌이론 선행인자 · 속도상수 · 아레니우스 플롯/피팅
+• 수치적분(quad)은 검증용 경로로만 사용
+"""
+
+import numpy as np
+from scipy import integrate, special
+
+kB = 1.380649e-23          # 볼츠만 상수 (J/K)
+N_A = 6.02214076e23        # 아보가드로 수 (1/mol)
+R_GAS = kB * N_A           # 기체상수 (J/(mol·K))
+
+
+# ─────────────────────────────────────────────
+# 기본 분포
+# ─────────────────────────────────────────────
+def speed_pdf(v, T, m):
+    """3차원 속력 분포 f(v) (페이지 100의 식과 동일)."""
+    v = np.asarray(v, dtype=float)
+    a = m / (2 * kB * T)
+    return 4 * np.pi * (a / np.pi) ** 1.5 * v**2 * np.exp(-a * v**2)
+
+
+def energy_pdf(E, T, dof=3):
+    """
+    운동에너지 분포 f(E) — 자유도 dof 인 감마 분포 Γ(dof/2, k_BT).
+    dof=3 이면 f(E) = 2√(E/π) (k_BT)^{-3/2} e^{-E/k_BT}.
+    E = 0 에서는 극한값: dof=2 이면 1/k_BT, dof>2 이면 0 (dof=1 은 발산하므로 0 으로 둔다).
+    """
+    E = np.asarray(E, dtype=float)
+    kT = kB * np.asarray(T, dtype=float)
+    s = 0.5 * dof
+    x = E / kT
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logf = (s - 1) * np.log(x) - x - special.gammaln(s) - np.log(kT)
+    limit = 1.0 / kT if s == 1 else 0.0
+    return np.where(x > 0, np.exp(logf), limit)
+
+
+def characteristic_speeds(T, m):
+    """v_mp, v_mean, v_rms (브로드캐스팅 지원)."""
+    kT = kB * np.asarray(T, dtype=float)
+    return (np.sqrt(2 * kT / m),
+            np.sqrt(8 * kT / (np.pi * m)),
+            np.sqrt(3 * kT / m))
+
+
+# ─────────────────────────────────────────────
+# 꼬리 분율 (E > E_a)
+# ─────────────────────────────────────────────
+def reduced_energy(T, Ea):
+    """x = E_a / k_BT (E_a 단위: J/분자). 두 입력은 서로 브로드캐스팅된다."""
+    T, Ea = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(Ea, dtype=float))
+    return Ea / (kB * T)
+
+
+def _log_tail_reduced(x, dof):
+    # 닫힌 형태: erfc(√x) = erfcx(√x)·e^{-x} 로 분리해 지수부를 로그로 따로 다룬다
+    x = np.maximum(np.asarray(x, dtype=float), 0.0)
+    if dof == 1:
+        return -x + np.log(special.erfcx(np.sqrt(x)))
+    if dof == 2:
+        return -x
+    if dof == 3:
+        r = np.sqrt(x)
+        return -x + np.log(special.erfcx(r) + 2 * r / np.sqrt(np.pi))
+    if dof == 4:
+        return -x + np.log1p(x)
+    # 일반 자유도: 정규화된 상부 불완전 감마 Q(dof/2, x)
+    with np.errstate(divide="ignore"):
+        return np.log(special.gammaincc(0.5 * dof, x))
+
+
+def log_tail_fraction(T, Ea, dof=3):
+    """ln P(E > E_a). e^{-x}가 언더플로하는 큰 E_a/k_BT 에서도 유한하다."""
+    return _log_tail_reduced(reduced_energy(T, Ea), dof)
+
+
+def tail_fraction(T, Ea, dof=3):
+    """
+    P(E > E_a) — 분포에서 E_a 이상의 면적.
+
+    dof=1 : erfc(√x)
+    dof=2 : e^{-x}                       (아레니우스 지수항)
+    dof=3 : erfc(√x) + 2√(x/π) e^{-x}    (3차원 기체, 페이지 100)
+    기타  : Q(dof/2, x) = Γ(dof/2, x) / Γ(dof/2)
+    """
+    return np.exp(log_tail_fraction(T, Ea, dof))
+
+
+def tail_fraction_quad(T, Ea, dof=3):
+    """검증용 — f(E)를 scipy.integrate.quad 로 직접 적분 (느림, 원소별 루프)."""
+    T, Ea = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(Ea, dtype=float))
+    out = np.empty(T.shape)
+    for idx in np.ndindex(T.shape):
+        kT = kB * T[idx]
+        # 무차원 변수 x=E/k_BT 에서 적분해야 quad 의 허용오차가 의미를 갖는다
+        g = lambda x: energy_pdf(x * kT, T[idx], dof) * kT
+        out[idx] = integrate.quad(g, Ea[idx] / kT, np.inf, epsabs=0, epsrel=1e-12)[0]
+    return out
+
+
+# ─────────────────────────────────────────────
+# 충돌이론 · 아레니우스
+# ─────────────────────────────────────────────
+def collision_prefactor(T, m, sigma, m2=None):
+    """
+    충돌이론 선행인자 A(T) = σ ⟨v_rel⟩ = σ √(8k_BT/(πμ))  (단위: m³/s).
+    m2 를 주지 않으면 동종 입자 (μ = m/2).
+    """
+    m2 = m if m2 is None else m2
+    mu = m * m2 / (m + m2)
+    return sigma * np.sqrt(8 * kB * np.asarray(T, dtype=float) / (np.pi * mu))
+
+
+def rate_constant(T, Ea, m, sigma, model="line_of_centers", m2=None):
+    """
+    분자당 속도상수 k(T) (m³/s). 충돌 플럭스로 가중한 상대에너지 분포 ε e^{-ε} (ε = E/k_BT) 로
+    k = A(T) ∫ (σ(E)/σ) ε e^{-ε} dε 를 적분한 닫힌 형태:
+
+    model="line_of_centers" : σ(E) = σ(1 − E_a/E)  → ∫_x^∞ (ε − x) e^{-ε} dε = e^{-x},  k = A(T)·e^{-x}
+    model="hard_threshold"  : E > E_a 에서 σ(E) = σ  → ∫_x^∞ ε e^{-ε} dε = e^{-x}(1+x) = Q(2, x)
+    """
+    A = collision_prefactor(T, m, sigma, m2)
+    if model == "line_of_centers":
+        return A * tail_fraction(T, Ea, dof=2)
+    if model == "hard_threshold":
+        return A * tail_fraction(T, Ea, dof=4)
+    raise ValueError(f"unknown model: {model!r}")
+
+
+def arrhenius_plot_data(T, Ea, m, sigma, model="line_of_centers"):
+    """아레니우스 플롯용 (1/T, ln k). T 는 1차원, Ea 는 스칼라 또는 (k,1) 열벡터."""
+    T = np.asarray(T, dtype=float)
+    x = reduced_energy(T, Ea)
+    lnA = np.log(collision_prefactor(T, m, sigma))
+    if model == "line_of_centers":
+        lnk = lnA - x
+    elif model == "hard_threshold":
+        lnk = lnA + _log_tail_reduced(x, 4)
+    else:
+        raise ValueError(f"unknown model: {model!r}")
+    return 1.0 / T, lnk
+
+
+def arrhenius_fit(T, lnk):
+    """
+    ln k = ln A − E_a,app / (k_B T) 최소제곱 피팅.
+    lnk 의 마지막 축이 T 에 대응하며, 앞쪽 축들은 한 번에 배치 처리된다.
+    반환: (E_a,app [J/분자], ln A)
+    """
+    u = 1.0 / np.asarray(T, dtype=float)
+    lnk = np.asarray(lnk, dtype=float)
+    du = u - u.mean()
+    slope = (lnk * du).sum(axis=-1) / (du**2).sum()
+    intercept = lnk.mean(axis=-1) - slope * u.mean()
+    return -slope * kB, intercept
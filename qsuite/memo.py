@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+세션 간 공유 계산 캐시 — 항목 수·TTL·프로세스 메모리 예산
+────────────────────────────────────────────
+• Streamlit 서버는 한 프로세스에서 모든 세션을 스레드로 돌린다 → 이 모듈의 저장소는 프로세스당 하나
+  (st.cache_resource 와 같은 공유 자원 방식 — 결과를 복사하지 않고 같은 객체를 모든 세션에 준다.
+   st.cache_data 는 세션마다 pickle 복사본을 만들고 항목 수·메모리 상한이 없다)
+• 공유되므로 결과의 NumPy 배열은 읽기 전용으로 바꿔 저장 — 호출자는 수정하려면 복사해야 한다
+• 키: (파일·함수 이름, 인자) — 인자는 시그니처에 맞춰 기본값까지 채운 뒤 비교하므로 f(1) 과 f(1, n=120) 이 같고,
+  실수는 유효숫자 12 자리로 반올림해 슬라이더 값의 부동소수 잡음으로
+  같은 계산이 다른 키가 되지 않게 하고, 배열 인자는 내용의 해시로
+• 상한: 함수별 max_entries, 항목별 ttl (초), 전체 바이트 예산 (QSUITE_CACHE_MB, 기본 512 MB)
+  → 넘치면 가장 오래 쓰지 않은 항목부터 (LRU) 제거
+• 같은 키를 여러 세션이 동시에 요청하면 한 스레드만 계산하고 나머지는 그 결과를 기다린다
+• stats() : 함수별 hits / misses / evictions / expired / 항목 수 / 바이트
+• 계산(miss) 시간은 qsuite.metrics 에 호출한 페이지의 "compute:<함수>" 단계로 기록된다
+  (페이지 밖 — 예: 라이브러리 함수를 명령행에서 — 이면 함수가 정의된 파일 이름으로)
+"""
+
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from qsuite import metrics
+
+BUDGET_BYTES = int(float(os.environ.get("QSUITE_CACHE_MB", 512)) * 2**20)
+
+_lock = threading.RLock()
+_entries = OrderedDict()          # (이름, 코드 해시, 인자 키…) → (값, 바이트, 만료 시각)
+_key_locks = {}
+_stats = {}
+_bytes = 0
+
+
+# ─────────────────────────────────────────────
+# 키·크기·불변화
+# ─────────────────────────────────────────────
+def _key(value):
+    if isinstance(value, (bool, int, str, bytes, type(None))):
+        return value
+    if isinstance(value, (float, np.floating)):
+        return float(f"{float(value):.12g}")
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.shape, value.dtype.str, hash(np.ascontiguousarray(value).tobytes()))
+    if isinstance(value, (tuple, list)):
+        return tuple(_key(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _key(v)) for k, v in value.items()))
+    return value
+
+
+def _code_key(code):
+    """바이트코드 + 상수 (중첩 함수·람다·컴프리헨션의 코드 객체까지 재귀) 의 해시.
+    co_code 만으로는 상수만 바뀐 수정 (예: 격자 크기 200 → 400) 을 구별하지 못한다."""
+    consts = tuple(_code_key(c) if inspect.iscode(c) else (type(c).__name__, repr(c)) for c in code.co_consts)
+    return hash((code.co_code, consts, code.co_names))
+
+
+def nbytes(value):
+    """값이 차지하는 대략의 바이트 (배열·희소행렬은 데이터 크기, 컨테이너는 합)."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, "data") and hasattr(value, "indices") and hasattr(value, "indptr"):
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(nbytes(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+def freeze(value):
+    """값 안의 NumPy 배열을 모두 읽기 전용으로."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            freeze(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            freeze(v)
+    return value
+
+
+# ─────────────────────────────────────────────
+# 저장소
+# ─────────────────────────────────────────────
+def _counter(name):
+    return _stats.setdefault(name, dict(hits=0, misses=0, evictions=0, expired=0, oversize=0))
+
+
+def _drop(key, reason):
+    global _bytes
+    _, size, _ = _entries.pop(key)
+    _bytes -= size
+    _counter(key[0])[reason] += 1
+
+
+def _lookup(key, now):
+    hit = _entries.get(key)
+    if hit is None:
+        return False, None
+    if hit[2] is not None and now > hit[2]:
+        _drop(key, "expired")
+        return False, None
+    _entries.move_to_end(key)
+    return True, hit[0]
+
+
+def _store(key, value, size, ttl, max_entries):
+    global _bytes
+    if size > BUDGET_BYTES:
+        _counter(key[0])["oversize"] += 1
+        return
+    _entries[key] = (value, size, None if ttl is None else time.monotonic() + ttl)
+    _bytes += size
+    if max_entries is not None:
+        own = [k for k in _entries if k[0] == key[0]]
+        for k in own[: max(0, len(own) - max_entries)]:
+            _drop(k, "evictions")
+    now = time.monotonic()
+    for k in [k for k, (_, _, exp) in _entries.items() if exp is not None and now > exp]:
+        _drop(k, "expired")
+    while _bytes > BUDGET_BYTES:
+        _drop(next(iter(_entries)), "evictions")
+
+
+def shared(max_entries=32, ttl=None, name=None):
+    """
+    모든 세션이 공유하는 결과 캐시 데코레이터.
+        @memo.shared(max_entries=16, ttl=3600)
+        def heavy(n, omega): ...
+    """
+    def decorate(fn):
+        # 페이지 스크립트는 모두 __main__ 으로 실행되므로 모듈 이름 대신 파일 이름으로 구분하고,
+        # 함수 본문이 바뀌면 (개발 중 수정) 예전 결과를 쓰지 않도록 바이트코드·상수 해시를 키에 넣는다
+        page = Path(fn.__code__.co_filename).stem
+        label = name or f"{page}.{fn.__qualname__}"
+        code = _code_key(fn.__code__)
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (label, code, _key(bound.args), _key(bound.kwargs))
+            with _lock:
+                found, value = _lookup(key, time.monotonic())
+                if found:
+                    _counter(label)["hits"] += 1
+                    return value
+                key_lock = _key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                with _lock:
+                    found, value = _lookup(key, time.monotonic())
+                    if found:                       # 다른 세션이 기다리는 동안 계산을 끝냄
+                        _counter(label)["hits"] += 1
+                        return value
+                    _counter(label)["misses"] += 1
+                try:
+                    caller = metrics.current_page()
+                    with metrics.timed(f"compute:{fn.__qualname__}", page=page if caller == "-" else caller):
+                        value = freeze(fn(*args, **kwargs))
+                    with _lock:
+                        _store(key, value, nbytes(value), ttl, max_entries)
+                finally:
+                    with _lock:
+                        _key_locks.pop(key, None)
+            return value
+
+        wrapper.clear = lambda: clear(label)
+        return wrapper
+
+    return decorate
+
+
+def stats():
+    """{이름: 카운터 + entries, bytes} 와 전체 합계 "_total" (bytes, budget, entries)."""
+    with _lock:
+        out = {name: dict(c, entries=0, bytes=0) for name, c in _stats.items()}
+        for (name, *_), (_, size, _) in _entries.items():
+            out[name]["entries"] += 1
+            out[name]["bytes"] += size
+        out["_total"] = dict(entries=len(_entries), bytes=_bytes, budget=BUDGET_BYTES)
+        return out
+
+
+def clear(name=None):
+    """캐시 비우기 (name 을 주면 그 함수만). 카운터는 유지한다."""
+    global _bytes
+    with _lock:
+        for key in [k for k in _entries if name is None or k[0] == name]:
+            _bytes -= _entries.pop(key)[1]
+
+
+def set_budget(mb):
+    """프로세스 메모리 예산 변경 — 줄이면 즉시 LRU 제거."""
+    global BUDGET_BYTES
+    with _lock:
+        BUDGET_BYTES = int(mb * 2**20)
+        while _bytes > BUDGET_BYTES and _entries:
+            _drop(next(iter(_entries)), "evictions")
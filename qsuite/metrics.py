@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+페이지별 계산·렌더 단계 계측 — 지연시간 히스토그램, 메모리, Prometheus 텍스트 내보내기
+────────────────────────────────────────────
+• 페이지 스크립트:
+      metrics.start_page(__file__)              # set_page_config 바로 다음
+      with metrics.timed("render:surface"):     # 무거운 단계
+          st.plotly_chart(fig, ...)
+      metrics.end_page()                        # 맨 끝 — 전체 실행 시간, RSS, 관리자 패널, 내보내기
+                                                # (st.stop · st.rerun · 예외로 못 오면 시간·RSS 는 스레드 정리 때 기록)
+      @metrics.fragment                         # st.fragment — 부분 재실행 시간은 "fragment:<함수>"
+  qsuite.memo.shared 로 캐시한 함수는 계산(miss)할 때 "compute:<함수>" 단계로 자동 기록된다
+• 단계마다: 실행 시간 → 고정 버킷 히스토그램 + 최근 RESERVOIR 개 표본 (p50/p95 계산용),
+  QSUITE_TRACEMALLOC=1 이면 tracemalloc 최대 할당량 (프로세스 전체 기준 — 동시 세션이 있으면 과대평가;
+  reset_peak 는 프로세스에 하나뿐이라 블록이 열리고 닫힐 때마다 그때까지의 최댓값을 열려 있는 모든 블록에 나눠 준 뒤
+  초기화한다 → 중첩된 fragment/compute/render 블록도 서로의 최댓값을 지우지 않는다),
+  페이지 끝에서 프로세스 RSS
+• Streamlit 은 세션마다 스크립트를 별도 스레드에서 돌리므로 현재 페이지는 스레드 지역 변수로 추적
+• 내보내기: Prometheus 텍스트 형식 (node_exporter textfile collector 가 읽는 *.prom 파일)
+  경로 QSUITE_METRICS_FILE (기본 <CACHE_DIR>/metrics.prom), end_page 에서 EXPORT_INTERVAL 초마다 갱신
+• 관리자 패널: QSUITE_ADMIN 환경변수가 "1" 이면 항상, 다른 값이면 URL 에 ?admin=<그 값> 일 때만 사이드바에 표시
+  (단계별 지연시간, RSS, 캐시 사용량, qsuite.warmup 예열 진행률)
+"""
+
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from qsuite import CACHE_DIR
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+RESERVOIR = 512
+EXPORT_INTERVAL = 10.0
+METRICS_FILE = Path(os.environ.get("QSUITE_METRICS_FILE", CACHE_DIR / "metrics.prom"))
+
+if os.environ.get("QSUITE_TRACEMALLOC") == "1" and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+_lock = threading.Lock()
+_peak_lock = threading.Lock()
+_open_peaks = {}                  # 열려 있는 timed 블록 → 지금까지 본 최대 추적 메모리 (절대값)
+_series = {}                      # (page, step) → dict(buckets, sum, count, recent, peak)
+_page_rss = {}                    # page → 마지막 실행 후 RSS (bytes)
+_local = threading.local()
+_last_export = 0.0
+
+
+# ─────────────────────────────────────────────
+# 측정
+# ─────────────────────────────────────────────
+def rss_bytes():
+    """현재 상주 메모리 (Linux /proc, 그 외에는 최대 RSS 로 대신)."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def record(page, step, seconds, peak_bytes=None):
+    with _lock:
+        s = _series.get((page, step))
+        if s is None:
+            s = _series[(page, step)] = dict(buckets=[0] * (len(BUCKETS) + 1), sum=0.0, count=0,
+                                             recent=deque(maxlen=RESERVOIR), peak=0)
+        s["buckets"][int(np.searchsorted(BUCKETS, seconds))] += 1
+        s["sum"] += seconds
+        s["count"] += 1
+        s["recent"].append(seconds)
+        if peak_bytes is not None:
+            s["peak"] = max(s["peak"], peak_bytes)
+
+
+def current_page():
+    return getattr(_local, "page", None) or "-"
+
+
+def _fold_peak():
+    """마지막 초기화 이후의 최대 추적 메모리를 열린 블록 모두에 반영하고 초기화 (_peak_lock 안에서)."""
+    peak = tracemalloc.get_traced_memory()[1]
+    for token, seen in _open_peaks.items():
+        _open_peaks[token] = max(seen, peak)
+    tracemalloc.reset_peak()
+
+
+@contextmanager
+def timed(step, page=None):
+    """with 블록의 실행 시간 (와 tracemalloc 최대 할당량) 을 (현재 페이지, step) 으로 기록."""
+    page = page or current_page()
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        token = object()
+        with _peak_lock:
+            _fold_peak()
+            base = _open_peaks[token] = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t0
+        peak = None
+        if tracing:
+            with _peak_lock:
+                _fold_peak()
+                peak = _open_peaks.pop(token) - base
+        record(page, step, elapsed, peak)
+
+
+def fragment(fn):
+    """
+    st.fragment + 계측. 위젯이 바뀌면 이 함수만 다시 실행되므로 (start_page/end_page 없이)
+    정의한 페이지 이름을 기억해 두었다가 "fragment:<함수>" 단계와 그 안의 timed() 를 그 페이지로 기록한다.
+    """
+    import streamlit as st
+
+    page = current_page()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        outer = getattr(_local, "page", None)
+        _local.page = outer or page
+        try:
+            with timed(f"fragment:{fn.__name__}", page=page):
+                return fn(*args, **kwargs)
+        finally:
+            _local.page = outer
+
+    return st.fragment(run)
+
+
+class _ScriptRun:
+    """
+    start_page 로 시작한 스크립트 실행 한 번. finish() 는 한 번만 기록한다 (전체 실행 시간, RSS, 내보내기).
+    st.stop() · 예외 · st.rerun() 으로 end_page 를 지나지 못해도 기록이 빠지지 않도록
+      - 같은 스레드에서 다음 start_page 가 불리면 (st.rerun 은 같은 스크립트 스레드에서 다시 실행) 그때,
+      - 스크립트 스레드가 끝나 스레드 지역 변수가 정리되면 (st.stop, 처리되지 않은 예외) __del__ 에서 마무리한다.
+    """
+
+    __slots__ = ("page", "t0", "done")
+
+    def __init__(self, page):
+        self.page, self.t0, self.done = page, time.perf_counter(), False
+
+    def finish(self):
+        if self.done:
+            return
+        self.done = True
+        record(self.page, "script", time.perf_counter() - self.t0)
+        with _lock:
+            _page_rss[self.page] = rss_bytes()
+        maybe_export()
+
+    def __del__(self):
+        try:
+            self.finish()
+        except Exception:                              # 인터프리터 종료 중 — 기록할 곳이 없다
+            pass
+
+
+def set_page(name):
+    """이 스레드의 timed()·memo 계산을 name 페이지로 기록 (스크립트 실행 시간은 재지 않음 — 예: 예열 스레드)."""
+    _local.page = name
+
+
+def start_page(path):
+    """페이지 스크립트 맨 앞에서 — 페이지 이름 (파일 이름) 과 시작 시각을 스레드에 기록."""
+    previous = getattr(_local, "run", None)
+    if previous is not None:                           # 이 스레드의 이전 실행이 end_page 없이 끝남 (st.rerun)
+        previous.finish()
+    set_page(Path(path).stem)
+    _local.run = _ScriptRun(current_page())
+
+
+def end_page():
+    """페이지 스크립트 맨 끝에서 — 전체 실행 시간·RSS 기록, 관리자 패널, 주기적 내보내기."""
+    run = getattr(_local, "run", None)
+    if run is not None:
+        run.finish()
+    if admin_enabled():
+        admin_panel()
+    _local.page = _local.run = None
+
+
+# ─────────────────────────────────────────────
+# 집계
+# ─────────────────────────────────────────────
+def summary():
+    """[(page, step, count, p50, p95, max, 최대 할당 bytes)] — 최근 RESERVOIR 개 표본 기준."""
+    with _lock:
+        rows = []
+        for (page, step), s in sorted(_series.items()):
+            recent = np.fromiter(s["recent"], float)
+            p50, p95 = np.percentile(recent, [50, 95])
+            rows.append((page, step, s["count"], float(p50), float(p95), float(recent.max()), s["peak"]))
+        return rows
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def prometheus_text():
+    """Prometheus 텍스트 노출 형식 (단계 히스토그램, 최대 할당량, 페이지별/프로세스 RSS, 캐시·예열 카운터)."""
+    from qsuite import memo, warmup
+
+    lines = ["# HELP qsuite_step_seconds Page step latency.", "# TYPE qsuite_step_seconds histogram"]
+    with _lock:
+        series = [(k, dict(s, buckets=list(s["buckets"]))) for k, s in sorted(_series.items())]
+        page_rss = dict(_page_rss)
+    for (page, step), s in series:
+        lab = f'page="{_label(page)}",step="{_label(step)}"'
+        cum = np.cumsum(s["buckets"])
+        for le, c in zip(BUCKETS, cum):
+            lines.append(f'qsuite_step_seconds_bucket{{{lab},le="{le}"}} {c}')
+        lines.append(f'qsuite_step_seconds_bucket{{{lab},le="+Inf"}} {cum[-1]}')
+        lines.append(f"qsuite_step_seconds_sum{{{lab}}} {s['sum']:.6f}")
+        lines.append(f"qsuite_step_seconds_count{{{lab}}} {s['count']}")
+    lines += ["# HELP qsuite_step_peak_bytes Largest tracemalloc peak seen for a step.",
+              "# TYPE qsuite_step_peak_bytes gauge"]
+    lines += [f'qsuite_step_peak_bytes{{page="{_label(p)}",step="{_label(st)}"}} {s["peak"]}'
+              for (p, st), s in series if s["peak"]]
+    lines += ["# HELP qsuite_page_rss_bytes Process RSS after the page's last run.",
+              "# TYPE qsuite_page_rss_bytes gauge"]
+    lines += [f'qsuite_page_rss_bytes{{page="{_label(p)}"}} {v}' for p, v in sorted(page_rss.items())]
+    lines += ["# HELP qsuite_process_rss_bytes Current process RSS.", "# TYPE qsuite_process_rss_bytes gauge",
+              f"qsuite_process_rss_bytes {rss_bytes()}"]
+    cache = memo.stats()
+    total = cache.pop("_total")
+    for metric, field, kind in (("qsuite_cache_hits_total", "hits", "counter"),
+                                ("qsuite_cache_misses_total", "misses", "counter"),
+                                ("qsuite_cache_evictions_total", "evictions", "counter"),
+                                ("qsuite_cache_bytes", "bytes", "gauge")):
+        lines += [f"# TYPE {metric} {kind}"]
+        lines += [f'{metric}{{function="{_label(fn)}"}} {c[field]}' for fn, c in sorted(cache.items())]
+    lines += ["# TYPE qsuite_cache_budget_bytes gauge", f"qsuite_cache_budget_bytes {total['budget']}"]
+    warm = warmup.progress()
+    lines += ["# HELP qsuite_warmup_tasks Cache warm-up tasks by state.", "# TYPE qsuite_warmup_tasks gauge"]
+    lines += [f'qsuite_warmup_tasks{{state="{k}"}} {warm[k]}' for k in ("total", "done", "failed", "skipped")]
+    return "\n".join(lines) + "\n"
+
+
+def export(path=METRICS_FILE):
+    """텍스트 파일로 원자적 쓰기 (임시 파일 → rename) — 스크레이퍼가 반쯤 쓴 파일을 읽지 않도록."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp.write_text(prometheus_text(), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def maybe_export():
+    global _last_export
+    now = time.monotonic()
+    with _lock:
+        if now - _last_export < EXPORT_INTERVAL:
+            return
+        _last_export = now
+    try:
+        export()
+    except OSError:
+        pass                                           # 읽기 전용 배포 환경 — 패널은 계속 동작
+
+
+def reset():
+    with _lock:
+        _series.clear()
+        _page_rss.clear()
+
+
+# ─────────────────────────────────────────────
+# 관리자 사이드바 (Streamlit)
+# ─────────────────────────────────────────────
+def admin_enabled():
+    token = os.environ.get("QSUITE_ADMIN")
+    if not token:
+        return False
+    if token == "1":
+        return True
+    import streamlit as st
+    return st.query_params.get("admin") == token
+
+
+def admin_panel():
+    import streamlit as st
+    from qsuite import memo, warmup
+
+    with st.sidebar.expander("⏱️ 성능 지표 (관리자)", expanded=False):
+        cache = memo.stats()["_total"]
+        c1, c2 = st.columns(2)
+        c1.metric("RSS", f"{rss_bytes() / 2**20:.0f} MB")
+        c2.metric("캐시", f"{cache['bytes'] / 2**20:.0f} / {cache['budget'] / 2**20:.0f} MB")
+        warm = warmup.progress()
+        if warm["total"]:
+            finished = warm["done"] + warm["failed"] + warm["skipped"]
+            text = f"캐시 예열 {finished}/{warm['total']} · {warm['elapsed']:.0f} s"
+            if warm["failed"] or warm["skipped"]:
+                text += f" · 실패 {warm['failed']} · 건너뜀 {warm['skipped']}"
+            st.progress(finished / warm["total"], text=text)
+        only_page = st.checkbox("현재 페이지만", value=True)
+        page = current_page()
+        rows = [dict(page=p, step=s, n=n, p50_ms=round(a * 1e3, 1), p95_ms=round(b * 1e3, 1),
+                     max_ms=round(c * 1e3, 1), peak_MB=round(pk / 2**20, 1))
+                for p, s, n, a, b, c, pk in summary() if not only_page or p == page]
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        st.caption(f"Prometheus 파일: {METRICS_FILE}" + ("" if tracemalloc.is_tracing()
+                   else " · 메모리 할당 추적은 QSUITE_TRACEMALLOC=1 로 켠다"))
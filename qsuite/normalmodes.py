@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+N 개 결합 진동자의 정규 모드 — 임의의 이차 퍼텐셜 V = ½ xᵀ K x
+────────────────────────────────────────────
+• 질량가중 힘상수 행렬 K̃ = M^{-1/2} K M^{-1/2} 를 대각화 → ωᵢ = √λᵢ, 모드 벡터 Q
+• 밀집 행렬 : scipy.linalg.eigh (수천 좌표까지)
+  삼중대각  : scipy.linalg.eigh_tridiagonal (Sturm 이분법 + 역반복) — 사슬의 k 개 모드가 O(N·k)
+  일반 희소 : shift-invert eigsh — 띠 행렬이면 LU 채움도 O(N·b) 라 여전히 N 에 선형
+• 회전된 좌표 q = Qᵀ M^{1/2} (x − x₀) 에서 곱상태 Ψ = Π ψ_{nᵢ}(√(ωᵢ/ħ) qᵢ) 의 확률밀도
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.linalg import eigh, eigh_tridiagonal
+from scipy.sparse.linalg import eigsh
+
+from qsuite import hermite
+
+DENSE_MAX = 4000       # 이 이하이면 밀집 eigh
+
+
+# ─────────────────────────────────────────────
+# 힘상수 행렬 만들기
+# ─────────────────────────────────────────────
+def chain_hessian(n, k_spring=1.0, k_wall=None, periodic=False):
+    """
+    최근접 이웃 용수철 사슬 (좌표 n 개). k_wall: 양 끝을 벽에 묶는 용수철 (None → k_spring, 0 → 자유 끝).
+    periodic=True 이면 고리 (모서리 항 때문에 띠 행렬이 아니다).
+    """
+    k_wall = k_spring if k_wall is None else k_wall
+    diag = np.full(n, 2.0 * k_spring)
+    if not periodic:
+        diag[0] = diag[-1] = k_spring + k_wall
+    off = np.full(n - 1, -k_spring)
+    K = sparse.diags((off, diag, off), (-1, 0, 1), shape=(n, n), format="lil")
+    if periodic and n > 2:
+        K[0, n - 1] = K[n - 1, 0] = -k_spring
+    return K.tocsr()
+
+
+def lattice_hessian(nx, ny, k_spring=1.0, k_wall=None):
+    """nx × ny 정사각 격자의 스칼라 변위 (사슬 두 개의 Kronecker 합, 좌표 순서 i·ny + j)."""
+    Kx = chain_hessian(nx, k_spring, k_wall)
+    Ky = chain_hessian(ny, k_spring, k_wall)
+    return (sparse.kron(Kx, sparse.identity(ny)) + sparse.kron(sparse.identity(nx), Ky)).tocsr()
+
+
+def chain_frequencies(n, k_spring=1.0, m=1.0):
+    """양 끝 고정 사슬의 해석해 ω_j = 2√(k/m) sin(jπ / 2(n+1)),  j = 1 … n."""
+    j = np.arange(1, n + 1)
+    return 2 * np.sqrt(k_spring / m) * np.sin(j * np.pi / (2 * (n + 1)))
+
+
+# ─────────────────────────────────────────────
+# 대각화
+# ─────────────────────────────────────────────
+def bandwidth(K):
+    """max |i − j| (K_ij ≠ 0)."""
+    if sparse.issparse(K):
+        C = K.tocoo()
+        return int(np.abs(C.row - C.col).max()) if C.nnz else 0
+    i, j = np.nonzero(K)
+    return int(np.abs(i - j).max()) if i.size else 0
+
+
+def mass_weighted(K, masses=1.0):
+    """K̃ = M^{-1/2} K M^{-1/2}."""
+    w = 1.0 / np.sqrt(np.broadcast_to(np.asarray(masses, dtype=float), (K.shape[0],)))
+    if sparse.issparse(K):
+        D = sparse.diags(w)
+        return (D @ K @ D).tocsr()
+    return w[:, None] * np.asarray(K, dtype=float) * w[None, :]
+
+
+def normal_modes(K, masses=1.0, k=None, method="auto"):
+    """
+    가장 낮은 k 개 (None → 전부) 정규 모드.
+    반환: (ω (k,), Q (N, k))  — Q 의 열은 질량가중 좌표에서 정규직교.
+    method: "auto" | "dense" | "tridiagonal" | "sparse"
+    """
+    Kw = mass_weighted(K, masses)
+    n = Kw.shape[0]
+    k = n if k is None else min(k, n)
+    if method == "auto":
+        if n <= DENSE_MAX:
+            method = "dense"
+        elif bandwidth(Kw) == 1:
+            method = "tridiagonal"
+        else:
+            method = "sparse"
+    if method == "dense":
+        A = Kw.toarray() if sparse.issparse(Kw) else Kw
+        lam, Q = eigh(A, subset_by_index=[0, k - 1])
+    elif method == "tridiagonal":
+        Kd = sparse.csr_matrix(Kw)
+        lam, Q = eigh_tridiagonal(Kd.diagonal(), Kd.diagonal(1), select="i", select_range=(0, k - 1))
+    elif method == "sparse":
+        if k >= n - 1:
+            raise ValueError("sparse method needs k < N - 1; use method='dense'")
+        # 자유 사슬의 영(0) 모드가 있어도 분해 가능하도록 σ 를 0 보다 살짝 아래로
+        scale = float(np.abs(Kw.diagonal()).max())
+        lam, Q = eigsh(Kw.tocsc(), k=k, sigma=-1e-6 * scale, which="LM")
+        idx = np.argsort(lam)
+        lam, Q = lam[idx], Q[:, idx]
+    else:
+        raise ValueError(f"unknown method: {method!r}")
+    return np.sqrt(np.clip(lam, 0.0, None)), Q
+
+
+# ─────────────────────────────────────────────
+# 회전된 좌표계의 곱상태
+# ─────────────────────────────────────────────
+def normal_coordinates(x, Q, masses=1.0, x0=0.0):
+    """q = Qᵀ M^{1/2} (x − x₀).  x: (..., N) → q: (..., k)."""
+    x = np.asarray(x, dtype=float)
+    sqrt_m = np.sqrt(np.broadcast_to(np.asarray(masses, dtype=float), (x.shape[-1],)))
+    return ((x - x0) * sqrt_m) @ Q
+
+
+def log_product_density(x, omegas, Q, quanta, masses=1.0, x0=0.0, hbar=1.0):
+    """
+    ln|Ψ(x)|²,  Ψ = Π ψ_{nᵢ}(qᵢ).  Q 가 모든 모드를 포함하면 ∫|Ψ|² dᴺx = 1
+    (야코비안 det M^{1/2} 포함). 로그로 더해 N 이 커도 underflow 없음.
+    """
+    q = normal_coordinates(x, Q, masses, x0)
+    omegas = np.asarray(omegas, dtype=float)
+    quanta = np.broadcast_to(np.asarray(quanta, dtype=int), omegas.shape)
+    xi = q * np.sqrt(omegas / hbar)
+    out = np.zeros(q.shape[:-1])
+    with np.errstate(divide="ignore"):
+        for i in range(len(omegas)):
+            out += 2 * np.log(np.abs(hermite.hermite_function(quanta[i], xi[..., i]))) \
+                + 0.5 * np.log(omegas[i] / hbar)
+    m = np.broadcast_to(np.asarray(masses, dtype=float), (Q.shape[0],))
+    return out + 0.5 * np.log(m).sum()
+
+
+def product_density(x, omegas, Q, quanta, masses=1.0, x0=0.0, hbar=1.0):
+    """|Ψ(x)|² (작은 N 에서 격자 그림용)."""
+    with np.errstate(under="ignore"):
+        return np.exp(log_product_density(x, omegas, Q, quanta, masses, x0, hbar))
+
+
+def coordinate_variance(omegas, Q, quanta=0, masses=1.0, hbar=1.0):
+    """곱상태에서 각 직교 좌표의 분산 ⟨(x_j − x₀)²⟩ = Σᵢ Q_{ji}² (nᵢ+½) ħ / (m_j ωᵢ)."""
+    omegas = np.asarray(omegas, dtype=float)
+    quanta = np.broadcast_to(np.asarray(quanta, dtype=float), omegas.shape)
+    m = np.broadcast_to(np.asarray(masses, dtype=float), (Q.shape[0],))
+    return (Q**2 @ ((quanta + 0.5) * hbar / omegas)) / m
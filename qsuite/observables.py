@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+조화진동자 고유상태의 기댓값과 행렬요소
+────────────────────────────────────────────
+• 사다리 연산자 (qsuite.fock): a|n⟩ = √n |n−1⟩,  ξ = (a + a†)/√2,  π = i(a† − a)/√2   (무차원)
+  x = ξ √(ħ/mω),  p = π √(ħmω)
+• ξᵏ, πᵏ 는 대역폭 k 의 희소 행렬 — 차원 n_max + k + 1 에서 곱한 뒤 잘라내면
+  (n_max+1)² 블록이 절단 오차 없이 정확 → 모든 n 의 ⟨xᵏ⟩, ⟨pᵏ⟩ 가 대각 성분 한 번에
+• 임의 함수 f(x): Gauss–Hermite 구적 (qsuite.quadrature) 으로 ⟨m|f(x)|n⟩ 전체 행렬을 한 번의 행렬곱으로
+    ⟨m|f|n⟩ = Σᵢ w̃ᵢ ψₘ(ξᵢ) f(xᵢ) ψₙ(ξᵢ)
+  (노드는 최근 사용한 몇 개 크기만 메모리에 남긴다)
+• 고전 대응: 같은 에너지의 궤도 x = x₀ sin ωt 의 시간 평균 ⟨xᵏ⟩ = x₀ᵏ C(k, k/2) / 2ᵏ  (k 짝수)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from scipy import sparse
+from scipy.special import comb
+
+from qsuite import fock, quadrature
+from qsuite.hermite import classical_amplitude, hermite_functions
+
+_CACHE_SIZE = 8
+_node_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _nodes(N):
+    """캐시된 (x, w̃) — 세션 간 공유되므로 읽기 전용."""
+    with _lock:
+        hit = _node_cache.get(N)
+        if hit is not None:
+            _node_cache.move_to_end(N)
+            return hit
+    out = quadrature.nodes(N)
+    for arr in out:
+        arr.flags.writeable = False
+    with _lock:                                       # 계산은 잠금 밖 — 다른 세션을 막지 않는다
+        _node_cache[N] = out
+        _node_cache.move_to_end(N)
+        while len(_node_cache) > _CACHE_SIZE:
+            _node_cache.popitem(last=False)
+    return out
+
+
+def _units(hbar, m, omega):
+    """(x 단위 √(ħ/mω), p 단위 √(ħmω))."""
+    return np.sqrt(hbar / (m * omega)), np.sqrt(hbar * m * omega)
+
+
+# ─────────────────────────────────────────────
+# xᵏ, pᵏ (희소)
+# ─────────────────────────────────────────────
+def power(op, k, n_max):
+    """무차원 ξᵏ 또는 πᵏ 의 정확한 (n_max+1)² 블록 (희소). op: "x" 또는 "p"."""
+    if op == "x":
+        A = fock.position(n_max + k + 1)
+    elif op == "p":
+        A = fock.momentum(n_max + k + 1)
+    else:
+        raise ValueError(f"unknown operator: {op!r}")
+    M = sparse.identity(n_max + k + 1, dtype=A.dtype, format="csr")
+    for _ in range(k):
+        M = A @ M
+    return M[: n_max + 1, : n_max + 1]
+
+
+# ─────────────────────────────────────────────
+# 기댓값
+# ─────────────────────────────────────────────
+def moment(op, k, n, hbar=1.0, m=1.0, omega=1.0):
+    """⟨n|xᵏ|n⟩ 또는 ⟨n|pᵏ|n⟩ — n 은 정수 또는 배열 (max(n) 까지 대각 성분 한 번 계산)."""
+    n = np.asarray(n)
+    d = power(op, k, int(n.max())).diagonal().real
+    return d[n] * _units(hbar, m, omega)[op == "p"] ** k
+
+
+def uncertainty(n, hbar=1.0, m=1.0, omega=1.0):
+    """(Δx, Δp, ΔxΔp) — 고유상태에서 ⟨x⟩ = ⟨p⟩ = 0 이고 ΔxΔp = (n + ½)ħ."""
+    dx = np.sqrt(moment("x", 2, n, hbar, m, omega) - moment("x", 1, n, hbar, m, omega) ** 2)
+    dp = np.sqrt(moment("p", 2, n, hbar, m, omega) - moment("p", 1, n, hbar, m, omega) ** 2)
+    return dx, dp, dx * dp
+
+
+def classical_moment(op, k, n, hbar=1.0, m=1.0, omega=1.0):
+    """에너지 (n+½)ħω 인 고전 궤도의 시간 평균 ⟨xᵏ⟩ 또는 ⟨pᵏ⟩ (홀수 k 는 0)."""
+    if op not in ("x", "p"):
+        raise ValueError(f"unknown operator: {op!r}")
+    amp = classical_amplitude(n, hbar, m, omega) * (m * omega if op == "p" else 1.0)
+    return amp**k * comb(k, k // 2) / 2.0**k if k % 2 == 0 else np.zeros_like(amp)
+
+
+# ─────────────────────────────────────────────
+# 임의 함수의 행렬요소 (구적)
+# ─────────────────────────────────────────────
+def matrix_elements(f, n_max, n_nodes=None, hbar=1.0, m=1.0, omega=1.0):
+    """
+    ⟨m|f(x)|n⟩ (m, n = 0 … n_max) 조밀 행렬. f 는 물리 좌표 x 의 벡터화 함수.
+    노드 N (기본 2(n_max+1)) 이면 차수 2(N − n_max) − 1 이하 다항식 f 에서 정확,
+    매끄러운 f 는 노드를 늘리며 수렴한다.
+    """
+    N = 2 * (n_max + 1) if n_nodes is None else n_nodes
+    xi, wt = _nodes(N)
+    psi = hermite_functions(n_max, xi)
+    return (psi * (wt * f(xi * _units(hbar, m, omega)[0]))) @ psi.T
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+2차원 조화진동자 — 등방(페이지 04) · 결합항으로 생긴 비등방(페이지 05) 곱상태
+────────────────────────────────────────────
+• Ψ_{n₁n₂}(X, Y) = ψ_{n₁}(X) ψ_{n₂}(Y),  ψ_{nᵢ}(X) = (mωᵢ/ħ)^{1/4} ψₙ(√(mωᵢ/ħ) X)
+  (ψₙ 은 qsuite.hermite 의 정규화된 Hermite 함수 → sympy lambdify 없이 큰 n 에서도 안정)
+• 결합 퍼텐셜 ½γmω²(x² + y² + xy) → X = x + y, Y = x − y 로 교차항 제거
+    k₁ = 2γmω² C₁,  k₂ = 2γmω² C₂,  C₁ = 3/4,  C₂ = 1/4
+• 중첩의 시간 전개 Ψ(x,y,t) = Σₖ cₖ e^{-iEₖt/ħ} ψ_{n₁ₖ}(x) ψ_{n₂ₖ}(y) — 축별 기저 행렬을 한 번 만들고
+  각 프레임은 (n₂ × n₁) 계수 행렬의 위상 회전과 행렬곱 두 번 (Hermite 함수를 다시 계산하지 않음)
+"""
+
+import numpy as np
+
+from qsuite.hermite import hermite_function, hermite_functions
+
+C1, C2 = 3 / 4, 1 / 4
+
+
+def axis_wavefunction(n, X, omega=1.0, hbar=1.0, m=1.0):
+    """한 축의 정규화된 ψₙ(X) (진동수 ω)."""
+    a = np.sqrt(m * omega / hbar)
+    return np.sqrt(a) * hermite_function(n, a * np.asarray(X, dtype=float))
+
+
+def wavefunction(n1, n2, X, Y, omega1=1.0, omega2=1.0, hbar=1.0, m=1.0):
+    """Ψ_{n₁n₂}(X, Y) — X, Y 는 서로 브로드캐스트 가능한 배열 (meshgrid 또는 열/행 벡터)."""
+    return axis_wavefunction(n1, X, omega1, hbar, m) * axis_wavefunction(n2, Y, omega2, hbar, m)
+
+
+def density(n1, n2, X, Y, omega1=1.0, omega2=1.0, hbar=1.0, m=1.0):
+    """|Ψ_{n₁n₂}(X, Y)|²."""
+    return wavefunction(n1, n2, X, Y, omega1, omega2, hbar, m) ** 2
+
+
+def effective_frequencies(gamma, m=1.0, omega=1.0):
+    """페이지 05 의 변수변환으로 얻는 (ω₁, ω₂)."""
+    k1 = 2 * gamma * m * omega**2 * C1
+    k2 = 2 * gamma * m * omega**2 * C2
+    return np.sqrt(k1 / m), np.sqrt(k2 / m)
+
+
+def energy(n1, n2, omega1=1.0, omega2=1.0, hbar=1.0):
+    """E = (n₁ + ½)ħω₁ + (n₂ + ½)ħω₂."""
+    return (n1 + 0.5) * hbar * omega1 + (n2 + 0.5) * hbar * omega2
+
+
+# ─────────────────────────────────────────────
+# 중첩 상태의 시간 전개
+# ─────────────────────────────────────────────
+def axis_basis(n_max, X, omega=1.0, hbar=1.0, m=1.0):
+    """한 축의 ψ₀ … ψ_{n_max} 를 한 번에 — (n_max + 1, len(X))."""
+    a = np.sqrt(m * omega / hbar)
+    return np.sqrt(a) * hermite_functions(n_max, a * np.asarray(X, dtype=float))
+
+
+def superposition_frames(modes, coeffs, basis_x, basis_y, times, omega1=1.0, omega2=1.0, hbar=1.0, chunk=64):
+    """
+    |Ψ(x,y,t)|² 프레임 (len(times), len(y), len(x)) float32 — modes 는 [(n₁, n₂)], coeffs 는 복소 계수.
+    basis_x, basis_y 는 axis_basis 결과 (max n₁, max n₂ 이상). 프레임 chunk 개씩 계산해 복소 중간 배열을 제한한다.
+    """
+    modes = np.asarray(modes, dtype=int).reshape(-1, 2)
+    C = np.zeros((modes[:, 1].max() + 1, modes[:, 0].max() + 1), dtype=complex)
+    np.add.at(C, (modes[:, 1], modes[:, 0]), np.asarray(coeffs, dtype=complex))
+    n2, n1 = np.indices(C.shape)
+    E = energy(n1, n2, omega1, omega2, hbar)
+    Bx, ByT = basis_x[: C.shape[1]], basis_y[: C.shape[0]].T
+    times = np.asarray(times, dtype=float)
+    out = np.empty((len(times), ByT.shape[0], Bx.shape[1]), dtype=np.float32)
+    for s in range(0, len(times), chunk):
+        A = C * np.exp(-1j * times[s:s + chunk, None, None] * E / hbar)          # (T, n₂, n₁) 위상 회전
+        out[s:s + chunk] = np.abs(ByT @ A @ Bx) ** 2
+    return out
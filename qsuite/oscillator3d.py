@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+3차원 등방 조화진동자 — 구면 기저 |n, l, m⟩ 와 등위면 추출
+────────────────────────────────────────────
+• ħ = m = ω = 1.  E = (n + 3/2),  n = 2n_r + l  (n − l 은 0 이상의 짝수)
+• ψ_nlm = R_{n_r l}(r) Y_lm(θ, φ)
+    R = N r^l e^{−r²/2} L_{n_r}^{(l+½)}(r²),   N² = 2 n_r! / Γ(n_r + l + 3/2)
+• 격자 평가: 지름 성분은 r, 각 성분은 θ 의 1차원 표로 만든 뒤 3D 격자에서는 보간 + 곱셈만
+  (200³ = 8×10⁶ 점에서도 3D 특수함수 호출 없음, float32)
+• 등위면: skimage.measure.marching_cubes (선택 의존성) → 정점 군집화(vertex clustering)로
+  삼각형 수를 상한 이하로 줄여 Plotly Mesh3d 에 넘긴다
+"""
+
+import numpy as np
+from scipy.special import eval_genlaguerre, gammaln
+
+from qsuite import spherical
+
+
+def check_quantum_numbers(n, l, m):
+    if not (0 <= l <= n and (n - l) % 2 == 0 and abs(m) <= l):
+        raise ValueError(f"need 0 <= l <= n, n - l even, |m| <= l (got n={n}, l={l}, m={m})")
+
+
+def allowed_l(n):
+    """n 에 허용되는 l = n, n−2, …, (0 또는 1)."""
+    return list(range(n % 2, n + 1, 2))
+
+
+def energy(n):
+    return n + 1.5
+
+
+def degeneracy(n):
+    return (n + 1) * (n + 2) // 2
+
+
+def radial(n, l, r):
+    """R_{n_r l}(r),  ∫ R² r² dr = 1."""
+    r = np.asarray(r, dtype=float)
+    nr = (n - l) // 2
+    log_norm = 0.5 * (np.log(2.0) + gammaln(nr + 1) - gammaln(nr + l + 1.5))
+    with np.errstate(under="ignore"):
+        return np.exp(log_norm - 0.5 * r**2) * r**l * eval_genlaguerre(nr, l + 0.5, r**2)
+
+
+def classical_radius(n):
+    """E = ½r² 인 고전 전환 반지름 √(2n+3) — 격자 범위를 정하는 기준."""
+    return np.sqrt(2.0 * n + 3.0)
+
+
+def psi_grid(n, l, m, n_grid=128, extent=None, real=True, dtype=np.float32):
+    """
+    [-extent, extent]³ 정육면체 격자 위의 ψ_nlm (real=True 이면 실수 구면조화 사용).
+    반환: (좌표축 1차원 배열, ψ (n_grid, n_grid, n_grid))  — 인덱스 순서 [x, y, z].
+    """
+    check_quantum_numbers(n, l, m)
+    extent = classical_radius(n) + 2.5 if extent is None else extent
+    ax = np.linspace(-extent, extent, n_grid).astype(dtype)
+    x, y, z = ax[:, None, None], ax[None, :, None], ax[None, None, :]
+    r = np.sqrt(x * x + y * y + z * z)
+
+    # 1차원 표: R(r) 와 P̃_lm(θ)
+    r_tab = np.linspace(0.0, float(np.sqrt(3.0) * extent), 8192)
+    R = np.interp(r, r_tab, radial(n, l, r_tab)).astype(dtype)
+    theta_tab = np.linspace(0.0, np.pi, 4096)
+    P_tab = spherical.legendre(l, abs(m), theta_tab)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos_t = np.where(r > 0, z / r, 1.0)
+    P = np.interp(np.arccos(np.clip(cos_t, -1, 1)), theta_tab, P_tab).astype(dtype)
+    psi = R * P
+    if m != 0:
+        phi = np.arctan2(y, x)
+        if real:
+            trig = np.cos(abs(m) * phi) if m > 0 else np.sin(abs(m) * phi)
+            psi = psi * (np.sqrt(2.0) * (-1.0) ** abs(m) * trig).astype(dtype)
+        else:
+            phase = np.exp(1j * abs(m) * phi)
+            psi = psi * ((-1.0) ** abs(m) * np.conj(phase) if m < 0 else phase).astype(np.complex64)
+    return ax, np.ascontiguousarray(np.broadcast_to(psi, (n_grid,) * 3))
+
+
+def level_for_probability(density, voxel, p=0.9):
+    """
+    |ψ|² ≥ level 영역이 전체 확률의 p 를 담도록 하는 level (∑ density · voxel = 1 가정).
+    """
+    d = np.sort(density.ravel())[::-1]
+    cum = np.cumsum(d, dtype=np.float64) * voxel
+    return float(d[min(np.searchsorted(cum, p * cum[-1]), d.size - 1)])
+
+
+# ─────────────────────────────────────────────
+# 등위면 추출과 데시메이션
+# ─────────────────────────────────────────────
+def isosurface(volume, level, axis, step_size=1):
+    """marching cubes → (정점 (V, 3) 실좌표, 면 (F, 3)). 등위면이 없으면 빈 배열."""
+    try:
+        from skimage.measure import marching_cubes
+    except ImportError as exc:                       # pragma: no cover - 선택 의존성
+        raise ImportError("isosurface extraction needs scikit-image: pip install scikit-image") from exc
+    if not (volume.min() < level < volume.max()):
+        return np.empty((0, 3)), np.empty((0, 3), dtype=int)
+    h = float(axis[1] - axis[0])
+    verts, faces, _, _ = marching_cubes(volume, level, spacing=(h, h, h), step_size=step_size)
+    return verts + float(axis[0]), faces
+
+
+def decimate(verts, faces, max_faces):
+    """
+    정점 군집화: 정점을 정육면체 셀로 양자화해 같은 셀의 정점을 평균 하나로 합치고,
+    퇴화·중복 삼각형을 지운다. 면 수가 max_faces 이하가 될 때까지 셀 크기를 키운다.
+    """
+    if len(faces) <= max_faces:
+        return verts, faces
+    lo = verts.min(axis=0)
+    span = float((verts.max(axis=0) - lo).max()) or 1.0
+    # 면 수 ∝ 1/cell² → 첫 추정
+    cell = span / np.sqrt(max_faces / 2.0)
+    for _ in range(20):
+        key = np.floor((verts - lo) / cell).astype(np.int64)
+        _, inverse, counts = np.unique(key, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        new_verts = np.zeros((counts.size, 3))
+        np.add.at(new_verts, inverse, verts)
+        new_verts /= counts[:, None]
+        f = inverse[faces]
+        f = f[(f[:, 0] != f[:, 1]) & (f[:, 1] != f[:, 2]) & (f[:, 0] != f[:, 2])]
+        # 중복 삼각형 제거 — 원래 꼭짓점 순서(법선 방향)는 유지
+        first = np.unique(np.sort(f, axis=1), axis=0, return_index=True)[1]
+        f = f[np.sort(first)]
+        if len(f) <= max_faces:
+            return new_verts, f
+        cell *= 1.25
+    return new_verts, f
+
+
+def orbital_meshes(n, l, m, n_grid=128, p=0.9, max_faces=60000, real=True):
+    """
+    실수 오비탈의 ± 로브 (복소형이면 |ψ|² 하나) 등위면.
+    반환: dict(lobes=[(부호, verts, faces), …], level, faces_raw, axis)
+    """
+    ax, psi = psi_grid(n, l, m, n_grid, real=real)
+    h = float(ax[1] - ax[0])
+    dens = np.abs(psi) ** 2
+    level = level_for_probability(dens, h**3, p)
+    lobes, raw = [], 0
+    if real:
+        c = np.sqrt(level)
+        for sign in (1, -1):
+            v, f = isosurface(sign * psi, c, ax)
+            raw += len(f)
+            lobes.append((sign, v, f))
+    else:
+        v, f = isosurface(dens, level, ax)
+        raw = len(f)
+        lobes.append((1, v, f))
+    budget = max_faces // max(1, sum(len(f) > 0 for _, _, f in lobes))
+    lobes = [(s, *decimate(v, f, budget)) for s, v, f in lobes]
+    return dict(lobes=lobes, level=level, faces_raw=raw, axis=ax)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+3차원 오비탈 |ψ_nlm|² 의 Monte Carlo 점 구름 — 역누적분포(inverse-CDF) 표본추출
+────────────────────────────────────────────
+• |ψ|² r² sin θ = [r² R²(r)] · [|P̃_lm(θ)|² sin θ] · [Φ_m(φ)]  → 세 변수가 서로 독립
+  → 각 주변분포를 1차원 표의 누적합으로 만들고, 균등난수 u 를 np.interp 로 역변환
+  (기각 표본추출과 달리 버리는 점이 없고, 점 하나당 비용이 n, l 과 무관)
+• Φ_m : 복소형 1/2π (균등),  실수형 cos²(mφ)/π 또는 sin²(|m|φ)/π
+• 지름 성분: 3D 등방 조화진동자 (qsuite.oscillator3d, ħ = m = ω = 1) 또는 수소꼴 원자 (원자 단위, 핵전하 Z)
+• 10⁶ 점은 batch 단위로 만들어 임시 배열 크기를 묶어 두고, float32 로 돌려준다
+"""
+
+import numpy as np
+from scipy.special import eval_genlaguerre, gammaln
+
+from qsuite import oscillator3d, spherical
+
+SYSTEMS = ("oscillator", "hydrogen")
+TABLE_POINTS = 20001
+BATCH = 1 << 18
+
+
+# ─────────────────────────────────────────────
+# 지름 성분
+# ─────────────────────────────────────────────
+def hydrogen_radial(n, l, r, Z=1.0):
+    """
+    수소꼴 R_nl(r) (원자 단위), ∫ R² r² dr = 1.
+    R = N e^{−ρ/2} ρ^l L_{n−l−1}^{(2l+1)}(ρ),  ρ = 2Zr/n,  N² = (2Z/n)³ (n−l−1)! / (2n (n+l)!)
+    """
+    if not 0 <= l < n:
+        raise ValueError(f"need 0 <= l < n (got n={n}, l={l})")
+    r = np.asarray(r, dtype=float)
+    rho = 2.0 * Z * r / n
+    log_norm = 0.5 * (3 * np.log(2.0 * Z / n) + gammaln(n - l) - np.log(2.0 * n) - gammaln(n + l + 1))
+    with np.errstate(under="ignore"):
+        return np.exp(log_norm - 0.5 * rho) * rho**l * eval_genlaguerre(n - l - 1, 2 * l + 1, rho)
+
+
+def check_state(system, n, l, m):
+    if system == "oscillator":
+        oscillator3d.check_quantum_numbers(n, l, m)
+    elif system == "hydrogen":
+        if not (0 <= l < n and abs(m) <= l):
+            raise ValueError(f"need 0 <= l < n, |m| <= l (got n={n}, l={l}, m={m})")
+    else:
+        raise ValueError(f"unknown system: {system!r}")
+
+
+def radial(system, n, l, r, Z=1.0):
+    if system == "oscillator":
+        return oscillator3d.radial(n, l, r)
+    if system == "hydrogen":
+        return hydrogen_radial(n, l, r, Z)
+    raise ValueError(f"unknown system: {system!r}")
+
+
+def r_max(system, n, Z=1.0):
+    """표의 바깥 반지름 — 이보다 먼 곳의 확률은 10⁻¹² 미만."""
+    if system == "oscillator":
+        return float(oscillator3d.classical_radius(n)) + 6.5
+    return n * (2.0 * n + 28.0) / Z
+
+
+def mean_r(system, n, l, Z=1.0):
+    """⟨r⟩ — 수소꼴은 해석해 (3n² − l(l+1)) / 2Z, 진동자는 지름 표의 수치 적분."""
+    if system == "hydrogen":
+        return (3 * n * n - l * (l + 1)) / (2.0 * Z)
+    r = np.linspace(0.0, r_max(system, n), TABLE_POINTS)
+    p = r**2 * oscillator3d.radial(n, l, r) ** 2
+    return float(np.sum(r * p) / np.sum(p))
+
+
+def mean_r2(system, n, l, Z=1.0):
+    """해석적 ⟨r²⟩ — 진동자: n + 3/2 (비리얼 정리),  수소꼴: n²(5n² + 1 − 3l(l+1)) / 2Z²."""
+    if system == "oscillator":
+        return n + 1.5
+    return n * n * (5 * n * n + 1 - 3 * l * (l + 1)) / (2.0 * Z * Z)
+
+
+# ─────────────────────────────────────────────
+# 1차원 역누적분포 표
+# ─────────────────────────────────────────────
+def _cdf(x, pdf):
+    """사다리꼴 누적합으로 [0, 1] 로 정규화한 CDF (중복값은 np.interp 역변환에 무해)."""
+    c = np.concatenate(([0.0], np.cumsum(0.5 * (pdf[1:] + pdf[:-1]) * np.diff(x))))
+    return c / c[-1]
+
+
+def marginal_tables(system, n, l, m, real=True, Z=1.0, n_table=TABLE_POINTS):
+    """
+    (r, CDF_r), (θ, CDF_θ), (φ, CDF_φ) — 세 주변분포의 역변환 표.
+    """
+    check_state(system, n, l, m)
+    r = np.linspace(0.0, r_max(system, n, Z), n_table)
+    theta = np.linspace(0.0, np.pi, n_table)
+    phi = np.linspace(0.0, 2 * np.pi, n_table)
+    pdf_r = r**2 * radial(system, n, l, r, Z) ** 2
+    pdf_t = spherical.legendre(l, abs(m), theta) ** 2 * np.sin(theta)
+    if real and m > 0:
+        pdf_p = np.cos(m * phi) ** 2
+    elif real and m < 0:
+        pdf_p = np.sin(-m * phi) ** 2
+    else:
+        pdf_p = np.ones_like(phi)
+    return (r, _cdf(r, pdf_r)), (theta, _cdf(theta, pdf_t)), (phi, _cdf(phi, pdf_p))
+
+
+def sample(system, n, l, m, n_points=10**6, real=True, Z=1.0, seed=0, batch=BATCH):
+    """
+    |ψ_nlm|² 에서 n_points 개 점.
+    반환: (xyz (n_points, 3) float32, value (n_points,) float32)
+      value — 실수형: ψ 의 부호 (±1),  복소형: 위상 arg ψ ∈ (−π, π]
+    """
+    (r_t, cr), (t_t, ct), (p_t, cp) = marginal_tables(system, n, l, m, real, Z)
+    # 부호용 R(r), P̃(θ) 도 같은 표에서 보간 (무작위 θ 로 Legendre 열 캐시를 채우지 않도록)
+    R_t = radial(system, n, l, r_t, Z)
+    P_t = spherical.legendre(l, abs(m), t_t)
+    cs = (-1.0) ** abs(m)
+    rng = np.random.default_rng(seed)
+    xyz = np.empty((n_points, 3), dtype=np.float32)
+    value = np.empty(n_points, dtype=np.float32)
+    for start in range(0, n_points, batch):
+        stop = min(start + batch, n_points)
+        u = rng.random((3, stop - start))
+        r = np.interp(u[0], cr, r_t)
+        th = np.interp(u[1], ct, t_t)
+        ph = np.interp(u[2], cp, p_t)
+        s = np.sin(th)
+        xyz[start:stop, 0] = r * s * np.cos(ph)
+        xyz[start:stop, 1] = r * s * np.sin(ph)
+        xyz[start:stop, 2] = r * np.cos(th)
+        sign = np.sign(np.interp(r, r_t, R_t) * np.interp(th, t_t, P_t))
+        if real:
+            if m > 0:
+                sign *= cs * np.sign(np.cos(m * ph))
+            elif m < 0:
+                sign *= cs * np.sign(np.sin(-m * ph))
+            value[start:stop] = sign
+        else:
+            value[start:stop] = np.angle((cs if m < 0 else 1.0) * sign * np.exp(1j * m * ph))
+    return xyz, value
+
+
+def decimate(xyz, value, n_show, seed=0):
+    """브라우저로 보낼 n_show 개 무작위 부분집합."""
+    if len(xyz) <= n_show:
+        return xyz, value
+    idx = np.random.default_rng(seed).choice(len(xyz), n_show, replace=False)
+    return xyz[idx], value[idx]
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+페이지 03–06 의 공유 캐시 계산 — 페이지와 서버 시작 예열(qsuite.warmup)이 같은 캐시 키를 쓰도록 라이브러리에 둔다
+────────────────────────────────────────────
+• 캐시 키는 (파일·함수 이름, 인자) 이므로 페이지 스크립트 안에 정의한 함수는 밖에서 미리 채울 수 없다
+  → 여기 정의하고 페이지는 import 해서 부른다
+• 슬라이더·버튼 선택지도 여기 상수로 두어 페이지와 예열 계획이 항상 같은 값을 쓴다
+"""
+
+import time
+
+import numpy as np
+
+from qsuite import correspondence, memo, observables, oscillator2d, quadrature, wavepacket
+
+GRAM_OPTIONS = (10, 50, 100, 200, 500, 1000)      # 페이지 03 정규직교성 검증 n_max
+PSI_TABLE_COUNT = 10                               # 페이지 03 sympy ψₙ 표 (n = 0 … 9)
+UNCERTAINTY_N_MAX = 5000                           # 페이지 03 기댓값 표
+QUANTUM_MAX_2D = 4                                 # 페이지 04, 05 양자수 슬라이더 0 … 4
+GAMMAS = tuple(round(0.1 * k, 1) for k in range(1, 21))   # 페이지 05 결합강도 γ 슬라이더 0.1 … 2.0
+LARGE_N = (1000, 10000, 100000)                    # 페이지 06 큰 n 버튼
+SUPERPOSITION_DEFAULT = ((0, 0, 0.0), (1, 0, 0.0), (0, 1, 0.5))   # 페이지 04 중첩 기본값 (n₁, n₂, 위상/π) — 원운동
+
+
+# ─────────────────────────────────────────────
+# 페이지 03
+# ─────────────────────────────────────────────
+@memo.shared(max_entries=8)
+def orthonormality_check(n_max):
+    """(G₀₀, max 대각 오차, max 비대각, |G − I|, 계산 시간)."""
+    t0 = time.perf_counter()
+    G = quadrature.gram_matrix(n_max)
+    elapsed = time.perf_counter() - t0
+    dev = np.abs(G - np.eye(n_max + 1))
+    return G[0, 0], float(np.max(np.diag(dev))), float(np.max(dev - np.diag(np.diag(dev)))), dev, elapsed
+
+
+@memo.shared(max_entries=2)
+def normalized_psi_table(n_count, y_max=4.0, points=600):
+    """sympy 로 전개·단순화한 ψₙ(y) 의 LaTeX 표 행과 격자 값 (n_count, points)."""
+    import sympy as sp
+
+    y = sp.Symbol("y", real=True)
+    ys_ = np.linspace(-y_max, y_max, points)
+    rows, curves = [], []
+    for n in range(n_count):
+        Hn = sp.hermite(n, y)
+        Nn = 1/sp.sqrt(2**n * sp.factorial(n) * sp.sqrt(sp.pi))
+        psi_n = sp.simplify(Nn * Hn * sp.exp(-y**2/2))
+        latex_expr = sp.latex(psi_n).replace(r"\mathrm{e}", "e").replace(r"\left", "").replace(r"\right", "")
+        rows.append(f"| {n} | $\\psi_{{{n}}}(y)={latex_expr}$ |")
+        curves.append(sp.lambdify(y, psi_n, "numpy")(ys_))
+    return tuple(rows), np.array(curves)
+
+
+@memo.shared(max_entries=4)
+def uncertainty_table(n_max):
+    """(n, ⟨y⁴⟩, Δy, Δp, ΔyΔp) — n = 0 … n_max (무차원)."""
+    ns = np.arange(n_max + 1)
+    dy, dp, prod = observables.uncertainty(ns)
+    return ns, observables.moment("x", 4, ns), dy, dp, prod
+
+
+# ─────────────────────────────────────────────
+# 페이지 04, 05
+# ─────────────────────────────────────────────
+@memo.shared(max_entries=640)
+def density_grid(n1, n2, omega1=1.0, omega2=1.0, extent=3.0, n_grid=120, hbar=1.0, m=1.0):
+    """±extent 정사각 격자 (n_grid²) 위의 |Ψₙ₁ₙ₂|² — (X, Y) 는 호출자가 같은 linspace 로 만든다."""
+    v = np.linspace(-extent, extent, n_grid)
+    X, Y = np.meshgrid(v, v)
+    return oscillator2d.density(n1, n2, X, Y, omega1, omega2, hbar, m)
+
+
+@memo.shared(max_entries=8)
+def axis_basis(n_max, extent=4.0, n_grid=80):
+    """±extent 격자 위의 ψ₀ … ψ_{n_max} (무차원) — 중첩 프레임이 공유하는 축별 기저."""
+    return oscillator2d.axis_basis(n_max, np.linspace(-extent, extent, n_grid))
+
+
+@memo.shared(max_entries=16, ttl=7200)
+def superposition_frames(terms, n_frames=240, periods=1.0, extent=4.0, n_grid=80, dtype="uint8"):
+    """
+    terms = ((n₁, n₂, 위상/π), …) 같은 크기 계수의 중첩 → (격자, ωt, 양자화 프레임 (T, n_grid, n_grid), scale).
+    기저는 axis_basis 캐시에서, 프레임은 위상 회전만으로 (무차원, ω₁ = ω₂ = 1).
+    """
+    modes = [(n1, n2) for n1, n2, _ in terms]
+    coeffs = np.exp(1j * np.pi * np.array([phase for *_, phase in terms], dtype=float)) / np.sqrt(len(terms))
+    basis = axis_basis(QUANTUM_MAX_2D, extent, n_grid)
+    times = np.linspace(0, 2 * np.pi * periods, n_frames, endpoint=False)
+    frames = oscillator2d.superposition_frames(modes, coeffs, basis, basis, times)
+    q, scale = wavepacket.quantize_frames(frames, dtype)
+    return np.linspace(-extent, extent, n_grid), times, q, scale
+
+
+# ─────────────────────────────────────────────
+# 페이지 06
+# ─────────────────────────────────────────────
+@memo.shared(max_entries=64)
+def compute_probabilities(n, ħ, m, ω, max_points=4000):
+    """(x, |ψₙ|², 고전 P(x)) — n ≤ 1000 정확한 점화식, 그 이상은 균일 WKB 점근식, 표시용 점 수로 축소."""
+    return correspondence.densities(n, ħ, m, ω, max_points)
+
+
+@memo.shared(max_entries=256)
+def compute_averages(n, ħ, m, ω):
+    """양자 ⟨x²⟩, ⟨x⁴⟩ (사다리 연산자) 와 고전 시간 평균, Δx, Δp, ΔxΔp."""
+    x2, x4 = observables.moment("x", 2, n, ħ, m, ω), observables.moment("x", 4, n, ħ, m, ω)
+    x2_cl, x4_cl = observables.classical_moment("x", 2, n, ħ, m, ω), observables.classical_moment("x", 4, n, ħ, m, ω)
+    dx, dp, prod = observables.uncertainty(n, ħ, m, ω)
+    return dict(x2=x2, x4=x4, x2_cl=x2_cl, x4_cl=x4_cl, dx=dx, dp=dp, prod=prod)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+QEq 전하 평형화 — 라그랑주 승수를 포함한 선형계
+────────────────────────────────────────────
+• χᵢ + Jᵢ qᵢ + Σ_{j≠i} qⱼ / Rᵢⱼ = λ,   Σ qᵢ = Q_total
+  → (N+1) × (N+1) 경계 행렬 [[A, 1], [1ᵀ, 0]] [q; −λ] = [−χ; Q_total] 를 한 번에 푼다
+• A 는 대각 J, 비대각 1/R (페이지 99 와 같은 단위계)
+"""
+
+import numpy as np
+
+
+def qeq_matrix(J, R):
+    """(N+1) × (N+1) 경계 행렬."""
+    J = np.asarray(J, dtype=float)
+    R = np.asarray(R, dtype=float)
+    N = len(J)
+    A = np.zeros((N + 1, N + 1))
+    off = ~np.eye(N, dtype=bool)
+    A[:N, :N][off] = 1.0 / R[off]
+    A[np.arange(N), np.arange(N)] = J
+    A[:N, -1] = 1.0
+    A[-1, :N] = 1.0
+    return A
+
+
+def solve_qeq(chi, J, R, Q_total=0.0):
+    """평형 전하 q (N,) 와 공통 화학 퍼텐셜 λ."""
+    chi = np.asarray(chi, dtype=float)
+    b = np.append(-chi, Q_total)
+    q_lambda = np.linalg.solve(qeq_matrix(J, R), b)
+    return q_lambda[:-1], q_lambda[-1]
+
+
+def chain_distances(N):
+    """페이지 99 의 일렬 배치 거리 Rᵢⱼ = |i − j| + 1 (대각은 1, 쓰이지 않음)."""
+    i = np.arange(N)
+    R = np.abs(i[:, None] - i[None, :]) + 1.0
+    np.fill_diagonal(R, 1.0)
+    return R
+
+
+def site_energy(chi, J, q):
+    """원자별 Eᵢ(qᵢ) = χᵢ qᵢ + ½ Jᵢ qᵢ² (브로드캐스팅)."""
+    return np.asarray(chi) * q + 0.5 * np.asarray(J) * q**2
+
+
+def total_energy(chi, J, R, q):
+    """E({q}) = Σ (χq + ½Jq²) + ½ Σ_{i≠j} qᵢqⱼ / Rᵢⱼ."""
+    q = np.asarray(q, dtype=float)
+    R = np.asarray(R, dtype=float)
+    off = ~np.eye(len(q), dtype=bool)
+    coulomb = 0.5 * np.sum((q[:, None] * q[None, :])[off] / R[off])
+    return float(np.sum(site_energy(chi, J, q)) + coulomb)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Gauss–Hermite 구적법과 ψₙ 정규직교성 검증
+────────────────────────────────────────────
+• N 점 규칙 ∫ e^{−x²} p(x) dx = Σ wᵢ p(xᵢ) 는 차수 2N−1 이하 다항식에서 정확
+  → ψₙψₘ = (다항식) · e^{−x²} 이므로 N = n_max + 1 점이면 ∫ψₙψₘ dx 가 (반올림 오차 빼고) 정확
+• 큰 N 에서 wᵢ 는 언더플로하므로 e^{xᵢ²} 를 곱한 함수 가중치 w̃ᵢ = 1 / (N ψ_{N−1}(xᵢ)²) 를 쓴다
+    ∫ f(x) dx ≈ Σ w̃ᵢ f(xᵢ)   (f = ψₙψₘ 이면 정확)
+• 노드 생성
+    N ≤ GW_MAX : Golub–Welsch — 3중대각 Jacobi 행렬 (대각 0, 부대각 √(k/2)) 의 고유값
+    N >  GW_MAX : 점근식 — Airy 영점 aₖ 에 대응하는 WKB 작용 S(xₖ) = ⅔|aₖ|^{3/2} 을 풀어 초기값,
+                  정규화 점화식(qsuite.hermite)으로 ψ_N 에 대한 Newton 보정 (O(N²), 행렬 없음)
+• 명령행: python -m qsuite.quadrature  — 정확도 회귀 검사 (실패 시 종료 코드 1)
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.linalg import eigh_tridiagonal
+
+from qsuite.hermite import _recurrence, hermite_functions
+
+GW_MAX = 100
+TOLERANCE = 1e-12
+
+
+# ─────────────────────────────────────────────
+# 노드 생성
+# ─────────────────────────────────────────────
+def _psi_pair(N, x):
+    """노드 x 에서 ψ_N / ψ_{N−1} 비와 ψ_{N−1} — 점화식의 공통 스케일은 비에서 상쇄된다."""
+    prev = None
+    for k, s, log in _recurrence(N, x):
+        if k == N:
+            break
+        prev = (s, log)
+    s_prev, log_prev = prev
+    with np.errstate(under="ignore"):
+        return s / s_prev * np.exp(log - log_prev), s_prev * np.exp(log_prev)
+
+
+def _newton(N, x, iterations=8):
+    """ψ_N(x) = 0 의 Newton 보정. 노드에서 ψ_N′ = √(2N) ψ_{N−1} − x ψ_N."""
+    for _ in range(iterations):
+        ratio, _ = _psi_pair(N, x)
+        dx = ratio / (np.sqrt(2.0 * N) - x * ratio)
+        x = x - dx
+        if np.max(np.abs(dx)) < 1e-15 * max(1.0, float(np.max(np.abs(x)))):
+            break
+    return x
+
+
+def _airy_zeros(k):
+    """Ai 의 k 번째 영점 점근식 aₖ = −T(3π(4k−1)/8)."""
+    t = 3 * np.pi * (4 * np.asarray(k, dtype=float) - 1) / 8
+    return -t ** (2.0 / 3.0) * (1 + 5 / 48 * t**-2 - 5 / 36 * t**-4 + 77125 / 82944 * t**-6)
+
+
+def golub_welsch(N):
+    """양의 노드 (오름차순) — Jacobi 행렬 고유값."""
+    off = np.sqrt(np.arange(1, N) / 2.0)
+    x = eigh_tridiagonal(np.zeros(N), off, eigvals_only=True)
+    return x[x > 1e-14 * np.sqrt(N)] if N % 2 == 0 else x[N // 2 + 1:]
+
+
+def asymptotic_nodes(N):
+    """
+    양의 노드 (오름차순) — 전환점 x₀ = √(2N+1) 에서부터 k 번째 노드가
+    ½x₀²(arccos u − u√(1−u²)) = ⅔|aₖ|^{3/2},  u = x/x₀  를 만족하도록 이분법으로 풀고 Newton 보정.
+    """
+    k = np.arange(1, N // 2 + 1)
+    x0 = np.sqrt(2.0 * N + 1.0)
+    target = (4.0 / 3.0) * (-_airy_zeros(k)) ** 1.5 / x0**2
+    lo, hi = np.zeros(k.size), np.ones(k.size)
+    for _ in range(60):
+        u = 0.5 * (lo + hi)
+        f = np.arccos(u) - u * np.sqrt(1 - u * u)        # u 에 대해 감소
+        big = f > target
+        lo, hi = np.where(big, u, lo), np.where(big, hi, u)
+    return _newton(N, (0.5 * (lo + hi) * x0)[::-1])
+
+
+def nodes(N):
+    """
+    N 점 Gauss–Hermite 노드 x (오름차순) 와 함수 가중치 w̃ = wᵢ e^{xᵢ²} = 1/(N ψ_{N−1}(xᵢ)²).
+    """
+    if N < 1:
+        raise ValueError(f"need N >= 1 (got N={N})")
+    pos = golub_welsch(N) if N <= GW_MAX else asymptotic_nodes(N)
+    x = np.concatenate((-pos[::-1], [0.0] if N % 2 else [], pos))
+    _, psi_prev = _psi_pair(N, x)
+    return x, 1.0 / (N * psi_prev**2)
+
+
+def gauss_hermite(N):
+    """표준 규칙 (x, w) — ∫ e^{−x²} p dx ≈ Σ w p(x). 큰 |x| 의 w 는 0 으로 언더플로할 수 있다."""
+    x, wt = nodes(N)
+    with np.errstate(under="ignore"):
+        return x, wt * np.exp(-x * x)
+
+
+# ─────────────────────────────────────────────
+# 정규직교성 검증
+# ─────────────────────────────────────────────
+def gram_matrix(n_max, n_nodes=None):
+    """G_nm = ∫ψₙψₘ dx (n, m = 0 … n_max) — 구적 노드 n_nodes (기본 n_max + 1, 정확한 최소값)."""
+    x, wt = nodes(n_max + 1 if n_nodes is None else n_nodes)
+    psi = hermite_functions(n_max, x)
+    return (psi * wt) @ psi.T
+
+
+def orthonormality_error(n_max, n_nodes=None):
+    """(max |G_nn − 1|, max_{n≠m} |G_nm|)."""
+    G = gram_matrix(n_max, n_nodes)
+    diag = float(np.max(np.abs(np.diag(G) - 1.0)))
+    off = float(np.max(np.abs(G - np.diag(np.diag(G)))))
+    return diag, off
+
+
+def check(n_max=1000, tol=TOLERANCE):
+    """
+    회귀 검사 목록 — (이름, 오차, 통과 여부).
+    노드는 scipy.special.roots_hermite 와, 적분은 δₙₘ 과 비교한다.
+    """
+    from scipy.special import roots_hermite
+
+    rows = []
+    for N in (5, 40, GW_MAX, GW_MAX + 1, 500, n_max + 1):
+        x, _ = nodes(N)
+        ref = roots_hermite(N)[0]
+        err = float(np.max(np.abs(x - ref) / np.maximum(1.0, np.abs(ref))))
+        rows.append((f"nodes N={N}", err, err < tol))
+    x, w = gauss_hermite(20)
+    err = abs(float(np.sum(w)) - np.sqrt(np.pi)) / np.sqrt(np.pi)
+    rows.append(("sum w = √π (N=20)", err, err < tol))
+    for n in sorted({10, GW_MAX, n_max}):
+        diag, off = orthonormality_error(n)
+        rows.append((f"∫ψₙψₘ = δₙₘ, n ≤ {n}", max(diag, off), max(diag, off) < tol))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gauss–Hermite 구적 / ψₙ 정규직교성 회귀 검사")
+    parser.add_argument("--n-max", type=int, default=1000)
+    parser.add_argument("--tol", type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    rows = check(args.n_max, args.tol)
+    for name, err, ok in rows:
+        print(f"  {'ok  ' if ok else 'FAIL'}  {name:<28} {err:.2e}")
+    print(f"{sum(not ok for *_, ok in rows)} failure(s), {time.perf_counter() - t0:.2f} s")
+    raise SystemExit(0 if all(ok for *_, ok in rows) else 1)
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+헤드리스 그림·데이터 생성기 — 페이지 02–06, 99, 100, 101
+────────────────────────────────────────────
+• 페이지마다 렌더러 하나: 매개변수 dict → (matplotlib 그림 dict, 배열 dict)
+  계산은 전부 qsuite 라이브러리 함수 (페이지 스크립트와 같은 코드 경로)
+• 매개변수 조합 × 페이지 를 작업(job)으로 펼쳐 프로세스 풀에 분배
+• 작업마다 <out>/<page>/<그림>__<태그>.{png,svg} 와 <page>__<태그>.npz (배열 + 매개변수 JSON) 저장
+명령행:
+    python -m qsuite.render --out figures --workers 8
+    python -m qsuite.render --pages 04 05 --set nx=0,1,2 --set ny=0,1 --formats png svg
+    python -m qsuite.render --config semester.json        # {"04": [{"nx": 1, "ny": 2}, …], …}
+  --set 값이 쉼표로 나뉘면 (튜플) 스윕, 대괄호 리스트는 단일 값으로 취급한다.
+"""
+
+import argparse
+import ast
+import inspect
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+from scipy.special import eval_hermite  # noqa: E402
+
+from qsuite import (correspondence, hermite, maxwell, normalmodes, oscillator2d, qeq,  # noqa: E402
+                    schrodinger, series, shooting, thermostat)
+
+FORMATS = ("png", "svg")
+DPI = 150
+
+
+def _style(ax, title, xlabel, ylabel):
+    ax.set_title(title, fontsize=12)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+
+# ─────────────────────────────────────────────
+# 페이지별 렌더러
+# ─────────────────────────────────────────────
+def render_02(n_max=6, lam=6.5, parity=0, order=2000, y_max=12.0, potential="harmonic", n_levels=100):
+    """Hermite 다항식, 급수 절단에 따른 발산, Numerov 고유값."""
+    figs, data = {}, {}
+    ys = np.linspace(-2, 3, 400)
+    H = np.array([eval_hermite(n, ys) for n in range(n_max + 1)])
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for n in range(n_max + 1):
+        ax.plot(ys, H[n], lw=2, label=f"$H_{n}$")
+    ax.set_ylim(-55, 55)
+    ax.legend(fontsize=9)
+    _style(ax, rf"Hermite polynomials $H_0 \sim H_{{{n_max}}}$", "$y$", "$H_n(y)$")
+    figs["hermite_polynomials"] = fig
+    data.update(hermite_y=ys, hermite_H=H)
+
+    n_near = 2 * int(round((lam / 2 - parity) / 2)) + parity
+    lam_q = float(2 * max(n_near, parity))
+    y_ser = np.linspace(0, y_max, 1200)
+    orders = sorted({M for M in (10, 50, 200, 1000) if M < order} | {order})
+    curves = np.array([series.log_wavefunction(np.array([lam, lam_q]), y_ser, M, parity)[0] for M in orders])
+    fig, (a, b) = plt.subplots(1, 2, figsize=(12, 4.5))
+    for M, c in zip(orders, plt.cm.viridis(np.linspace(0, 0.9, len(orders)))):
+        a.plot(y_ser, curves[orders.index(M), 0], color=c, lw=1.8, label=f"M = {M}")
+    for ax in (a, b):
+        ax.plot(y_ser, 0.5 * y_ser**2, color="gray", ls="--", lw=1.2, label=r"$+y^2/2$")
+    b.plot(y_ser, curves[-1, 0], color="crimson", lw=2, label=rf"$\lambda = {lam:g}$")
+    b.plot(y_ser, curves[-1, 1], color="navy", lw=2, label=rf"$\lambda = {lam_q:g}$")
+    a.legend(fontsize=8)
+    b.legend(fontsize=8)
+    _style(a, rf"$\ln|\psi_M(y)|$, $\lambda = {lam:g}$", "$y$", r"$\ln|\psi_M|$")
+    _style(b, f"non-quantized vs quantized (M = {order})", "$y$", "")
+    figs["series_truncation"] = fig
+    data.update(series_y=y_ser, series_orders=np.array(orders), series_log_psi=curves)
+
+    n_levels = min(n_levels, shooting.bound_count(potential) or n_levels)   # Morse: 속박 상태까지만
+    alphas, _ = shooting.find_levels(n_levels, W=shooting.POTENTIALS[potential])
+    ns = np.arange(n_levels)
+    fig, ax = plt.subplots(figsize=(7, 4.5))
+    ax.plot(ns, alphas, "o", ms=3.5, color="navy", label=r"Numerov $\alpha_n$")
+    if potential == "harmonic":
+        ax.plot(ns, 2 * ns + 1, color="red", lw=1.2, ls="--", label="$2n+1$")
+    elif potential == "morse":
+        ax.plot(ns, shooting.morse_levels(ns), color="red", lw=1.2, ls="--", label="analytic")
+        ax.axhline(shooting.MORSE_D, color="gray", lw=1, ls=":", label=r"$W(\infty)$")
+    ax.legend(fontsize=9)
+    _style(ax, f"shooting eigenvalues — {potential}", "$n$", r"$\alpha_n$")
+    figs["shooting_levels"] = fig
+    data.update(shooting_alpha=alphas)
+    return figs, data
+
+
+def render_03(n_max=9, omega=2.0, potential="anharmonic", method="fd", n_points=10000, k=10):
+    """에너지 준위 위의 ψₙ, |ψₙ|² 와 임의 퍼텐셜의 수치 고유상태."""
+    figs, data = {}, {}
+    ys = np.linspace(-4, 4, 600)
+    psi = hermite.hermite_functions(n_max, ys)
+    E = (np.arange(n_max + 1) + 0.5) * omega
+    V = 0.5 * omega**2 * ys**2
+    colors = plt.cm.viridis(np.linspace(0, 1, n_max + 2)[:-1])
+    for name, curve, scale in (("wavefunctions", psi, 1.2), ("densities", psi**2, 3.0)):
+        fig, ax = plt.subplots(figsize=(9, 6))
+        ax.plot(ys, V, color="red", lw=2.5, label="$V(y)$")
+        for n in range(n_max + 1):
+            ax.plot(ys, curve[n] * scale + E[n], color=colors[n], lw=1.8, label=f"n={n}")
+            ax.axhline(E[n], color="gray", linestyle="--", lw=0.6, alpha=0.4)
+        ax.set_xlim(-4, 4)
+        ax.set_ylim(-0.5, E[-1] + omega)
+        ax.legend(loc="upper right", ncol=2, fontsize=8)
+        _style(ax, r"$\psi_n(y)$" if name == "wavefunctions" else r"$|\psi_n(y)|^2$", "$y$", r"$E_n$")
+        figs[name] = fig
+    data.update(y=ys, psi=psi, E=E)
+
+    lo, hi = schrodinger.DOMAINS[potential]
+    E_num, x_num, psi_num = schrodinger.solve(schrodinger.POTENTIALS[potential], lo, hi, n_points, k=k, method=method)
+    V_num = schrodinger.POTENTIALS[potential](x_num)
+    stride = max(1, len(x_num) // 2000)
+    spacing = np.diff(E_num).mean()
+    fig, ax = plt.subplots(figsize=(9, 6))
+    ax.plot(x_num[::stride], V_num[::stride], color="red", lw=2.5)
+    for n in range(k):
+        ax.plot(x_num[::stride], psi_num[n, ::stride] * spacing * 0.6 + E_num[n], color=plt.cm.viridis(n / k), lw=1.5)
+        ax.axhline(E_num[n], color="gray", linestyle="--", lw=0.6, alpha=0.4)
+    inside = V_num <= E_num[-1] + spacing
+    ax.set_xlim(x_num[inside].min() - 1, x_num[inside].max() + 1)
+    ax.set_ylim(V_num.min() - 0.5 * spacing, E_num[-1] + 1.5 * spacing)
+    _style(ax, f"numerical eigenstates — {potential} ({method})", "$x$", "$E$")
+    figs["numerical_states"] = fig
+    data.update(numerical_E=E_num, numerical_x=x_num[::stride], numerical_psi=psi_num[:, ::stride])
+    return figs, data
+
+
+def _density_figure(X, Y, Z, title, xlabel, ylabel):
+    fig, ax = plt.subplots(figsize=(6, 5.2))
+    im = ax.pcolormesh(X, Y, Z, cmap="viridis", shading="auto")
+    ax.contour(X, Y, Z, levels=8, colors="white", linewidths=0.5, alpha=0.6)
+    fig.colorbar(im, ax=ax, label=r"$|\Psi|^2$")
+    ax.set_aspect("equal")
+    _style(ax, title, xlabel, ylabel)
+    return fig
+
+
+def render_04(nx=1, ny=1, extent=3.0, n_grid=120):
+    """등방 2D 진동자 |Ψ_{nₓnᵧ}(x, y)|²."""
+    ax_ = np.linspace(-extent, extent, n_grid)
+    X, Y = np.meshgrid(ax_, ax_)
+    Z = oscillator2d.density(nx, ny, X, Y)
+    fig = _density_figure(X, Y, Z, rf"$|\Psi_{{{nx}{ny}}}(x,y)|^2$,  $E = {nx + ny + 1}\hbar\omega$", "$x$", "$y$")
+    return {"density": fig}, {"x": ax_, "y": ax_, "density": Z}
+
+
+def render_05(gamma=1.0, n1=1, n2=1, extent=3.0, n_grid=180, chain_n=200, chain_k=40):
+    """결합 진동자의 유효 진동수 밀도와 사슬 정규 모드 분산."""
+    w1, w2 = oscillator2d.effective_frequencies(gamma)
+    ax_ = np.linspace(-extent, extent, n_grid)
+    X, Y = np.meshgrid(ax_, ax_)
+    Z = oscillator2d.density(n1, n2, X, Y, w1, w2)
+    E = oscillator2d.energy(n1, n2, w1, w2)
+    fig = _density_figure(X, Y, Z, rf"$\gamma={gamma:g}$, $\omega_1={w1:.3f}$, $\omega_2={w2:.3f}$, $E={E:.3f}$",
+                          "$X$", "$Y$")
+    omegas, _ = normalmodes.normal_modes(normalmodes.chain_hessian(chain_n), k=min(chain_k, chain_n))
+    exact = normalmodes.chain_frequencies(chain_n)[: len(omegas)]
+    fig2, ax = plt.subplots(figsize=(7, 4.5))
+    ax.plot(np.arange(1, len(omegas) + 1), omegas, "o", ms=3.5, color="navy", label="eigh")
+    ax.plot(np.arange(1, len(omegas) + 1), exact, color="red", lw=1.2, ls="--", label=r"$2\sin(j\pi/2(N+1))$")
+    ax.legend(fontsize=9)
+    _style(ax, f"chain normal modes (N = {chain_n})", "$j$", r"$\omega_j$")
+    return ({"density": fig, "chain_dispersion": fig2},
+            {"x": ax_, "y": ax_, "density": Z, "omega": np.array([w1, w2]), "chain_omega": omegas})
+
+
+def render_06(n=20, max_points=4000):
+    """|ψₙ|² 와 고전 확률밀도 비교."""
+    x, psi2, P = correspondence.densities(n, max_points=max_points)
+    x0 = float(hermite.classical_amplitude(n))
+    fig, ax = plt.subplots(figsize=(9, 4.5))
+    ax.plot(x, psi2, color="royalblue", lw=1.0 if n > 200 else 1.6, label=r"$|\psi_n(x)|^2$")
+    inside = np.abs(x) < x0
+    ax.plot(x[inside], P[inside], color="crimson", lw=2, label=r"$P_{cl}(x)$")
+    ax.set_ylim(0, 3.0 * P[inside].min() if inside.any() else None)
+    ax.legend(fontsize=9)
+    _style(ax, f"quantum vs classical, n = {n}", "$x$", "probability density")
+    return {"correspondence": fig}, {"x": x, "quantum": psi2, "classical": P}
+
+
+def render_99(chi=None, J=None, Q_total=0.0, N=3):
+    """QEq 평형 전하와 원자별 전하–에너지 곡선."""
+    chi = np.linspace(-1, 1, N) if chi is None else np.asarray(chi, dtype=float)
+    J = np.full(len(chi), 5.0) if J is None else np.asarray(J, dtype=float)
+    R = qeq.chain_distances(len(chi))
+    q, lam = qeq.solve_qeq(chi, J, R, Q_total)
+    fig, ax = plt.subplots(figsize=(7, 4))
+    normed = (q - q.min()) / (q.max() - q.min() + 1e-6)
+    ax.bar(np.arange(1, len(q) + 1), q, color=plt.cm.coolwarm(normed), edgecolor="black")
+    _style(ax, rf"equilibrated charges, $\lambda = {lam:.4f}$", "atom", "$q_i$")
+    q_space = np.linspace(-2, 2, 200)
+    curves = qeq.site_energy(chi[:, None], J[:, None], q_space[None, :])
+    fig2, ax2 = plt.subplots(figsize=(7, 4))
+    for i, c in enumerate(curves):
+        ax2.plot(q_space, c, label=f"atom {i + 1}")
+    ax2.legend()
+    _style(ax2, r"$E_i(q_i) = \chi_i q_i + \frac{1}{2}J_i q_i^2$", "$q_i$", "$E_i$")
+    return ({"charges": fig, "site_energy": fig2},
+            {"chi": chi, "J": J, "R": R, "q": q, "lambda": np.array(lam), "q_space": q_space, "site_energy": curves})
+
+
+def render_100(T=300.0, m=4.65e-26, Ea_kJ=50.0, sigma_A2=30.0):
+    """속력 분포, 특성 속도, 아레니우스 플롯."""
+    v = np.linspace(0, 4000, 600)
+    f_v = maxwell.speed_pdf(v, T, m)
+    speeds = maxwell.characteristic_speeds(T, m)
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    ax.plot(v, f_v, lw=3)
+    for s, c, lab in zip(speeds, ("red", "green", "blue"), (r"$v_{mp}$", r"$v_{mean}$", r"$v_{rms}$")):
+        ax.axvline(float(s), color=c, ls="--", label=lab)
+    ax.set_xlim(0, 4000)
+    ax.legend()
+    _style(ax, f"Maxwell–Boltzmann, T = {T:g} K, m = {m:.2e} kg", "$v$ (m/s)", "$f(v)$")
+    Ea = Ea_kJ * 1e3 / maxwell.N_A
+    T_arr = np.linspace(200, 1500, 200)
+    inv_T, lnk = maxwell.arrhenius_plot_data(T_arr, Ea, m, sigma_A2 * 1e-20)
+    Ea_app, _ = maxwell.arrhenius_fit(T_arr, lnk)
+    fig2, ax2 = plt.subplots(figsize=(8, 4.5))
+    ax2.plot(1e3 * inv_T, lnk / np.log(10), lw=3)
+    _style(ax2, f"Arrhenius plot (apparent $E_a$ ≈ {Ea_app * maxwell.N_A / 1e3:.1f} kJ/mol)",
+           "1000 / T (1/K)", r"$\log_{10} k$ (m³/s)")
+    return ({"speed_distribution": fig, "arrhenius": fig2},
+            {"v": v, "f_v": f_v, "speeds": np.array(speeds, dtype=float), "inv_T": inv_T, "lnk": lnk,
+             "tail_fraction": np.asarray(maxwell.tail_fraction(T, Ea, dof=3))})
+
+
+def render_101(tdamps=(0.5, 2.0, 5.0), t_max=10.0, T_target=thermostat.T_TARGET):
+    """Tdamp 별 감쇠 온도 곡선."""
+    t = np.linspace(0, t_max, 300)
+    curves = np.array([thermostat.temp_profile(t, td, T_target) for td in tdamps])
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    for td, c in zip(tdamps, curves):
+        ax.plot(t, c, lw=2.5, label=f"Tdamp={td:g}")
+    ax.axhline(T_target, color="black", ls="--")
+    ax.set_xlim(0, t_max)
+    ax.legend()
+    _style(ax, "Nose–Hoover temperature relaxation (model)", "t (ps)", "T (K)")
+    return {"temperature": fig}, {"t": t, "tdamp": np.array(tdamps, dtype=float), "temperature": curves}
+
+
+RENDERERS = {
+    "02": render_02, "03": render_03, "04": render_04, "05": render_05, "06": render_06,
+    "99": render_99, "100": render_100, "101": render_101,
+}
+
+
+# ─────────────────────────────────────────────
+# 작업 펼치기와 실행
+# ─────────────────────────────────────────────
+def _defaults(page):
+    return {k: p.default for k, p in inspect.signature(RENDERERS[page]).parameters.items()}
+
+
+def parse_value(text):
+    """'3' → 3, '0,1,2' → (0, 1, 2) (스윕), '[0.5,2]' → [0.5, 2], 그 외 문자열 그대로."""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def expand_jobs(pages, overrides=None, config=None):
+    """
+    (page, params) 작업 목록. config 에 페이지가 있으면 그 매개변수 목록을, 없으면
+    overrides 중 그 페이지 렌더러가 받는 키만 골라 튜플 값의 데카르트 곱으로 펼친다.
+    """
+    overrides = overrides or {}
+    config = config or {}
+    jobs = []
+    for page in pages:
+        if page not in RENDERERS:
+            raise ValueError(f"unknown page: {page!r} (choose from {', '.join(RENDERERS)})")
+        keys = _defaults(page)
+        if page in config:
+            sets = config[page] if isinstance(config[page], list) else [config[page]]
+            for params in sets:
+                unknown = set(params) - set(keys)
+                if unknown:
+                    raise ValueError(f"page {page}: unknown parameters {sorted(unknown)}")
+                jobs.append((page, dict(params)))
+            continue
+        mine = {k: v for k, v in overrides.items() if k in keys}
+        sweep = [v if isinstance(v, tuple) else (v,) for v in mine.values()]
+        for combo in itertools.product(*sweep):
+            jobs.append((page, dict(zip(mine, combo))))
+    return jobs
+
+
+def tag(params):
+    """파일 이름용 매개변수 태그 (기본값이면 'default')."""
+    if not params:
+        return "default"
+    parts = []
+    for k, v in sorted(params.items()):
+        v = "-".join(map(str, v)) if isinstance(v, (list, tuple)) else str(v)
+        parts.append(f"{k}{v}")
+    return "_".join(parts).replace("/", "-").replace(" ", "")
+
+
+def run_job(page, params, out_dir, formats=FORMATS, dpi=DPI):
+    """작업자 함수 — 렌더러를 실행하고 그림·배열을 저장한 뒤 (경로 목록, 소요 시간) 을 돌려준다."""
+    t0 = time.perf_counter()
+    figs, data = RENDERERS[page](**params)
+    folder = Path(out_dir) / page
+    folder.mkdir(parents=True, exist_ok=True)
+    name = tag(params)
+    written = []
+    for fig_name, fig in figs.items():
+        fig.tight_layout()
+        for fmt in formats:
+            path = folder / f"{fig_name}__{name}.{fmt}"
+            fig.savefig(path, dpi=dpi)
+            written.append(str(path))
+        plt.close(fig)
+    path = folder / f"{page}__{name}.npz"
+    np.savez_compressed(path, params=json.dumps({**_defaults(page), **params}, default=list), **data)
+    written.append(str(path))
+    return written, time.perf_counter() - t0
+
+
+def render_all(jobs, out_dir, formats=FORMATS, workers=None, progress=None):
+    """작업 목록을 프로세스 풀로 실행. progress(완료 수, 전체 수, 작업, 소요 시간) 콜백."""
+    results = []
+    if workers == 1:
+        for done, (page, params) in enumerate(jobs, 1):
+            files, dt = run_job(page, params, out_dir, formats)
+            results.append((page, params, files, dt))
+            if progress is not None:
+                progress(done, len(jobs), (page, params), dt)
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, page, params, out_dir, formats): (page, params) for page, params in jobs}
+        for done, fut in enumerate(as_completed(futures), 1):
+            files, dt = fut.result()
+            page, params = futures[fut]
+            results.append((page, params, files, dt))
+            if progress is not None:
+                progress(done, len(jobs), (page, params), dt)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="페이지 그림·데이터 일괄 생성 (PNG/SVG/NPZ)")
+    parser.add_argument("--pages", nargs="+", default=list(RENDERERS), choices=list(RENDERERS))
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="매개변수 덮어쓰기 (쉼표로 나열하면 스윕)")
+    parser.add_argument("--config", type=Path, help='JSON: {"04": [{"nx": 1, "ny": 2}, ...], ...}')
+    parser.add_argument("--out", type=Path, default=Path("figures"))
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=["png", "svg", "pdf"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--list", action="store_true", help="페이지별 매개변수와 기본값만 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        for page in args.pages:
+            print(f"{page}: " + ", ".join(f"{k}={v!r}" for k, v in _defaults(page).items()))
+        raise SystemExit(0)
+    overrides = {}
+    for item in args.set:
+        key, _, value = item.partition("=")
+        overrides[key.strip()] = parse_value(value.strip())
+    config = json.loads(args.config.read_text(encoding="utf-8")) if args.config else None
+    jobs = expand_jobs(args.pages, overrides, config)
+
+    t0 = time.perf_counter()
+    report = lambda d, t, job, dt: print(f"  [{d}/{t}] {job[0]} {tag(job[1])}  ({dt:.1f} s)", flush=True)
+    results = render_all(jobs, args.out, args.formats, args.workers, progress=report)
+    n_files = sum(len(r[2]) for r in results)
+    print(f"{len(jobs)} jobs, {n_files} files → {args.out}  ({time.perf_counter() - t0:.1f} s)")
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+큰 n 그래프용 적응 격자 & 다운샘플링
+────────────────────────────────────────────
+• wkb_grid : 국소 WKB 파수 k(x) = √(2n+1 − x²) 에 비례하게 점을 배치
+             → |ψₙ|² 의 모든 노드 사이에 일정 개수의 점 (전환점은 Airy 폭으로 하한)
+• lttb     : Largest-Triangle-Three-Buckets — 곡선 모양을 보존하는 점 선택
+• minmax   : 구간별 최솟값/최댓값 포락선 — 구간 안에 진동이 여러 번 들어갈 때
+• 서버는 전체 해상도로 계산하고, 브라우저(Plotly)에는 수천 점만 보낸다
+"""
+
+import numpy as np
+
+
+def wkb_grid(n, x_max, points_per_node=8, min_points=1500, aux=8192):
+    """
+    [-x_max, x_max] 에서 노드 간격(π/k)마다 points_per_node 개의 점을 두는 비균일 격자.
+    전체 점 수 ≈ points_per_node·(n+1) + 금지영역 몇 개 (n=10⁵ 이면 약 80만 점),
+    작은 n 에서도 곡선이 매끄럽도록 최소 min_points 개.
+    """
+    x0sq = 2.0 * n + 1.0
+    airy_k = (2.0 * np.sqrt(x0sq)) ** (1.0 / 3.0)          # 전환점 부근 Airy 길이의 역수
+    xa = np.linspace(-x_max, x_max, aux)
+    k = np.maximum(np.sqrt(np.abs(x0sq - xa**2)), airy_k)   # 금지영역은 감쇠율 κ 로 분해
+    density = points_per_node * k / np.pi
+    cum = np.concatenate(([0.0], np.cumsum(0.5 * (density[1:] + density[:-1]) * np.diff(xa))))
+    m = max(int(np.ceil(cum[-1])), min_points)
+    return np.interp(np.linspace(0.0, cum[-1], m), cum, xa)
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets 다운샘플링. 첫 점·끝 점은 항상 유지한다."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)     # 가운데 n_out−2 개 구간
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # 다음 구간의 평균점 (마지막 구간은 끝 점)
+        nlo, nhi = hi, edges[b + 2] if b + 2 < len(edges) else n
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[b + 1] = a
+    return x[idx], y[idx]
+
+
+def minmax(x, y, n_buckets):
+    """
+    구간별 (최솟값, 최댓값) 두 점을 x 순서대로 유지 → 2·n_buckets 점.
+    진동이 구간보다 촘촘하면 선이 포락선을 채워 aliasing 없이 보인다.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if 2 * n_buckets >= n:
+        return x, y
+    starts = np.linspace(0, n, n_buckets + 1).astype(int)[:-1]
+    lo_val = np.minimum.reduceat(y, starts)
+    hi_val = np.maximum.reduceat(y, starts)
+    # reduceat 은 값만 주므로, 위치는 구간별 argmin/argmax 를 벡터화해 찾는다
+    bucket = np.repeat(np.arange(n_buckets), np.diff(np.append(starts, n)))
+    pos = np.arange(n)
+    big = n + 1
+    i_lo = np.minimum.reduceat(np.where(y == lo_val[bucket], pos, big), starts)
+    i_hi = np.minimum.reduceat(np.where(y == hi_val[bucket], pos, big), starts)
+    idx = np.sort(np.concatenate((i_lo, i_hi)))
+    idx = idx[np.concatenate(([True], np.diff(idx) > 0))]
+    return x[idx], y[idx]
+
+
+def downsample(x, y, n_out=4000, method="auto"):
+    """
+    method="auto" : 구간당 국소 극값이 2개를 넘으면 minmax, 아니면 lttb.
+    """
+    n = len(x)
+    if n <= n_out:
+        return np.asarray(x), np.asarray(y)
+    if method == "auto":
+        extrema = np.count_nonzero(np.diff(np.sign(np.diff(y))))
+        method = "minmax" if extrema > n_out else "lttb"
+    if method == "minmax":
+        return minmax(x, y, n_out // 2)
+    if method == "lttb":
+        return lttb(x, y, n_out)
+    raise ValueError(f"unknown method: {method!r}")
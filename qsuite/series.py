@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Hermite 급수해 엔진 — 임의 차수 · 임의 λ
+────────────────────────────────────────────
+• 재귀식 a_{m+2} = (2m − λ) / ((m+1)(m+2)) · a_m 을 λ 벡터 전체에 대해 동시에 전개
+• 계수는 (ln|a_m|, 부호) 로 보관 → 차수 10⁴ 에서도 overflow / underflow 없음
+• 절단된 부분합 Σ a_m y^m 은 지수부를 분리한 Horner 법으로 큰 y 격자에서 평가
+• λ = 2n (짝/홀 일치) 이면 a_{n+2} = 0 → 급수 종료 (Hermite 다항식)
+  그 외에는 a_{m+2}/a_m → 2/m 이라 e^{y²} 처럼 발산
+"""
+
+import numpy as np
+
+
+def recursion_coefficients(lam, order, parity=0):
+    """
+    lam    : λ 값 (스칼라 또는 1차원 배열, K개)
+    order  : 최고 차수 m_max
+    parity : 0 = 짝수항 (a₀=1, a₁=0),  1 = 홀수항 (a₀=0, a₁=1)
+    반환   : (m 배열 (M,), ln|a_m| (K, M), sign(a_m) (K, M))
+    """
+    lam = np.atleast_1d(np.asarray(lam, dtype=float))
+    m = np.arange(parity, order + 1, 2)
+    ratio = (2.0 * m[:-1, None] - lam[None, :]) / ((m[:-1, None] + 1.0) * (m[:-1, None] + 2.0))
+    with np.errstate(divide="ignore"):
+        log_ratio = np.log(np.abs(ratio))
+    log_abs = np.concatenate((np.zeros((1, lam.size)), np.cumsum(log_ratio, axis=0))).T
+    sign = np.concatenate((np.ones((1, lam.size)), np.cumprod(np.sign(ratio), axis=0))).T
+    return m, log_abs, sign
+
+
+def coefficients(lam, order, parity=0):
+    """일반 실수 계수 {m: a_m} (작은 차수 표시용, 단일 λ)."""
+    m, log_abs, sign = recursion_coefficients(lam, order, parity)
+    return {int(k): float(s * np.exp(la)) for k, la, s in zip(m, log_abs[0], sign[0])}
+
+
+def partial_sum(lam, y, order, parity=0):
+    """
+    절단 부분합 H_M(y) = Σ_{m ≤ order} a_m y^m 을 (ln|H|, sign) 으로 반환, 모양 (K, len(y)).
+
+    Horner:  S ← S·y² + a_m  (m 내림차순). S = s·e^E 로 두고 매 단계 |s| ≲ 1 이 되도록
+    E 를 갱신한다 → 최고차 계수가 e^{-10⁴} 규모여도 버려지지 않는다.
+    """
+    y = np.asarray(y, dtype=float)
+    m, log_abs, sign = recursion_coefficients(lam, order, parity)
+    K, G = log_abs.shape[0], y.size
+    with np.errstate(divide="ignore", under="ignore", invalid="ignore"):
+        log_y2 = np.log(y**2)[None, :]
+        s = np.zeros((K, G))
+        E = np.full((K, G), -np.inf)
+        for j in range(len(m) - 1, -1, -1):
+            la = log_abs[:, j:j + 1]
+            if np.all(la == -np.inf):          # λ = 2n 로 끝난 뒤의 0 계수
+                continue
+            carried = E + log_y2
+            E_new = np.maximum(np.where(s != 0, carried + np.log(np.abs(s)), -np.inf), la)
+            s = s * np.exp(carried - E_new) + sign[:, j:j + 1] * np.exp(la - E_new)
+            s = np.nan_to_num(s)
+            E = E_new
+        if parity:
+            s = s * np.sign(y)[None, :]
+            E = E + 0.5 * log_y2
+        log_H = np.log(np.abs(s)) + E
+    return log_H, np.sign(s)
+
+
+def log_wavefunction(lam, y, order, parity=0):
+    """ψ_M(y) = H_M(y) e^{-y²/2} 의 (ln|ψ|, sign). 비양자화 λ 에서는 큰 y 에서 e^{+y²/2} 로 발산."""
+    log_H, sgn = partial_sum(lam, y, order, parity)
+    return log_H - 0.5 * np.asarray(y, dtype=float)[None, :] ** 2, sgn
+
+
+def terminating_order(lam, parity=0, tol=1e-12):
+    """λ = 2n 이고 n 의 짝홀이 parity 와 같으면 n (급수가 끝나는 차수), 아니면 None."""
+    n = lam / 2.0
+    k = int(round(n))
+    if abs(n - k) < tol and k >= 0 and k % 2 == parity:
+        return k
+    return None
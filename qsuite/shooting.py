@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Numerov 슈팅법 — 양자화 조건의 수치적 확인
+────────────────────────────────────────────
+• ψ''(y) + (α − W(y)) ψ(y) = 0 를 왼쪽 금지영역에서 오른쪽 끝까지 Numerov 로 적분
+  (조화진동자: W = y², 고유값 α = 2n + 1 = 2E/ħω)
+• 시험 α 벡터 전체를 한 번의 격자 루프로 동시에 적분 (열 = α 하나)
+• 꼬리 ψ(y_max) 의 부호는 α 가 고유값을 지날 때마다 뒤집힌다
+  → 마디 수 N(α) ≤ k 판정으로 모든 준위를 동시에 고립시키고 (다분할 이분법),
+    고립된 구간 안에서는 꼬리 부호로 구간을 유지하며 수렴 (Illinois)
+• W(y) 는 임의의 함수 → 비조화 · 이중우물 · Morse 퍼텐셜에도 그대로 사용
+"""
+
+import numpy as np
+
+_RESCALE = 1e100
+
+MORSE_D, MORSE_A = 50.0, 0.3
+
+# 무차원 퍼텐셜 W(y) 예시 (ψ'' + (α − W)ψ = 0 형태)
+POTENTIALS = {
+    "harmonic": lambda y: y**2,
+    "quartic": lambda y: y**4,
+    "anharmonic": lambda y: y**2 + 0.1 * y**4,
+    "double_well": lambda y: (y**2 - 9.0) ** 2 / 9.0,
+    "morse": lambda y: MORSE_D * (1 - np.exp(-MORSE_A * y)) ** 2,
+}
+
+# 속박 상태가 유한 개인 퍼텐셜의 해리 한계 W(∞) — 그 위의 "준위" 는 유한 격자에 갇힌 연속 상태
+DISSOCIATION = {"morse": MORSE_D}
+
+
+def morse_levels(n, D=MORSE_D, a=MORSE_A):
+    """Morse 속박 준위 해석해 αₙ = 2a√D (n+½) − a² (n+½)²  (n ≤ ⌊√D/a − ½⌋ 에서만 유효)."""
+    v = np.asarray(n) + 0.5
+    return 2 * a * np.sqrt(D) * v - (a * v) ** 2
+
+
+def bound_count(name):
+    """퍼텐셜 name 의 속박 상태 수 (무한하면 None)."""
+    if name == "morse":
+        return int(np.floor(np.sqrt(MORSE_D) / MORSE_A - 0.5)) + 1
+    return None
+
+
+def wkb_count(alpha, W, y):
+    """WKB 준위 수 N(α) ≈ (1/π)∫√(α − W) dy + ½ — 격자 크기를 정하는 데만 쓰는 추정치."""
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+    k = np.sqrt(np.clip(alpha[:, None] - W(y)[None, :], 0.0, None))
+    return k.sum(axis=1) * (y[1] - y[0]) / np.pi + 0.5
+
+
+def default_grid(alpha_max, W=POTENTIALS["harmonic"], pad=5.0, kh=0.1, y_lim=60.0):
+    """
+    α_max 의 고전 허용영역 바깥으로 pad 만큼 여유를 둔 격자.
+    간격 h 는 최대 국소 파수 k = √(α_max − W_min) 에 대해 k·h ≈ kh (Numerov 오차 ∝ (kh)⁴).
+    """
+    probe = np.linspace(-y_lim, y_lim, 24001)
+    Wp = W(probe)
+    allowed = probe[Wp <= alpha_max]
+    lo, hi = allowed.min() - pad, allowed.max() + pad
+    h = kh / np.sqrt(max(alpha_max - Wp.min(), 1.0))
+    return np.linspace(lo, hi, int(np.ceil((hi - lo) / h)) + 1)
+
+
+def numerov(alpha, y, W, keep=False):
+    """
+    시험 α (K,) 에 대해 동시에 적분.
+    반환: (꼬리 부호 (K,), ln|ψ(y_max)| (K,), 마디 수 (K,)) — keep=True 이면 ψ (G, K) 도 함께.
+    ψ(y₀)=0, ψ(y₁)=작은 값 으로 시작 (왼쪽 금지영역의 감쇠해). 오른쪽 금지영역의 발산은
+    _RESCALE 로 나누며 로그 스케일을 따로 누적한다.
+    """
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+    y = np.asarray(y, dtype=float)
+    h2 = (y[1] - y[0]) ** 2 / 12.0
+    Wy = W(y) if callable(W) else np.asarray(W, dtype=float)
+    c = 1.0 + h2 * (alpha[None, :] - Wy[:, None])    # (G, K) Numerov 가중치
+    # ψ_{i+1} = A_i ψ_i − B_i ψ_{i−1}
+    A = (12.0 - 10.0 * c[1:-1]) / c[2:]
+    B = c[:-2] / c[2:]
+    G, K = c.shape
+    psi = np.empty((G, K))
+    psi[0], psi[1] = 0.0, 1e-12
+    prev, cur = psi[0], psi[1]
+    log_scale = np.zeros(K)
+    for i in range(G - 2):
+        nxt = A[i] * cur - B[i] * prev
+        psi[i + 2] = nxt
+        prev, cur = cur, nxt
+        if i % 64 == 0:
+            big = np.abs(cur) > _RESCALE
+            if big.any():
+                prev = np.where(big, prev / _RESCALE, prev)
+                cur = np.where(big, cur / _RESCALE, cur)
+                log_scale += big * np.log(_RESCALE)
+                if keep:
+                    psi[: i + 2, big] /= _RESCALE
+                psi[i + 2] = cur
+    nodes = np.count_nonzero(np.signbit(psi[2:]) != np.signbit(psi[1:-1]), axis=0)
+    with np.errstate(divide="ignore"):
+        log_tail = np.log(np.abs(cur)) + log_scale
+    if keep:
+        return np.sign(cur), log_tail, nodes, psi
+    return np.sign(cur), log_tail, nodes
+
+
+def _upper_bound(n_levels, W, y, w_min):
+    """N(α_hi) > n_levels 인 α_hi 와 (y 가 없으면) 그에 맞춘 격자."""
+    probe = np.linspace(-60.0, 60.0, 24001)
+    trial = w_min + np.geomspace(1e-2, 1e5, 400)
+    alpha_hi = trial[np.searchsorted(wkb_count(trial, W, probe), n_levels + 1.0)]
+    while True:
+        grid = default_grid(alpha_hi, W) if y is None else y
+        if numerov([alpha_hi], grid, W)[2][0] > n_levels:
+            return alpha_hi, grid
+        alpha_hi = w_min + 1.5 * (alpha_hi - w_min)
+
+
+def find_levels(n_levels, y=None, W=POTENTIALS["harmonic"], tol=1e-9, sections=4, max_iter=60):
+    """
+    가장 낮은 n_levels 개의 고유값 α₀ < α₁ < … 과 사용한 격자 y 를 반환.
+
+    1) 마디 수 다분할: k번째 구간 [lo_k, hi_k] 는 항상 N(lo_k) ≤ k < N(hi_k).
+       한 번의 적분에 준위마다 sections−1 개의 시험 α 를 넣어 구간을 1/sections 로 줄이고,
+       모든 준위가 고립되면 (N(lo)=k, N(hi)=k+1) 멈춘다.
+    2) 고립된 구간 안에서는 꼬리 ψ(y_max) 의 부호가 정확히 한 번 바뀐다 →
+       꼬리 부호로 구간을 유지하는 Illinois(수정 가위치법) 로 수렴.
+    """
+    k = np.arange(n_levels)
+    w_min = float(np.min(W(np.linspace(-60.0, 60.0, 24001) if y is None else y)))
+    alpha_hi, y = _upper_bound(n_levels, W, y, w_min)
+    lo = np.full(n_levels, w_min)
+    hi = np.full(n_levels, alpha_hi)
+    n_lo = np.zeros(n_levels, dtype=int)
+    n_hi = np.full(n_levels, n_levels + 1)
+    frac = np.arange(1, sections) / sections
+    while np.any((n_lo != k) | (n_hi != k + 1)):
+        trial = lo[:, None] + (hi - lo)[:, None] * frac[None, :]       # (n_levels, sections−1)
+        nodes = numerov(trial.ravel(), y, W)[2].reshape(trial.shape)
+        # N 은 α 에 대해 단조 → below 는 앞쪽이 True 인 계단
+        j = (nodes <= k[:, None]).sum(axis=1)
+        jl, jh = np.maximum(j - 1, 0), np.minimum(j, sections - 2)
+        lo, n_lo = np.where(j > 0, trial[k, jl], lo), np.where(j > 0, nodes[k, jl], n_lo)
+        hi, n_hi = (np.where(j < sections - 1, trial[k, jh], hi),
+                    np.where(j < sections - 1, nodes[k, jh], n_hi))
+
+    s_end, L_end, _ = numerov(np.concatenate((lo, hi)), y, W)
+    s_lo, L_lo, L_hi = s_end[:n_levels], L_end[:n_levels], L_end[n_levels:]
+    side = np.zeros(n_levels, dtype=int)
+    x = 0.5 * (lo + hi)
+    for _ in range(max_iter):
+        # 가위치: t = |f_lo| / (|f_lo| + |f_hi|)  (로그로 계산)
+        t = 1.0 / (1.0 + np.exp(np.clip(L_hi - L_lo, -700, 700)))
+        x = lo + (hi - lo) * np.clip(t, 1e-12, 1 - 1e-12)
+        s, L, _ = numerov(x, y, W)
+        left = s == s_lo                                          # 근은 [x, hi] 에
+        # Illinois: 같은 쪽 끝이 연속으로 남으면 그 끝의 |f| 를 반으로
+        L_hi = np.where(left & (side == 1), L_hi - np.log(2.0), L_hi)
+        L_lo = np.where(~left & (side == -1), L_lo - np.log(2.0), L_lo)
+        lo, L_lo = np.where(left, x, lo), np.where(left, L, L_lo)
+        hi, L_hi = np.where(left, hi, x), np.where(left, L_hi, L)
+        side = np.where(left, 1, -1)
+        if np.max(hi - lo) < tol * max(1.0, float(hi.max())) or np.all(np.isneginf(L)):
+            break
+    return x, y
+
+
+def wavefunctions(alpha, y, W=POTENTIALS["harmonic"]):
+    """
+    고유값 α 에 대한 정규화된 ψ (G, K). 오른쪽 금지영역에서 수치적으로 커지는
+    발산 성분은 |ψ| 최솟점 이후를 0 으로 잘라 제거한다.
+    """
+    psi = numerov(alpha, y, W, keep=True)[3]
+    Wy = W(y) if callable(W) else np.asarray(W)
+    for j, a in enumerate(np.atleast_1d(alpha)):
+        allowed = np.flatnonzero(Wy <= a)
+        start = allowed[-1] if allowed.size else 0
+        cut = start + int(np.argmin(np.abs(psi[start:, j])))
+        psi[cut:, j] = 0.0
+    dy = y[1] - y[0]
+    psi /= np.sqrt((psi**2).sum(axis=0) * dy)
+    # Hermite 함수와 같은 부호 규약: 오른쪽 끝 꼬리가 양수
+    last = len(y) - 1 - np.argmax(np.abs(psi[::-1]) > 1e-3, axis=0)
+    return psi * np.sign(psi[last, np.arange(psi.shape[1])])
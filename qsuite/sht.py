@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+구면 조화 변환 (Spherical Harmonic Transform) — Gauss–Legendre 격자
+────────────────────────────────────────────
+• 격자: θ 방향 L+1 개 Gauss–Legendre 노드 (cos θ_j), φ 방향 2L+2 개 등간격
+  → 대역 제한 L 인 함수의 정사영이 (반올림 오차 안에서) 정확
+• 정변환  a_lm = Σ_j w_j P̃_lm(θ_j) · F_m(θ_j),   F_m = FFT_φ[f]  (2π/N_φ 배)
+  역변환  f    = IFFT_φ[ Σ_l a_lm P̃_lm(θ_j) ]
+  → φ 는 FFT, θ 는 m 마다 행렬-벡터 곱: O(L²·N_θ) = O(L³)  (직접 합은 O(L⁴))
+• 적도 대칭 P̃_lm(−x) = (−1)^{l+m} P̃_lm(x) → Legendre 표는 북반구 절반만 저장, 곱셈도 절반
+• 격자·표는 L 별로 qsuite.memo 공유 캐시에 둔다 → 세션 간 잠금·읽기 전용 처리와 함께
+  표 크기(L = 512 에서 약 270 MB)가 QSUITE_CACHE_MB 예산에 포함되어 LRU 로 제거된다
+"""
+
+import numpy as np
+from numpy.polynomial.legendre import leggauss
+from scipy.interpolate import RegularGridInterpolator
+
+from qsuite import memo
+from qsuite.spherical import sectoral_log
+
+_RESCALE = 1e100
+
+
+# ─────────────────────────────────────────────
+# 격자와 Legendre 표
+# ─────────────────────────────────────────────
+@memo.shared(max_entries=16)
+def grid(L):
+    """(θ (L+1,), φ (2L+2,), 가중치 w (L+1,)) — θ 는 북극→남극 순."""
+    x, w = leggauss(L + 1)
+    x, w = x[::-1], w[::-1]
+    n_phi = 2 * L + 2
+    return np.arccos(x), 2 * np.pi * np.arange(n_phi) / n_phi, w
+
+
+def _offsets(L):
+    """m-major 압축 저장에서 m 열의 시작 위치: 열 m 은 l = m … L (L−m+1 행)."""
+    return np.concatenate(([0], np.cumsum(L + 1 - np.arange(L + 1))))
+
+
+@memo.shared(max_entries=4)
+def legendre_table(L):
+    """
+    북반구 θ_j (j < ⌈(L+1)/2⌉) 에서 P̃_lm 전체를 m-major 로 압축한 ((L+1)(L+2)/2, n_half) 배열과 열 시작 위치.
+    l 방향 점화식을 모든 m 에 대해 동시에 (행 단위로) 전개하고, 가수/로그 지수를 분리해 언더플로를 막는다.
+    공유 캐시라 반환 배열은 읽기 전용이다.
+    """
+    theta = grid(L)[0]
+    n_half = (L + 2) // 2
+    th = theta[:n_half]
+    x = np.cos(th)[None, :]
+    off = _offsets(L)
+    table = np.empty((off[-1], n_half))
+    m_all = np.arange(L + 1)
+    mant_prev = np.zeros((L + 1, n_half))
+    mant = np.zeros((L + 1, n_half))
+    log = np.zeros((L + 1, n_half))
+    with np.errstate(under="ignore", divide="ignore", invalid="ignore"):
+        for l in range(L + 1):
+            m = m_all[: l - 1] if l >= 2 else m_all[:0]
+            new = np.empty((l + 1, n_half))
+            if m.size:
+                a = np.sqrt((4.0 * l * l - 1) / (l * l - m * m))[:, None]
+                a_prev = np.sqrt((4.0 * (l - 1) ** 2 - 1) / ((l - 1) ** 2 - m * m))[:, None]
+                new[: l - 1] = a * (x * mant[: l - 1] - mant_prev[: l - 1] / a_prev)
+            if l >= 1:
+                new[l - 1] = np.sqrt(2.0 * l + 1) * x[0] * mant[l - 1]
+            s_log, s_sign = sectoral_log(l, th)
+            new[l] = s_sign
+            log[l] = s_log
+            mant_prev[: l + 1], mant[: l + 1] = mant[: l + 1], new
+            big = np.abs(mant[: l + 1]) > _RESCALE
+            if big.any():
+                mant_prev[: l + 1] = np.where(big, mant_prev[: l + 1] / _RESCALE, mant_prev[: l + 1])
+                mant[: l + 1] = np.where(big, mant[: l + 1] / _RESCALE, mant[: l + 1])
+                log[: l + 1] += big * np.log(_RESCALE)
+            table[off[: l + 1] + l - m_all[: l + 1]] = np.nan_to_num(mant[: l + 1] * np.exp(log[: l + 1]))
+    return table, off
+
+
+def clear_cache():
+    grid.clear()
+    legendre_table.clear()
+
+
+# ─────────────────────────────────────────────
+# 계수 배열: a[l, L + m]  (m = −L … L, |m| > l 은 0)
+# ─────────────────────────────────────────────
+def _split(F, n_half, n_theta):
+    """북/남 반구 값을 대칭(+)·반대칭(−) 성분으로. 적도 노드(L 짝수)는 한 번만 센다."""
+    north = F[:n_half]
+    south = F[::-1][:n_half]
+    plus, minus = north + south, north - south
+    if n_theta % 2:
+        plus[-1] = north[-1]
+        minus[-1] = north[-1]
+    return plus, minus
+
+
+def forward(f, L):
+    """
+    f (L+1, 2L+2) — grid(L) 에서 샘플한 실수/복소 함수 → 계수 a (L+1, 2L+1) complex.
+    """
+    theta, phi, w = grid(L)
+    f = np.asarray(f)
+    n_theta, n_phi = f.shape
+    table, off = legendre_table(L)
+    n_half = table.shape[1]
+    F = np.fft.fft(f, axis=1) * (2 * np.pi / n_phi)          # F[j, m] (m 음수는 뒤쪽)
+    Fw = F * w[:, None]
+    plus, minus = _split(Fw, n_half, n_theta)
+    a = np.zeros((L + 1, 2 * L + 1), dtype=complex)
+    for m in range(L + 1):
+        P = table[off[m]: off[m + 1]]                        # (L−m+1, n_half), 행 = l − m
+        cols = [m] if m == 0 else [m, n_phi - m]
+        # l − m 짝수 → 적도 대칭 (+),  홀수 → 반대칭 (−)
+        res = np.empty((P.shape[0], len(cols)), dtype=complex)
+        res[0::2] = P[0::2] @ plus[:, cols]
+        res[1::2] = P[1::2] @ minus[:, cols]
+        a[m:, L + m] = res[:, 0]
+        if m:
+            a[m:, L - m] = (-1) ** m * res[:, 1]
+    return a
+
+
+def inverse(a, L=None, real=False):
+    """계수 a (L+1, 2L+1) → grid(L) 위의 f (L+1, 2L+2). real=True 이면 실수부만."""
+    a = np.asarray(a)
+    L = a.shape[0] - 1 if L is None else L
+    La = a.shape[0] - 1
+    theta, phi, w = grid(L)
+    n_theta, n_phi = theta.size, phi.size
+    table, off = legendre_table(L)
+    n_half = table.shape[1]
+    G = np.zeros((n_theta, n_phi), dtype=complex)
+    for m in range(min(L, La) + 1):
+        P = table[off[m]: off[m] + min(L, La) - m + 1]
+        coeff = a[m: min(L, La) + 1, La + m] if m == 0 else np.stack(
+            (a[m: min(L, La) + 1, La + m], (-1) ** m * a[m: min(L, La) + 1, La - m]), axis=1)
+        coeff = coeff.reshape(P.shape[0], -1)
+        even = P[0::2].T @ coeff[0::2]                       # 적도 대칭 성분
+        odd = P[1::2].T @ coeff[1::2]
+        north, south = even + odd, even - odd
+        cols = [m] if m == 0 else [m, n_phi - m]
+        G[:n_half, cols] = north
+        G[n_theta - n_half:, cols] = south[::-1]
+    f = np.fft.ifft(G, axis=1) * n_phi
+    return f.real if real else f
+
+
+def from_equiangular(data, L):
+    """
+    위도-경도 등간격 배열 data (n_lat, n_lon) — 행: 북→남 (셀 중심), 열: 경도 0 → 360° —
+    를 grid(L) 로 쌍선형 보간. 경도 방향은 주기 경계.
+    """
+    data = np.asarray(data, dtype=float)
+    n_lat, n_lon = data.shape
+    lat_theta = (np.arange(n_lat) + 0.5) * np.pi / n_lat
+    lon_phi = np.arange(n_lon + 1) * 2 * np.pi / n_lon
+    padded = np.concatenate((data, data[:, :1]), axis=1)
+    interp = RegularGridInterpolator((lat_theta, lon_phi), padded, bounds_error=False, fill_value=None)
+    theta, phi, _ = grid(L)
+    T, P = np.meshgrid(theta, phi, indexing="ij")
+    return interp(np.stack((T, P), axis=-1))
+
+
+# ─────────────────────────────────────────────
+# 스펙트럼 도구
+# ─────────────────────────────────────────────
+def truncate(a, L_keep):
+    """l > L_keep 인 계수를 0 으로 (배열 모양 유지)."""
+    out = a.copy()
+    out[L_keep + 1:] = 0
+    return out
+
+
+def power_spectrum(a):
+    """C_l = Σ_m |a_lm|² / (2l+1)."""
+    l = np.arange(a.shape[0])
+    return (np.abs(a) ** 2).sum(axis=1) / (2 * l + 1)
+
+
+def random_coefficients(L, slope=-2.0, seed=0, real=True):
+    """C_l ∝ (l+1)^slope 인 무작위 계수 (real=True 이면 a_{l,−m} = (−1)^m a*_lm)."""
+    rng = np.random.default_rng(seed)
+    a = (rng.standard_normal((L + 1, 2 * L + 1)) + 1j * rng.standard_normal((L + 1, 2 * L + 1))) / np.sqrt(2)
+    l = np.arange(L + 1)[:, None]
+    m = np.arange(-L, L + 1)[None, :]
+    a *= np.sqrt((l + 1.0) ** slope) * (np.abs(m) <= l)
+    if real:
+        a[:, L] = a[:, L].real * np.sqrt(2)
+        a[:, :L] = ((-1.0) ** np.arange(L, 0, -1))[None, :] * np.conj(a[:, :L:-1])
+    return a
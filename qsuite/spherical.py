@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+구면조화함수 Y_lm(θ, φ) — 정규화 연관 Legendre 점화식
+────────────────────────────────────────────
+• Y_lm = P̃_lm(cos θ) e^{imφ},  ∮ |Y_lm|² dΩ = 1,  Condon–Shortley 위상 (−1)^m 포함
+• 섹터항 P̃_mm = (−1)^m √(1/4π) Π_{k≤m} √((2k+1)/2k) · sin^m θ 는 로그로 바로 계산
+• 같은 m 에서 l 방향 3항 점화식
+    P̃_{m+1,m} = √(2m+3) cos θ P̃_mm
+    P̃_lm = a_lm (cos θ P̃_{l−1,m} − P̃_{l−2,m} / a_{l−1,m}),  a_lm = √((4l²−1)/(l²−m²))
+  극 근처에서 sin^m θ 가 언더플로하지 않도록 (가수, 로그 지수) 로 나눠 전개 → l = 1000 이상도 안정
+• θ 격자별로 섹터항과 m 열(column)을 캐시 → 같은 메쉬에서 l, m 을 바꿔도 재계산 최소
+  (Streamlit 세션 스레드가 함께 쓰므로 잠금으로 보호하고, 캐시된 열은 읽기 전용 배열로 돌려준다)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+_RESCALE = 1e100
+_CACHE_SIZE = 64
+_column_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _theta_key(theta):
+    return theta.size, hash(theta.tobytes())
+
+
+def _a(l, m):
+    return np.sqrt((4.0 * l * l - 1.0) / (l * l - m * m))
+
+
+def sectoral_log(m, theta):
+    """(ln|P̃_mm(cos θ)|, 부호) — 극(θ = 0, π)에서는 m > 0 이면 −inf."""
+    k = np.arange(1, m + 1)
+    c = -0.5 * np.log(4 * np.pi) + 0.5 * np.sum(np.log((2 * k + 1) / (2.0 * k)))
+    with np.errstate(divide="ignore"):
+        log_sin = np.log(np.abs(np.sin(theta)))
+    return (c + m * log_sin if m else np.full_like(log_sin, c)), (-1.0) ** m
+
+
+def legendre_column(m, l_max, theta):
+    """
+    P̃_lm(cos θ), l = m … l_max  → (l_max − m + 1, len(θ)).
+    최근 사용한 (θ 격자, m) 열은 메모리에 남겨 두고, 더 긴 l_max 요청 시에만 다시 계산한다.
+    반환 배열은 캐시와 공유하는 읽기 전용 — 수정하려면 복사할 것.
+    """
+    theta = np.ascontiguousarray(theta, dtype=float)
+    key = (_theta_key(theta), m)
+    with _lock:
+        hit = _column_cache.get(key)
+        if hit is not None and hit.shape[0] >= l_max - m + 1:
+            _column_cache.move_to_end(key)
+            return hit[: l_max - m + 1]
+    x = np.cos(theta)
+    log, sign = sectoral_log(m, theta)
+    out = np.empty((l_max - m + 1, theta.size))
+    prev = np.zeros_like(x)
+    cur = np.full_like(x, sign)
+    with np.errstate(under="ignore", over="ignore", invalid="ignore"):
+        out[0] = cur * np.exp(log)
+        for i, l in enumerate(range(m + 1, l_max + 1), start=1):
+            if l == m + 1:
+                nxt = np.sqrt(2.0 * m + 3.0) * x * cur
+            else:
+                nxt = _a(l, m) * (x * cur - prev / _a(l - 1, m))
+            prev, cur = cur, nxt
+            big = np.abs(cur) > _RESCALE
+            if big.any():
+                prev = np.where(big, prev / _RESCALE, prev)
+                cur = np.where(big, cur / _RESCALE, cur)
+                log = log + np.where(big, np.log(_RESCALE), 0.0)
+            out[i] = np.nan_to_num(cur * np.exp(log))
+    out.flags.writeable = False
+    with _lock:                                       # 계산은 잠금 밖 — 다른 세션을 막지 않는다
+        _column_cache[key] = out
+        _column_cache.move_to_end(key)
+        while len(_column_cache) > _CACHE_SIZE:
+            _column_cache.popitem(last=False)
+    return out
+
+
+def legendre(l, m, theta):
+    """단일 P̃_lm(cos θ) (m 은 음수 가능: P̃_{l,−m} = (−1)^m P̃_lm)."""
+    am = abs(m)
+    if am > l:
+        return np.zeros_like(np.asarray(theta, dtype=float))
+    p = legendre_column(am, l, theta)[l - am]
+    return p * (-1.0) ** am if m < 0 else p
+
+
+def sph_harm(l, m, theta, phi, real=False):
+    """
+    Y_lm(θ, φ) — θ 극각, φ 방위각. theta, phi 는 서로 브로드캐스트 가능한 배열.
+    real=True 이면 실수 구면조화함수 (m > 0: √2 (−1)^m Re Y, m < 0: √2 (−1)^m Im Y_{l|m|}).
+    메쉬에서는 θ 의 고유값만으로 P̃ 를 계산해 다시 펼친다.
+    """
+    theta = np.asarray(theta, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    t_unique, inverse = np.unique(theta, return_inverse=True)
+    P = legendre(l, abs(m), t_unique)[inverse].reshape(theta.shape)
+    if real:
+        if m == 0:
+            return P * np.ones_like(phi)
+        trig = np.cos(abs(m) * phi) if m > 0 else np.sin(abs(m) * phi)
+        return np.sqrt(2.0) * (-1.0) ** abs(m) * P * trig
+    Y = P * np.exp(1j * abs(m) * phi)
+    return (-1.0) ** abs(m) * np.conj(Y) if m < 0 else Y
+
+
+def sphere_mesh(n_theta, n_phi=None):
+    """등간격 (θ, φ) 메쉬 — θ ∈ [0, π], φ ∈ [0, 2π] (끝점 포함, 곡면 그리기용)."""
+    n_phi = 2 * n_theta if n_phi is None else n_phi
+    theta = np.linspace(0.0, np.pi, n_theta)
+    phi = np.linspace(0.0, 2 * np.pi, n_phi)
+    return np.meshgrid(theta, phi, indexing="ij")
+
+
+def mesh_size(l, min_theta=48, max_theta=240, points_per_node=6):
+    """노드 간격 π/l 마다 points_per_node 개 — 단, Plotly 가 부드럽게 돌 수 있는 max_theta 에서 자른다."""
+    return int(np.clip(points_per_node * (l + 1), min_theta, max_theta))
+
+
+def clear_cache():
+    with _lock:
+        _column_cache.clear()
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+Nose–Hoover 온도 안정화 — 페이지 101 의 감쇠 진동 모형
+────────────────────────────────────────────
+• T(t) = T_target + A e^{−t/Tdamp} cos(6πt / Tdamp)
+  (실제 MD 궤적이 아니라 Tdamp 가 완화 시간과 진동 주기를 함께 정한다는 것을 보여주는 모형)
+"""
+
+import numpy as np
+
+T_TARGET = 300.0
+AMPLITUDE = 40.0
+
+
+def temp_profile(t, Tdamp, T_target=T_TARGET, amplitude=AMPLITUDE):
+    t = np.asarray(t, dtype=float)
+    return T_target + amplitude * np.exp(-t / Tdamp) * np.cos(6 * np.pi * t / Tdamp)
+
+
+def settling_time(Tdamp, tol=1.0, amplitude=AMPLITUDE):
+    """포락선 A e^{−t/Tdamp} 가 tol (K) 아래로 내려가는 시간."""
+    return Tdamp * np.log(amplitude / tol)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+서버 시작 시 공유 캐시 예열
+────────────────────────────────────────────
+• 배포 직후 첫 접속자가 sympy 전개·격자 계산 비용을 치르지 않도록, 흔히 고르는 매개변수 조합을
+  qsuite.precompute 의 캐시 함수로 미리 계산해 memo 저장소에 넣는다 (페이지와 같은 캐시 키)
+    03: sympy ψₙ 표, 정규직교성 검증 선택지 전부, 불확정성 표
+    04: nₓ, nᵧ 슬라이더 모든 위치 (5 × 5), 중첩 애니메이션 기본값
+    05: γ × n₁ × n₂ 슬라이더 모든 위치 (20 × 5 × 5)
+    06: 슬라이더 기본값과 큰 n 버튼 (10³, 10⁴, 10⁵) 의 확률밀도·기댓값
+  페이지 기본값을 먼저, 가장 무거운 n = 10⁵ 는 마지막에
+• Streamlit 에는 서버 시작 훅이 없으므로 페이지 스크립트가 start() 를 부른다 — 프로세스당 처음 한 번만
+  데몬 스레드 WORKERS 개를 띄우고 바로 돌아온다 (요청 처리를 막지 않음)
+• 작업 스레드는 nice 값을 올려 (Linux) 요청 스레드에 CPU 를 양보하고, 캐시가 예산의 BUDGET_FRACTION 을
+  넘으면 남은 작업은 건너뛴다 — 예열이 사용자 결과를 LRU 로 밀어내지 않도록
+• progress() : total / done / failed / skipped / running / 경과 시간 — 관리자 패널, Prometheus 내보내기
+• QSUITE_WARMUP=0 이면 끔, QSUITE_WARMUP_WORKERS 로 스레드 수 (기본 2)
+• 명령행: python -m qsuite.warmup [--pages 04 05]  — 같은 계획을 전경에서 실행하고 항목별 시간 출력
+"""
+
+import argparse
+import os
+import queue
+import threading
+import time
+
+from qsuite import memo, metrics, oscillator2d, precompute
+
+PAGES = ("03", "04", "05", "06")
+WORKERS = int(os.environ.get("QSUITE_WARMUP_WORKERS", 2))
+BUDGET_FRACTION = 0.5
+NICE = 10
+
+_lock = threading.Lock()
+_started = False
+_state = dict(total=0, done=0, failed=0, skipped=0, running=[], errors=[], t0=None, t1=None)
+
+
+# ─────────────────────────────────────────────
+# 계획
+# ─────────────────────────────────────────────
+def plan(pages=PAGES):
+    """[(페이지, 캐시 함수, 인자)] — 실행 순서대로."""
+    n_range = range(precompute.QUANTUM_MAX_2D + 1)
+    first, rest = [], []
+    if "03" in pages:
+        first += [("03", precompute.normalized_psi_table, (precompute.PSI_TABLE_COUNT,)),
+                  ("03", precompute.orthonormality_check, (100,)),
+                  ("03", precompute.uncertainty_table, (precompute.UNCERTAINTY_N_MAX,))]
+        rest += [("03", precompute.orthonormality_check, (n,)) for n in precompute.GRAM_OPTIONS if n != 100]
+    if "04" in pages:
+        first += [("04", precompute.density_grid, (nx, ny)) for nx in n_range for ny in n_range]
+        first += [("04", precompute.superposition_frames, (precompute.SUPERPOSITION_DEFAULT,))]
+    if "05" in pages:
+        for gamma in sorted(precompute.GAMMAS, key=lambda g: abs(g - 1.0)):      # 기본 γ = 1.0 부터
+            w1, w2 = oscillator2d.effective_frequencies(gamma)
+            (first if gamma == 1.0 else rest).extend(
+                ("05", precompute.density_grid, (n1, n2, float(w1), float(w2), 3.0, 180))
+                for n1 in n_range for n2 in n_range)
+    if "06" in pages:
+        for n in (10,) + precompute.LARGE_N:
+            target = first if n == 10 else rest
+            target += [("06", precompute.compute_probabilities, (n, 1.0, 1.0, 1.0)),
+                       ("06", precompute.compute_averages, (n, 1.0, 1.0, 1.0))]
+    return first + rest
+
+
+def _name(task):
+    page, fn, args = task
+    return f"{page}:{fn.__name__}{args}"
+
+
+# ─────────────────────────────────────────────
+# 백그라운드 실행
+# ─────────────────────────────────────────────
+def _lower_priority():
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), NICE)   # Linux: 스레드별 nice
+    except (AttributeError, OSError):
+        pass
+
+
+def _run(task):
+    """작업 하나 — 상태를 갱신하고 결과는 버린다 (캐시에 남는다)."""
+    name = _name(task)
+    status = "skipped"
+    if memo.stats()["_total"]["bytes"] <= BUDGET_FRACTION * memo.BUDGET_BYTES:
+        with _lock:
+            _state["running"].append(name)
+        try:
+            task[1](*task[2])
+            status = "done"
+        except Exception as exc:                        # 예열 실패는 기록만 — 페이지가 나중에 다시 계산
+            status = "failed"
+            with _lock:
+                _state["errors"].append(f"{name}: {exc!r}")
+        with _lock:
+            _state["running"].remove(name)
+    with _lock:
+        _state[status] += 1
+        if _state["done"] + _state["failed"] + _state["skipped"] == _state["total"]:
+            _state["t1"] = time.monotonic()
+    return status
+
+
+def _worker(tasks):
+    _lower_priority()
+    metrics.set_page("warmup")                          # 계산 시간을 "warmup" 페이지로 기록
+    while True:
+        try:
+            task = tasks.get_nowait()
+        except queue.Empty:
+            return
+        _run(task)
+
+
+def start(pages=PAGES, workers=WORKERS):
+    """예열 시작 (프로세스당 한 번, 즉시 반환). 새로 시작했으면 True."""
+    global _started
+    if os.environ.get("QSUITE_WARMUP", "1") == "0" or workers < 1:
+        return False
+    with _lock:
+        if _started:
+            return False
+        _started = True
+        tasks = plan(pages)
+        _state.update(total=len(tasks), t0=time.monotonic())
+    q = queue.SimpleQueue()
+    for task in tasks:
+        q.put(task)
+    for i in range(min(workers, len(tasks))):
+        threading.Thread(target=_worker, args=(q,), name=f"qsuite-warmup-{i}", daemon=True).start()
+    return True
+
+
+def progress():
+    """{total, done, failed, skipped, running, errors, elapsed, finished}."""
+    with _lock:
+        out = dict(_state, running=list(_state["running"]), errors=list(_state["errors"]))
+    t0, t1 = out.pop("t0"), out.pop("t1")
+    out["finished"] = t1 is not None
+    out["elapsed"] = 0.0 if t0 is None else (t1 or time.monotonic()) - t0
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공유 캐시 예열 계획을 전경에서 실행 (항목별 시간)")
+    parser.add_argument("--pages", nargs="+", default=list(PAGES), choices=PAGES)
+    args = parser.parse_args()
+
+    tasks = plan(args.pages)
+    _state.update(total=len(tasks), t0=time.monotonic())
+    for i, task in enumerate(tasks, 1):
+        t0 = time.perf_counter()
+        status = _run(task)
+        print(f"[{i:>3}/{len(tasks)}] {status:<7} {time.perf_counter() - t0:7.3f} s  {_name(task)}")
+    p = progress()
+    total = memo.stats()["_total"]
+    print(f"{p['done']} done, {p['failed']} failed, {p['skipped']} skipped in {p['elapsed']:.1f} s — "
+          f"cache {total['bytes'] / 2**20:.0f} MB / {total['budget'] / 2**20:.0f} MB")
+    for line in p["errors"]:
+        print("  " + line)
+    raise SystemExit(1 if p["failed"] else 0)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+조화진동자 파속(wavepacket) 시간 전개 — 고유기저 위상 회전
+────────────────────────────────────────────
+• 초기 파속을 고유상태 ψₙ 로 한 번만 전개: Ψ(x,0) = Σ cₙ ψₙ(x)
+• 이후 모든 프레임은 위상 회전만으로 생성: Ψ(x,t) = Σ cₙ e^{-i(n+½)ωt} ψₙ(x)
+• 계수는 허용오차 tol 이하의 꼬리를 잘라 유효 n 범위만 사용
+• 프레임은 float32 배열로 저장해 클라이언트(Plotly 애니메이션) 재생용으로 전달
+  (2D 처럼 프레임이 큰 경우 quantize_frames 로 uint8 / float16 양자화)
+"""
+
+import numpy as np
+from scipy.special import gammaln
+
+from qsuite.hermite import hermite_functions
+
+_trapz = getattr(np, "trapezoid", None) or np.trapz
+
+
+def coherent_coefficients(alpha, tol=1e-10):
+    """
+    결맞음 상태 |α⟩ 의 계수 cₙ = e^{-|α|²/2} αⁿ/√(n!)  (푸아송 분포 |cₙ|²).
+    버린 확률 Σ|cₙ|² 가 tol 이하가 되도록 [n_lo, n_hi] 구간만 반환한다.
+    반환: (n 배열, 복소 계수 배열)
+    """
+    alpha = complex(alpha)
+    a2 = abs(alpha) ** 2
+    n_hi = int(a2 + 10 * np.sqrt(a2) + 20)
+    n = np.arange(n_hi + 1)
+    with np.errstate(divide="ignore"):
+        log_abs = -0.5 * a2 + n * np.log(abs(alpha)) - 0.5 * gammaln(n + 1)
+    if alpha == 0:
+        log_abs = np.where(n == 0, 0.0, -np.inf)
+    c = np.exp(log_abs) * np.exp(1j * np.angle(alpha) * n)
+    return truncate(n, c, tol)
+
+
+def truncate(n, c, tol):
+    """|cₙ|² 가 작은 쪽부터 누적해 tol 을 넘지 않는 만큼 버린다 (양 끝만 자름)."""
+    p = np.abs(c) ** 2
+    keep = np.flatnonzero(p > 0)
+    lo, hi = keep[0], keep[-1]
+    dropped = 0.0
+    while lo < hi and dropped + min(p[lo], p[hi]) <= tol:
+        if p[lo] <= p[hi]:
+            dropped += p[lo]
+            lo += 1
+        else:
+            dropped += p[hi]
+            hi -= 1
+    return n[lo:hi + 1], c[lo:hi + 1]
+
+
+def expand(psi0, x, n_max, tol=1e-10):
+    """
+    격자 위에 주어진 임의의 초기 파속 ψ(x,0) 을 ψ₀…ψ_{n_max} 로 사영 (사다리꼴 적분).
+    x 격자는 파속과 ψ_{n_max} 가 충분히 0 이 되는 구간을 덮어야 한다.
+    """
+    basis = hermite_functions(n_max, x)
+    c = _trapz(basis * np.asarray(psi0)[None, :], x, axis=1)
+    return truncate(np.arange(n_max + 1), c, tol)
+
+
+def gaussian_n_max(x_c, width=1.0, p0=0.0, tol=1e-10):
+    """
+    가우시안 파속 전개에 필요한 최대 n — 에너지 분포의 평균 + 12σ 에 압축(squeezing) 꼬리를 더한다.
+    폭 w ≠ 1 (r = ln w) 이면 |cₙ|² 가 tanh²|r| 비율의 기하급수로 느리게 줄어 σ 만으로는 부족하다.
+    """
+    r = np.log(width)
+    n_bar = (x_c**2 + p0**2) / 2 + np.sinh(r) ** 2
+    sigma = np.sqrt((x_c * width) ** 2 / 2 + (p0 / width) ** 2 / 2 + np.sinh(2 * r) ** 2 / 2)
+    tail = np.log(1 / tol) / -np.log(np.tanh(abs(r))) if abs(r) > 1e-3 else 0.0
+    return int(n_bar + 12 * sigma + tail + 20)
+
+
+def expand_gaussian(x_c, width=1.0, p0=0.0, tol=1e-10):
+    """
+    gaussian_packet 의 고유기저 전개 — n_max 는 gaussian_n_max, 적분 격자는 ψ_{n_max} 의 전환점과
+    파속을 모두 덮고 가장 짧은 반파장에 8점 이상이 들어가도록 정한다 (표시용 격자와 별개).
+    """
+    n_max = gaussian_n_max(x_c, width, p0, tol)
+    k_max = np.sqrt(2 * n_max + 1)
+    half = max(k_max + 6, abs(x_c) + 8 * max(width, 1.0))
+    x = np.linspace(-half, half, int(2 * half / (np.pi / (8 * max(k_max, abs(p0) + 1)))) + 1)
+    return expand(gaussian_packet(x, x_c, width, p0), x, n_max, tol)
+
+
+def gaussian_packet(x, x_c, width=1.0, p0=0.0):
+    """중심 x_c, 폭 width(=1 이면 바닥상태 폭), 운동량 p0 인 정규화 가우시안 파속."""
+    x = np.asarray(x, dtype=float)
+    norm = (np.pi * width**2) ** -0.25
+    return norm * np.exp(-((x - x_c) ** 2) / (2 * width**2) + 1j * p0 * x)
+
+
+def evolve_frames(n, c, x, times, omega=1.0, dtype=np.float32):
+    """
+    |Ψ(x,t)|² 프레임 (len(times), len(x)) — 기저 ψₙ(x) 는 한 번만 계산하고
+    각 프레임은 계수의 위상 회전 + 행렬곱 하나로 얻는다.
+    """
+    basis = hermite_functions(int(n[-1]), x)[n]              # (K, G) — 유효 n 만
+    phases = np.exp(-1j * omega * np.outer(times, n + 0.5))  # (T, K)
+    psi_t = (phases * c[None, :]) @ basis                    # (T, G)
+    return (np.abs(psi_t) ** 2).astype(dtype)
+
+
+def expectation_x(n, c, times, omega=1.0):
+    """
+    ⟨x⟩(t) — 사다리 연산자 관계 ⟨n−1|x|n⟩ = √(n/2) 로 격자 없이 계산.
+    결맞음 상태에서는 고전 궤적 √2·Re(α e^{-iωt}) 와 일치한다.
+    """
+    n = np.asarray(n)
+    a = c[1:] * np.conj(c[:-1]) * np.sqrt(n[1:] / 2.0) * (np.diff(n) == 1)
+    return 2 * np.real(np.exp(-1j * omega * np.asarray(times))[:, None] * a[None, :]).sum(axis=1)
+
+
+FRAME_DTYPES = ("uint8", "float16")
+
+
+def quantize_frames(frames, dtype="uint8"):
+    """
+    프레임 배열을 (양자화 배열, scale) 로 — 원래 값 ≈ 배열 × scale.
+    uint8: 전체 프레임 공통 최댓값을 255 로 (상대오차 ≤ 1/510, Plotly 가 1 바이트/픽셀로 전송)
+    float16: 유효숫자 3 자리 (scale = 1, 브라우저에는 float16 배열이 없어 float32 로 바꿔 보내야 함)
+    """
+    frames = np.asarray(frames)
+    if dtype == "uint8":
+        vmax = float(frames.max()) or 1.0
+        return np.rint(frames * (255.0 / vmax)).astype(np.uint8), vmax / 255.0
+    if dtype == "float16":
+        return frames.astype(np.float16), 1.0
+    raise ValueError(f"unknown frame dtype: {dtype!r}")